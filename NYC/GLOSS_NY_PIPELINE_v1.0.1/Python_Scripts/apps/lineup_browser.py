@@ -1,4 +1,4 @@
-import os, re, nuke
+import os, re, json, time, threading, collections, nuke
 # PySide6 / PySide2 compatibility
 try:
     from PySide6 import QtWidgets, QtCore, QtGui
@@ -11,14 +11,424 @@ try:
 except Exception:
     GLOSS_ROOT = "/Volumes/san-01/GlossPost"
 
+from gloss_utils.fuzzy import SearchIndex
+
 LINEUP_PATTERN = re.compile(r"Line_up_v(\d+)\.nk$", re.IGNORECASE)
 _lineup_browser_instance = None  # singleton
 
+# root -> (root mtime, sorted project names); survives closing/reopening the browser
+_PROJECT_CACHE = {}
+LOAD_BATCH_SIZE = 100
+FILTER_DEBOUNCE_MS = 80
+
+# Per-project metadata (PROGRESS folder, latest lineup, mtime), cached on disk between sessions
+META_CACHE_FILE = os.path.expanduser("~/.nuke/gloss_cache/lineup_meta.json")
+_META_CACHE = None  # {root: {project_name: meta}}
+
+COLUMNS = ("Project", "Lineup", "Modified")
+COL_NAME, COL_LINEUP, COL_MODIFIED = range(len(COLUMNS))
+NAME_ROLE = QtCore.Qt.UserRole + 1
+
+
+# ===============================
+# Project metadata
+# ===============================
+def _meta_cache():
+    global _META_CACHE
+    if _META_CACHE is None:
+        try:
+            with open(META_CACHE_FILE) as fh:
+                _META_CACHE = json.load(fh)
+        except Exception:
+            _META_CACHE = {}
+    return _META_CACHE
+
+def save_meta_cache():
+    if _META_CACHE is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(META_CACHE_FILE), exist_ok=True)
+        tmp = META_CACHE_FILE + ".tmp"
+        with open(tmp, "w") as fh:
+            json.dump(_META_CACHE, fh)
+        os.replace(tmp, META_CACHE_FILE)
+    except Exception:
+        pass
+
+def _empty_meta():
+    return {"progress": None, "nuke_dir": None, "nuke_mtime": None,
+            "lineup": None, "version": None, "mtime": None}
+
+def _nuke_dir_unchanged(meta):
+    """True when the NUKE folder's mtime still matches the one recorded in `meta`."""
+    try:
+        return os.stat(meta["nuke_dir"]).st_mtime == meta.get("nuke_mtime")
+    except (OSError, KeyError, TypeError):
+        return False
+
+def catalog_project_meta(project_path):
+    """
+    Latest lineup of one project from the shot catalog (gloss_utils/catalog.py), or None.
+    Trusted only while the NUKE folder's mtime matches the crawled one (one stat, no listings).
+    """
+    try:
+        from gloss_utils.catalog import get_catalog
+        from gloss_utils.paths_nyc import job_code_from_project_folder
+        code = job_code_from_project_folder(os.path.basename(project_path))
+        cat = get_catalog() if code else None
+        if cat is None:
+            return None
+        project_path = os.path.normpath(project_path)
+        for row in cat.scripts(code, task="LINEUP"):
+            nuke_dir = os.path.dirname(row["path"])
+            progress = os.path.dirname(nuke_dir)
+            if os.path.basename(nuke_dir) == "NUKE" and os.path.dirname(progress) == project_path:
+                break
+        else:
+            return None
+        meta = {"progress": progress, "nuke_dir": nuke_dir, "nuke_mtime": cat.dir_mtime(nuke_dir),
+                "lineup": row["path"], "version": row["version"], "mtime": row["mtime"]}
+    except Exception:
+        return None
+    return meta if _nuke_dir_unchanged(meta) else None
+
+def scan_project_meta(project_path, cached=None):
+    """
+    PROGRESS folder, latest Line_up_vNN.nk and its mtime for one project.
+    The shot catalog is asked first; then, if `cached` is given and the NUKE folder
+    mtime is unchanged, only the lineup file is re-stat'ed (no directory listings).
+    The SAN is walked only when neither is current.
+    """
+    meta = catalog_project_meta(project_path)
+    if meta:
+        return meta
+    if cached and cached.get("nuke_dir") and cached.get("nuke_mtime") is not None:
+        if _nuke_dir_unchanged(cached):
+            meta = dict(cached)
+            try:
+                if meta.get("lineup"):
+                    meta["mtime"] = os.stat(meta["lineup"]).st_mtime
+                return meta
+            except OSError:
+                pass  # lineup vanished: rescan
+
+    meta = _empty_meta()
+    try:
+        with os.scandir(project_path) as it:
+            for entry in it:
+                if entry.name.startswith("PROGRESS-") and entry.is_dir():
+                    meta["progress"] = entry.path
+                    break
+    except OSError:
+        return meta
+    if not meta["progress"]:
+        return meta
+
+    nuke_dir = os.path.join(meta["progress"], "NUKE")
+    meta["nuke_dir"] = nuke_dir
+    best = None
+    try:
+        meta["nuke_mtime"] = os.stat(nuke_dir).st_mtime
+        with os.scandir(nuke_dir) as it:
+            for entry in it:
+                m = LINEUP_PATTERN.match(entry.name)
+                if m and (best is None or int(m.group(1)) > best[0]):
+                    best = (int(m.group(1)), entry)
+    except OSError:
+        return meta
+    if best:
+        meta["version"] = best[0]
+        meta["lineup"] = best[1].path
+        try:
+            meta["mtime"] = best[1].stat().st_mtime
+        except OSError:
+            pass
+    else:
+        meta["mtime"] = meta["nuke_mtime"]
+    return meta
+
+
+# ===============================
+# Background workers
+# ===============================
+class ProjectLoader(QtCore.QThread):
+    """
+    Lists project folders under `root` off the GUI thread.
+    Uses os.scandir so directory checks come from d_type (no per-entry stat on the SAN).
+    If the root mtime still matches `cached_mtime`, nothing is listed.
+    """
+    batch_ready   = QtCore.Signal(int, list)          # generation, names
+    load_finished = QtCore.Signal(int, float, bool)   # generation, root mtime, changed
+    load_failed   = QtCore.Signal(int, str)           # generation, message
+
+    def __init__(self, root, cached_mtime, generation, parent=None):
+        super(ProjectLoader, self).__init__(parent)
+        self.root = root
+        self.cached_mtime = cached_mtime
+        self.generation = generation
+
+    def run(self):
+        try:
+            mtime = os.stat(self.root).st_mtime
+        except OSError:
+            self.load_failed.emit(self.generation, f"Directory not found: {self.root}")
+            return
+        if self.cached_mtime is not None and mtime == self.cached_mtime:
+            self.load_finished.emit(self.generation, mtime, False)
+            return
+
+        batch = []
+        try:
+            with os.scandir(self.root) as it:
+                for entry in it:
+                    if self.isInterruptionRequested():
+                        return
+                    try:
+                        if entry.name.startswith(".") or not entry.is_dir():
+                            continue
+                    except OSError:
+                        continue
+                    batch.append(entry.name)
+                    if len(batch) >= LOAD_BATCH_SIZE:
+                        self.batch_ready.emit(self.generation, batch)
+                        batch = []
+        except OSError as e:
+            self.load_failed.emit(self.generation, f"Could not list {self.root}:\n{e}")
+            return
+        if batch:
+            self.batch_ready.emit(self.generation, batch)
+        self.load_finished.emit(self.generation, mtime, True)
+
+
+class ProjectMetaLoader(QtCore.QThread):
+    """
+    Fills in project metadata in the background.
+    Visible projects are pushed to the front of the queue; the rest follow so
+    sorting by lineup/modified covers every project eventually.
+    """
+    meta_ready = QtCore.Signal(str, str, object)  # root, project name, meta dict
+
+    def __init__(self, root, cached, parent=None):
+        super(ProjectMetaLoader, self).__init__(parent)
+        self.root = root
+        self._cached = dict(cached)
+        self._queue = collections.deque()
+        self._queued = set()
+        self._done = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def enqueue(self, names, front=False):
+        with self._lock:
+            fresh = [n for n in names if n not in self._done]
+            if front:
+                for n in reversed(fresh):
+                    self._queue.appendleft(n)
+            else:
+                fresh = [n for n in fresh if n not in self._queued]
+                self._queue.extend(fresh)
+            self._queued.update(fresh)
+        self._wake.set()
+
+    def _next(self):
+        with self._lock:
+            while self._queue:
+                name = self._queue.popleft()
+                if name not in self._done:
+                    self._done.add(name)
+                    return name
+        return None
+
+    def run(self):
+        while not self.isInterruptionRequested():
+            name = self._next()
+            if name is None:
+                self._wake.wait(0.25)
+                self._wake.clear()
+                continue
+            meta = scan_project_meta(os.path.join(self.root, name), self._cached.get(name))
+            self.meta_ready.emit(self.root, name, meta)
+
+
+# ===============================
+# Models
+# ===============================
+class ProjectListModel(QtCore.QAbstractTableModel):
+    """
+    Project folders under one root, with their metadata as extra columns.
+    UserRole -> full project path, NAME_ROLE -> project folder name.
+    """
+
+    def __init__(self, root, parent=None):
+        super(ProjectListModel, self).__init__(parent)
+        self.root = root
+        self.names = []
+        self.meta = {}
+        self._row_of = {}
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.names):
+            return None
+        name = self.names[index.row()]
+        if role == QtCore.Qt.UserRole:
+            return os.path.join(self.root, name)
+        if role == NAME_ROLE:
+            return name
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        col = index.column()
+        if col == COL_NAME:
+            return name
+        meta = self.meta.get(name)
+        if meta is None:
+            return "..."
+        if col == COL_LINEUP:
+            return f"v{meta['version']:02d}" if meta.get("version") is not None else "-"
+        if col == COL_MODIFIED:
+            mt = meta.get("mtime")
+            return time.strftime("%Y-%m-%d %H:%M", time.localtime(mt)) if mt else "-"
+        return None
+
+    def sort_key(self, row, column):
+        name = self.names[row]
+        if column == COL_LINEUP:
+            return (self.meta.get(name) or {}).get("version") or -1
+        if column == COL_MODIFIED:
+            return (self.meta.get(name) or {}).get("mtime") or -1
+        return name.lower()
+
+    def set_names(self, root, names, meta=None):
+        self.beginResetModel()
+        self.root = root
+        self.names = list(names)
+        if meta is not None:
+            self.meta = dict(meta)
+        self._row_of = {n: i for i, n in enumerate(self.names)}
+        self.endResetModel()
+
+    def append_names(self, names):
+        if not names:
+            return
+        first = len(self.names)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(names) - 1)
+        self.names.extend(names)
+        for i, n in enumerate(names, first):
+            self._row_of[n] = i
+        self.endInsertRows()
+
+    def set_meta(self, name, meta):
+        self.meta[name] = meta
+        row = self._row_of.get(name)
+        if row is not None:
+            self.dataChanged.emit(self.index(row, COL_LINEUP), self.index(row, COL_MODIFIED))
+
+
+class ProjectFilterModel(QtCore.QAbstractTableModel):
+    """
+    Ranked fuzzy view over a ProjectListModel.
+    Keeps a SearchIndex in step with the source and exposes only the matching
+    source rows, best match first (or by the clicked column); the view never
+    rebuilds any widgets.
+    """
+
+    def __init__(self, source, parent=None):
+        super(ProjectFilterModel, self).__init__(parent)
+        self.source = source
+        self.query = ""
+        self.sort_column = -1  # -1: match rank (alphabetical when unfiltered)
+        self.sort_order = QtCore.Qt.AscendingOrder
+        self._index = SearchIndex(source.names)
+        self._rows = list(range(len(source.names)))
+        self._pos = {}
+        self._resort_timer = QtCore.QTimer(self)
+        self._resort_timer.setSingleShot(True)
+        self._resort_timer.setInterval(300)
+        self._resort_timer.timeout.connect(self._refilter)
+        source.modelReset.connect(self._on_source_reset)
+        source.rowsInserted.connect(self._on_source_rows_inserted)
+        source.dataChanged.connect(self._on_source_data_changed)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return self.source.columnCount()
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        return self.source.headerData(section, orientation, role)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        return self.source.data(self.source.index(self._rows[index.row()], index.column()), role)
+
+    def visible_names(self, first, last):
+        names = self.source.names
+        return [names[r] for r in self._rows[max(first, 0):last + 1]]
+
+    def set_query(self, text):
+        self.query = text or ""
+        self._refilter()
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self.sort_column, self.sort_order = column, order
+        self._refilter()
+
+    def _ordered(self, rows):
+        if self.sort_column < 0:
+            return rows
+        key = lambda r: self.source.sort_key(r, self.sort_column)
+        return sorted(rows, key=key, reverse=self.sort_order == QtCore.Qt.DescendingOrder)
+
+    def _refilter(self):
+        self.beginResetModel()
+        self._rows = self._ordered(self._index.rank(self.query))
+        self._pos = {r: i for i, r in enumerate(self._rows)}
+        self.endResetModel()
+
+    def _on_source_reset(self):
+        self._index = SearchIndex(self.source.names)
+        self._refilter()
+
+    def _on_source_rows_inserted(self, parent, first, last):
+        self._index.extend(self.source.names[first:last + 1])
+        if not self.query and self.sort_column < 0:
+            self.beginInsertRows(QtCore.QModelIndex(), len(self._rows), len(self._rows) + last - first)
+            for r in range(first, last + 1):
+                self._pos[r] = len(self._rows)
+                self._rows.append(r)
+            self.endInsertRows()
+        else:
+            self._refilter()
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=None):
+        for r in range(top_left.row(), bottom_right.row() + 1):
+            i = self._pos.get(r)
+            if i is not None:
+                self.dataChanged.emit(self.index(i, top_left.column()), self.index(i, bottom_right.column()))
+        if self.sort_column > COL_NAME:
+            self._resort_timer.start()  # new metadata may change the order
+
+
+# ===============================
+# Browser window
+# ===============================
 class LineupBrowser(QtWidgets.QWidget):
     def __init__(self):
         super(LineupBrowser, self).__init__()
         self.setWindowTitle("Lineup Browser")
-        self.setGeometry(200, 200, 500, 600)
+        self.setGeometry(200, 200, 700, 600)
 
         self.projects_directory = GLOSS_ROOT
         self._set_global_font()
@@ -29,16 +439,36 @@ class LineupBrowser(QtWidgets.QWidget):
         self.layout.addWidget(self.directory_label)
 
         self.filter_input = QtWidgets.QLineEdit()
-        self.filter_input.setPlaceholderText("Filter projects...")
-        self.filter_input.textChanged.connect(self._filter_projects)
+        self.filter_input.setPlaceholderText("Filter projects... (fuzzy: name or job code)")
+        self.filter_input.textChanged.connect(self._schedule_filter)
         self.layout.addWidget(self.filter_input)
 
-        self.project_list_widget = QtWidgets.QListWidget()
-        self.layout.addWidget(self.project_list_widget)
+        # Debounce: filter once typing pauses instead of on every keystroke.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+
+        self.project_model = ProjectListModel(self.projects_directory, self)
+        self.filter_model = ProjectFilterModel(self.project_model, self)
+        self.project_view = QtWidgets.QTreeView()
+        self.project_view.setRootIsDecorated(False)
+        self.project_view.setUniformRowHeights(True)
+        self.project_view.setAlternatingRowColors(True)
+        self.project_view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.project_view.setModel(self.filter_model)
+        self.project_view.setSortingEnabled(True)
+        self.project_view.header().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
+        self.project_view.header().setStretchLastSection(False)
+        self.project_view.header().setSectionResizeMode(COL_NAME, QtWidgets.QHeaderView.Stretch)
+        self.layout.addWidget(self.project_view)
+
+        self.status_label = QtWidgets.QLabel("")
+        self.layout.addWidget(self.status_label)
 
         button_layout = QtWidgets.QHBoxLayout()
         self.refresh_button = QtWidgets.QPushButton("Refresh")
-        self.refresh_button.clicked.connect(self._load_projects)
+        self.refresh_button.clicked.connect(lambda: self._load_projects(force=True))
         button_layout.addWidget(self.refresh_button)
 
         self.set_directory_button = QtWidgets.QPushButton("Set Directory")
@@ -47,11 +477,22 @@ class LineupBrowser(QtWidgets.QWidget):
 
         self.layout.addLayout(button_layout)
 
-        self.project_list_widget.itemClicked.connect(self._handle_project_click)
-        self.all_project_names = []
+        self.project_view.clicked.connect(self._handle_project_click)
+        self.project_view.activated.connect(self._handle_project_click)
+        self.filter_input.returnPressed.connect(self._open_first_match)
+        self.project_view.verticalScrollBar().valueChanged.connect(self._prefetch_visible)
+        self.filter_model.modelReset.connect(self._prefetch_visible)
+        self._loader = None
+        self._meta_loader = None
+        self._load_generation = 0
+        self._fresh = False
 
         self._load_projects()
 
+    @property
+    def all_project_names(self):
+        return self.project_model.names
+
     def _set_global_font(self):
         font = QtGui.QFont()
         font.setPointSize(12)
@@ -65,49 +506,149 @@ class LineupBrowser(QtWidgets.QWidget):
             self.directory_label.setText(f"Directory: {self.projects_directory}")
             self._load_projects()
 
-    def _load_projects(self):
-        self.project_list_widget.clear()
-        self.all_project_names = []
+    def _load_projects(self, force=False):
+        """Fill from the cache right away, then (re)scan in the background if the root changed."""
+        self._load_generation += 1
+        self._fresh = False
+        if self._loader is not None:
+            self._loader.requestInterruption()
+        self._start_meta_loader()
+
+        root_meta = _meta_cache().get(self.projects_directory, {})
+        cached = _PROJECT_CACHE.get(self.projects_directory)
+        if cached and not force:
+            self.project_model.set_names(self.projects_directory, cached[1], root_meta)
+            cached_mtime = cached[0]
+            self._update_status()
+        else:
+            self.project_model.set_names(self.projects_directory, [], root_meta)
+            cached_mtime = None
+            self.status_label.setText("Loading projects...")
+
+        loader = ProjectLoader(self.projects_directory, cached_mtime, self._load_generation, self)
+        loader.batch_ready.connect(self._on_batch)
+        loader.load_finished.connect(self._on_load_finished)
+        loader.load_failed.connect(self._on_load_failed)
+        loader.finished.connect(loader.deleteLater)
+        self._loader = loader
+        loader.start()
+
+    def _start_meta_loader(self):
+        if self._meta_loader is not None:
+            self._meta_loader.requestInterruption()
+        root = self.projects_directory
+        ml = ProjectMetaLoader(root, _meta_cache().get(root, {}), self)
+        ml.meta_ready.connect(self._on_meta)
+        ml.finished.connect(ml.deleteLater)
+        self._meta_loader = ml
+        ml.start()
+
+    def _prefetch_visible(self, *_):
+        """Queue metadata for the rows on screen ahead of everything else."""
+        if self._meta_loader is None or not self.filter_model.rowCount():
+            return
+        vp = self.project_view.viewport().rect()
+        top = self.project_view.indexAt(vp.topLeft()).row()
+        bottom = self.project_view.indexAt(vp.bottomLeft()).row()
+        top = max(top, 0)
+        if bottom < 0:
+            bottom = min(self.filter_model.rowCount() - 1, top + 60)
+        self._meta_loader.enqueue(self.filter_model.visible_names(top, bottom), front=True)
+
+    def _on_meta(self, root, name, meta):
+        _meta_cache().setdefault(root, {})[name] = meta
+        if root == self.project_model.root:
+            self.project_model.set_meta(name, meta)
+
+    def _update_status(self, loading=False):
+        total = len(self.project_model.names)
+        shown = self.filter_model.rowCount()
+        if not total and not loading:
+            text = "No projects found."
+        elif shown == total:
+            text = f"{total} projects"
+        else:
+            text = f"{shown} of {total} projects"
+        self.status_label.setText(text + (" (loading...)" if loading else ""))
+
+    def _on_batch(self, generation, names):
+        if generation != self._load_generation:
+            return
+        if not self._fresh:
+            # First fresh batch replaces the stale cached list.
+            self._fresh = True
+            self.project_model.set_names(self.projects_directory, [])
+        self.project_model.append_names(names)
+        self._prefetch_visible()
+        self._update_status(loading=True)
 
-        if not os.path.exists(self.projects_directory):
-            QtWidgets.QMessageBox.critical(self, "Error", f"Directory not found: {self.projects_directory}")
+    def _on_load_finished(self, generation, mtime, changed):
+        if generation != self._load_generation:
             return
+        self._loader = None
+        if changed:
+            names = sorted(self.project_model.names) if self._fresh else []
+            self.project_model.set_names(self.projects_directory, names)
+            _PROJECT_CACHE[self.projects_directory] = (mtime, names)
+        self._update_status()
+        if self._meta_loader is not None:
+            self._prefetch_visible()
+            self._meta_loader.enqueue(self.project_model.names)  # everything else, lower priority
 
-        project_names = [name for name in os.listdir(self.projects_directory)
-                         if os.path.isdir(os.path.join(self.projects_directory, name))]
+    def closeEvent(self, event):
+        # Don't let Qt destroy running worker threads with the window.
+        for worker in self.findChildren(QtCore.QThread):
+            worker.requestInterruption()
+            worker.wait(2000)
+        save_meta_cache()
+        super(LineupBrowser, self).closeEvent(event)
 
-        if not project_names:
-            self.project_list_widget.addItem("No projects found.")
+    def _on_load_failed(self, generation, error):
+        if generation != self._load_generation:
             return
+        self._loader = None
+        self.project_model.set_names(self.projects_directory, [])
+        self._update_status()
+        QtWidgets.QMessageBox.critical(self, "Error", error)
+
+    def _schedule_filter(self, _text=None):
+        self._filter_timer.start()  # restarts while typing
 
-        for project in sorted(project_names):
-            self.all_project_names.append(project)
-            item = QtWidgets.QListWidgetItem(project)
-            item.setData(QtCore.Qt.UserRole, os.path.join(self.projects_directory, project))
-            self.project_list_widget.addItem(item)
-
-    def _filter_projects(self, text):
-        self.project_list_widget.clear()
-        t = (text or "").lower()
-        for project in self.all_project_names:
-            if t in project.lower():
-                item = QtWidgets.QListWidgetItem(project)
-                item.setData(QtCore.Qt.UserRole, os.path.join(self.projects_directory, project))
-                self.project_list_widget.addItem(item)
-
-    def _handle_project_click(self, item):
-        project_path = item.data(QtCore.Qt.UserRole)
-        progress_folder = self._find_progress_folder(project_path)
-
-        if not progress_folder:
-            QtWidgets.QMessageBox.warning(self, "Error", "PROGRESS-###### folder not found.")
+    def _apply_filter(self):
+        self.filter_model.set_query(self.filter_input.text())
+        self._update_status(loading=self._loader is not None)
+
+    def _open_first_match(self):
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self._apply_filter()
+        if self.filter_model.rowCount():
+            self._handle_project_click(self.filter_model.index(0, COL_NAME))
+
+    def _handle_project_click(self, index):
+        project_path = index.data(QtCore.Qt.UserRole)
+        if not project_path:
             return
 
-        nuke_folder = os.path.join(progress_folder, "NUKE")
-        if not os.path.exists(nuke_folder):
-            os.makedirs(nuke_folder)
+        # Prefetched metadata avoids listing the SAN again before opening, but it may come
+        # from an earlier session: one stat of the NUKE folder confirms no newer lineup appeared.
+        meta = self.project_model.meta.get(index.data(NAME_ROLE)) or {}
+        if not (meta.get("lineup") and _nuke_dir_unchanged(meta)):
+            meta = catalog_project_meta(project_path) or meta
+        if meta.get("lineup") and _nuke_dir_unchanged(meta):
+            lineup_path = meta["lineup"]
+            nuke_folder = meta["nuke_dir"]
+        else:
+            progress_folder = meta.get("progress") or self._find_progress_folder(project_path)
+            if not progress_folder:
+                QtWidgets.QMessageBox.warning(self, "Error", "PROGRESS-###### folder not found.")
+                return
+
+            nuke_folder = os.path.join(progress_folder, "NUKE")
+            if not os.path.exists(nuke_folder):
+                os.makedirs(nuke_folder)
+            lineup_path = self._find_latest_lineup_comp(nuke_folder)
 
-        lineup_path = self._find_latest_lineup_comp(nuke_folder)
         if lineup_path:
             nuke.scriptOpen(lineup_path)
             nuke.message(f"Opened latest lineup comp:\n{lineup_path}")
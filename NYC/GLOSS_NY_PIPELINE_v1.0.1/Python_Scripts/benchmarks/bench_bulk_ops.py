@@ -0,0 +1,109 @@
+# benchmarks/bench_bulk_ops.py
+# Per-node overhead of bulk node-graph work, old way vs gloss_utils.nuke_helpers.bulk_operation.
+# Runs headless against benchmarks.fake_nuke, which counts the UI work Nuke does for us:
+#   - createNode(): autoplace (looks at every node), deselect everything, select the new node,
+#     one undo step per node
+#   - setSelected(): one DAG redraw request per call
+#   - nuke.nodes.<Class>(): none of the above
+# Counts are what matters (wall time on the stand-in is only indicative).
+#
+# Usage:
+#   python -m benchmarks.bench_bulk_ops             # 500 Reads into a 2,000 node script
+#   python -m benchmarks.bench_bulk_ops --reads 2000 --graph 5000
+
+import sys
+import time
+
+from benchmarks import fake_nuke
+
+
+# ===============================
+# Scenarios
+# ===============================
+def _fresh(graph_size):
+    nuke = fake_nuke
+    nuke.reset()
+    for i in range(graph_size):
+        nuke.nodes.Dot(xpos=i * 10, ypos=0)
+    nuke.toNode("Dot1").setSelected(True)
+    nuke.stats.reset()
+    return nuke
+
+
+def _measure(label, n_items, fn, graph_size):
+    nuke = _fresh(graph_size)
+    t0 = time.perf_counter()
+    fn(nuke)
+    elapsed = time.perf_counter() - t0
+    s = nuke.stats
+    return {
+        "scenario": label, "items": n_items,
+        "autoplace_visits": s.autoplace_visits, "select_calls": s.select_calls,
+        "undo_steps": s.undo_steps, "ui_work_per_item": s.ui_work() / float(n_items),
+        "ms": elapsed * 1000,
+    }
+
+
+def run(reads=500, graph_size=2000):
+    from gloss_utils import nuke_helpers
+    from read_node.bulk_import import create_reads
+
+    specs = [{"file": f"/tmp/shot_{i:04d}.mov", "xpos": i * 110, "ypos": 0} for i in range(reads)]
+
+    def legacy_import(nuke):
+        for s in specs:
+            n = nuke.createNode("Read", f"file {{{s['file']}}}", inpanel=False)
+            n.setXpos(s["xpos"])
+            n.setYpos(s["ypos"])
+
+    def legacy_select_single(nuke):
+        for n in nuke.allNodes():
+            n.setSelected(False)
+        nuke.allNodes()[-1].setSelected(True)
+
+    def legacy_delete(nuke):
+        for n in nuke.allNodes("Dot")[:reads]:
+            nuke.delete(n)
+
+    def bulk_delete(nuke):
+        with nuke_helpers.bulk_operation("delete") as bulk:
+            for n in nuke.allNodes("Dot")[:reads]:
+                bulk.delete(n)
+
+    return [
+        (_measure("import Reads: createNode loop", reads, legacy_import, graph_size),
+         _measure("import Reads: create_reads()", reads, lambda nk: create_reads(specs), graph_size)),
+        (_measure("select single: walk allNodes()", 1, legacy_select_single, graph_size),
+         _measure("select single: select_single_node()", 1,
+                  lambda nk: nuke_helpers.select_single_node(nk.allNodes()[-1]), graph_size)),
+        (_measure("delete nodes: nuke.delete loop", reads, legacy_delete, graph_size),
+         _measure("delete nodes: bulk_operation", reads, bulk_delete, graph_size)),
+    ]
+
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Benchmark bulk node-graph operations on a stand-in nuke module.")
+    ap.add_argument("--reads", type=int, default=500, help="nodes created/deleted per scenario")
+    ap.add_argument("--graph", type=int, default=2000, help="nodes already in the script")
+    args = ap.parse_args(argv)
+
+    try:
+        fake_nuke.install()
+    except RuntimeError as e:
+        print(f"Run this outside Nuke: {e}")
+        return 1
+
+    print(f"{args.reads} items, {args.graph} nodes already in the script\n")
+    print(f"{'scenario':40} {'autoplace':>10} {'select':>8} {'undo':>6} {'work/item':>10} {'ms':>8}")
+    for old, new in run(args.reads, args.graph):
+        for r in (old, new):
+            print(f"{r['scenario']:40} {r['autoplace_visits']:>10} {r['select_calls']:>8} "
+                  f"{r['undo_steps']:>6} {r['ui_work_per_item']:>10.1f} {r['ms']:>8.1f}")
+        saved = old["ui_work_per_item"] - new["ui_work_per_item"]
+        print(f"{'  -> per-item UI work removed':40} {saved:>47.1f}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
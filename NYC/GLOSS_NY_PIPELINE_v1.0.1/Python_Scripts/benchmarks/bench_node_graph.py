@@ -0,0 +1,233 @@
+# benchmarks/bench_node_graph.py
+# Node-graph hot paths of the toolset on large scripts, headless (benchmarks.fake_nuke).
+# - Builds a lineup-sized script (default 5,000 nodes, 40% Reads) in the stand-in nuke
+# - Runs the real read_node / write_nodes / tools / panels code against it
+# - Reports wall time plus what scales with script size: nodes handed out by
+#   allNodes()/selectedNodes(), callbacks fired, SAN listdirs
+#
+# Cases:
+#   find_shot: index build   ShotFinderPanel index over every Read (first search)
+#   find_shot: 20 searches   typing + selection changes against the warm index
+#   find_shot: +100 Reads    incremental index patch after nodes are added
+#   qc: original lookup      _find_original_read_for (QC compare / wipe)
+#   retouch: job from scene  _derive_cloudsync_job_from_scene on a GlossPost-only script
+#   retouch: import          _import_scanned: dedupe, match and lay out 500 delivered clips
+#   render: collect writes   render_queue.gloss_write_nodes
+#   writes: save script      scriptSave() after a session of creating/deleting Gloss Writes
+#
+# Usage:
+#   python -m benchmarks.bench_node_graph
+#   python -m benchmarks.bench_node_graph --nodes 20000 --json
+#   python -m cProfile -s cumtime -m benchmarks.bench_node_graph --only retouch
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+
+from benchmarks import fake_nuke
+
+DEFAULT_NODES = 5000
+READ_SHARE    = 0.4
+CLIPS         = 500
+WRITES_MADE   = 200   # Gloss Writes created during the simulated session
+WRITES_KEPT   = 4     # ... of which are still in the script at save time
+
+
+# ===============================
+# Script fixtures
+# ===============================
+def _plate(i):
+    shot = f"P{i // 50:03d}_SH{i % 50:04d}"
+    return shot, f"/Volumes/san-01/GlossPost/101000_PRJ000_CLOUD/IN-101000/FOOTAGE/PLATES/{shot}/{shot}.####.exr"
+
+def build_script(n_nodes, read_share=READ_SHARE, script="/Volumes/san-01/GlossPost/101000_PRJ000_CLOUD/"
+                 "PROGRESS-101000/NUKE/P000_SH0000/Scripts/COMP/P000_SH0000_NYC_v01.nk"):
+    """Fresh stand-in script: plate Reads (+ a CHN version every 4th shot), the rest Dots/Merges."""
+    nuke = fake_nuke
+    nuke.reset(script)
+    n_reads = int(n_nodes * read_share)
+    made = 0
+    for i in range(n_reads):
+        shot, path = _plate(i // 2)
+        if i % 2 and (i // 2) % 4:
+            continue
+        if i % 2:
+            path = f"/Volumes/san-01/CloudSync/101000_PRJ000/VFX-CHN/RETOUCH/2026-01-05/{shot}_CHN_v001.mov"
+        nuke.nodes.Read(file=path, xpos=(i // 2) * 110, ypos=0 if i % 2 == 0 else 150)
+        made += 1
+    for i in range(n_nodes - made):
+        nuke.nodes.Dot(xpos=i * 10, ypos=600) if i % 3 else nuke.nodes.Merge2(xpos=i * 10, ypos=700)
+    nuke.stats.reset()
+    return made
+
+
+# ===============================
+# Cases
+# ===============================
+def _timed(label, fn, **extra):
+    """(label, seconds, counters) for one call; stand-in stats cover only that call."""
+    fake_nuke.stats.reset()
+    t0 = time.perf_counter()
+    detail = fn() or {}
+    seconds = time.perf_counter() - t0
+    s = fake_nuke.stats
+    counters = {"node_visits": s.node_visits, "callbacks": s.callbacks, "callback_errors": s.callback_errors}
+    return label, seconds, {**counters, **extra, **detail}
+
+def _counted_listdir(counter):
+    real = os.listdir
+
+    def listdir(path="."):
+        counter[0] += 1
+        return real(path)
+    return real, listdir
+
+def case_find_shot(n_nodes):
+    from panels import find_shot_panel as fsp
+    fsp.install_callbacks()
+    build_script(n_nodes)
+    fsp._on_script_change()
+
+    out = [_timed("find_shot: index build", lambda: {"entries": len(fsp.current_index().entries)})]
+    panel = fsp.ShotFinderPanel()
+
+    def searches():
+        for j in range(0, 40, 2):
+            panel._filter_and_select(f"sh{j:04d}")
+        return {"matches": len(panel.matches)}
+    out.append(_timed("find_shot: 20 searches", searches))
+
+    for i in range(100):
+        fake_nuke.createNode("Read", f"file {{/tmp/new/NEW_SH{i:04d}.mov}}", inpanel=False)
+
+    def patched_search():
+        panel._filter_and_select("new_sh0042")
+        return {"matches": len(panel.matches)}
+    out.append(_timed("find_shot: +100 Reads", patched_search))
+    return out
+
+def case_qc_lookup(n_nodes):
+    from read_node import ops_read_tools as ort
+    build_script(n_nodes)
+    chn = [n for n in fake_nuke.allNodes("Read") if n["file"].value().endswith(".mov")][:50]
+    return [_timed("qc: original lookup x50",
+                   lambda: {"found": sum(1 for r in chn if ort._find_original_read_for(r) is not None)})]
+
+def case_retouch(n_nodes, cloud_root):
+    from tools import import_retouched_shots as irs
+    build_script(n_nodes)
+    # GlossPost-only script: every Read goes through the job-code -> CloudSync lookup
+    for n in fake_nuke.allNodes("Read"):
+        if "/CloudSync/" in n["file"].value():
+            fake_nuke.delete(n)
+
+    calls = [0]
+    real, counted = _counted_listdir(calls)
+
+    def derive():
+        irs._derive_cloudsync_job_from_scene()
+        return {"listdirs": calls[0]}
+
+    irs.os.listdir = counted
+    try:
+        out = [_timed("retouch: job from scene", derive)]
+    finally:
+        irs.os.listdir = real
+
+    build_script(n_nodes)
+    day = "/Volumes/san-01/CloudSync/101000_PRJ000/VFX-CHN/RETOUCH/2026-01-12"
+    clips = [f"{day}/{_plate(i)[0]}_CHN_v002.mov" for i in range(CLIPS)]
+    result = {"base": os.path.dirname(day), "folders": [(os.path.basename(day), clips)],
+              "new": list(clips), "rescanned": 1, "elapsed": 0.0}
+
+    def import_clips():
+        irs._import_scanned(result, None)
+        return {"created": fake_nuke.stats.created}
+    out.append(_timed("retouch: import 500 clips", import_clips))
+    return out
+
+def case_render_collect(n_nodes):
+    from write_nodes import render_queue
+    build_script(n_nodes)
+    for i in range(50):
+        fake_nuke.nodes.Write(name=f"Gloss_DN_Write{i}" if i % 2 else f"Write{i}")
+    return [_timed("render: collect writes", lambda: {"writes": len(render_queue.gloss_write_nodes())})]
+
+def case_save_writes(n_nodes):
+    from write_nodes import dn_output, precomp_output, final_output
+    build_script(n_nodes)
+    makers = (dn_output.run, precomp_output.run, final_output.run)
+    made = []
+    for i in range(WRITES_MADE):
+        makers[i % 3]()
+        made.append(fake_nuke.selectedNode())
+    for w in made[:-WRITES_KEPT]:
+        fake_nuke.delete(w)
+
+    def save():
+        fake_nuke.scriptSave()
+    return [_timed("writes: save script", save, kept=WRITES_KEPT)]
+
+
+CASES = {
+    "find_shot": lambda n, tmp: case_find_shot(n),
+    "qc": lambda n, tmp: case_qc_lookup(n),
+    "retouch": case_retouch,
+    "render": lambda n, tmp: case_render_collect(n),
+    "writes": lambda n, tmp: case_save_writes(n),
+}
+
+
+def run(n_nodes=DEFAULT_NODES, only=None):
+    tmp = tempfile.mkdtemp(prefix="gloss_graph_")
+    # A CloudSync root with a few hundred job folders, none matching the script's job code
+    cloud = os.path.join(tmp, "CloudSync")
+    for i in range(300):
+        os.makedirs(os.path.join(cloud, f"{200000 + i:06d}_OTHER"))
+    os.environ["GLOSS_CLOUD_ROOT"] = cloud
+    os.environ["HOME"] = tmp  # keeps ~/.nuke caches out of the real home
+    results = []
+    try:
+        for name, case in CASES.items():
+            if only and name not in only:
+                continue
+            for label, seconds, extra in case(n_nodes, tmp):
+                results.append({"case": label, "ms": round(seconds * 1000, 3), **extra})
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Benchmark node-graph hot paths on a stand-in nuke.")
+    ap.add_argument("--nodes", type=int, default=DEFAULT_NODES, help="nodes in the script")
+    ap.add_argument("--only", nargs="+", choices=sorted(CASES))
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args(argv)
+
+    try:
+        fake_nuke.install()
+    except RuntimeError as e:
+        print(f"Run this outside Nuke: {e}")
+        return 1
+
+    results = run(args.nodes, args.only)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{args.nodes} nodes in the script\n")
+    print(f"{'case':30} {'ms':>9} {'visits':>8} {'callbacks':>10} {'cb errors':>10}  detail")
+    for r in results:
+        extra = ", ".join(f"{k}={v}" for k, v in r.items()
+                          if k not in ("case", "ms", "node_visits", "callbacks", "callback_errors"))
+        print(f"{r['case']:30} {r['ms']:>9.2f} {r['node_visits']:>8} {r['callbacks']:>10} "
+              f"{r['callback_errors']:>10}  {extra}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
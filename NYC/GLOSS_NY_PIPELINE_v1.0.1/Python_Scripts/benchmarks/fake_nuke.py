@@ -0,0 +1,889 @@
+# benchmarks/fake_nuke.py
+# Stand-in `nuke` module for headless profiling of the toolset on a plain Linux box.
+# - Covers what read_node, write_nodes, tools and panels call: nodes and knobs,
+#   allNodes/selectedNodes/toNode, createNode/nodes.<Class>, filename, delete, root,
+#   callbacks (onCreate/onUserCreate/onDestroy/knobChanged/script events), Undo,
+#   dialogs (message/ask/Panel), executeInMainThread, ProgressTask, formats
+# - Nodes are indexed by name and by class, so a 5,000-node script stays cheap:
+#   toNode() is O(1), allNodes(cls) only walks that class, selectedNodes() only the selection
+# - `stats` counts the UI work real Nuke would do (autoplace scans, selection changes,
+#   undo steps, dialogs) so benchmarks can report it next to wall time
+#
+#   from benchmarks import fake_nuke
+#   nuke = fake_nuke.install()          # registers it as `nuke` (and a `nukescripts` stand-in)
+#   fake_nuke.reset("/jobs/shot_v001.nk")
+#   fake_nuke.answers["ask"] = False     # what dialogs return
+#
+# Not a Nuke emulator: nothing renders, expressions are not evaluated and only
+# the knobs the pipeline touches exist by default (unknown knobs are created on
+# first assignment through nuke.nodes.<Class>(knob=value)).
+
+import re
+import sys
+import types
+
+NUKE_VERSION_MAJOR = 15
+NUKE_VERSION_MINOR = 1
+NUKE_VERSION_STRING = "15.1v1 (stand-in)"
+env = {"gui": False, "NukeVersionMajor": NUKE_VERSION_MAJOR, "nukex": True}
+
+# Default tile size in the DAG
+TILE_W, TILE_H = 80, 18
+
+# Knobs every node has, plus per-class defaults
+_COMMON_KNOBS = {"label": "", "tile_color": 0, "note_font_size": 11, "disable": False, "selected": False,
+                 "xpos": 0, "ypos": 0}
+_CLASS_KNOBS = {
+    "Read":  {"file": "", "first": 1, "last": 1, "origfirst": 1, "origlast": 1, "format": "HD_1080",
+              "colorspace": "default", "frame_mode": "start at", "frame": "", "on_error": "error",
+              "before": "hold", "after": "hold", "raw": False},
+    "Write": {"file": "", "file_type": "exr", "colorspace": "default", "channels": "rgb",
+              "compression": "Zip (1 scanline)", "datatype": "16 bit half", "mov64_codec": "",
+              "beforeRender": "", "afterFrameRender": "", "afterRender": "",
+              "create_directories": False, "use_limit": False,
+              "first": 1, "last": 1},
+    "Merge2": {"operation": "over", "mix": 1.0},
+    "BackdropNode": {"bdwidth": 200, "bdheight": 150, "z_order": 0},
+    "Viewer": {"wipeactive": False},
+    "Dot": {},
+}
+_ROOT_KNOBS = {"name": "", "first_frame": 1, "last_frame": 100, "fps": 24.0, "format": "HD_1080",
+               "lock_range": False, "frame": 1}
+
+
+class _Stats(object):
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.autoplace_visits = 0   # nodes looked at while autoplacing createNode() results
+        self.select_calls = 0       # setSelected() calls (each is a DAG redraw request in Nuke)
+        self.undo_steps = 0         # entries pushed onto the undo stack
+        self.created = 0
+        self.deleted = 0
+        self.dialogs = 0            # message/ask/Panel.show calls
+        self.node_visits = 0        # nodes handed out by allNodes()/selectedNodes()
+        self.callbacks = 0          # callback invocations
+        self.callback_errors = 0    # callbacks that raised (Nuke prints and carries on)
+
+    def ui_work(self):
+        return self.autoplace_visits + self.select_calls + self.undo_steps
+
+    def as_dict(self):
+        return dict(self.__dict__)
+
+
+stats = _Stats()
+answers = {"ask": True, "panel": True, "choice": 0, "getInput": ""}
+messages = []      # (kind, text) of every dialog, newest last
+printed = []       # tprint output
+
+_nodes = {}        # name -> node, creation order
+_by_class = {}     # class -> {name: node}
+_selected = {}     # name -> node
+_counters = {}     # class -> last number used in a default name
+_callbacks = {}    # kind -> [(fn, args, kwargs, nodeClass)]
+_context = []      # (node, knob) for thisNode()/thisKnob()
+_undo_depth = [0]
+_formats = {}
+_root = None
+_viewer = None
+
+
+# ===============================
+# Knobs
+# ===============================
+class Knob(object):
+    def __init__(self, name="", label=None, value=None):
+        self._name = name
+        self._label = name if label is None else label
+        self._value = value
+        self._node = None
+        self._visible = True
+        self._flags = 0
+
+    def name(self):
+        return self._name
+
+    def label(self):
+        return self._label
+
+    def value(self):
+        return self._value
+
+    getValue = value
+
+    def setValue(self, value, *args):
+        self._value = value
+        if self._name == "name" and self._node is not None:
+            self._node.setName(value)
+        return True
+
+    def evaluate(self):
+        """File knobs: the path for the root's current frame (%04d / #### filled in)."""
+        v = self._value
+        if isinstance(v, str) and self._name == "file":
+            frame = int(root()["frame"].value() or 1)
+            v = re.sub(r"%0?(\d*)d", lambda m: f"{frame:0{int(m.group(1) or 1)}d}", v)
+            v = re.sub(r"#+", lambda m: f"{frame:0{len(m.group(0))}d}", v)
+        return v
+
+    def node(self):
+        return self._node
+
+    def setVisible(self, visible):
+        self._visible = bool(visible)
+
+    def visible(self):
+        return self._visible
+
+    def setFlag(self, flag):
+        self._flags |= flag
+
+    def clearFlag(self, flag):
+        self._flags &= ~flag
+
+    def setEnabled(self, enabled):
+        pass
+
+    def setTooltip(self, text):
+        pass
+
+    def values(self):
+        return []
+
+
+class Text_Knob(Knob):
+    def __init__(self, name="", label=None, text=""):
+        Knob.__init__(self, name, label, text)
+
+class PyScript_Knob(Knob):
+    def __init__(self, name="", label=None, command=""):
+        Knob.__init__(self, name, label, command)
+
+    def execute(self):
+        exec(self._value, {"nuke": sys.modules.get("nuke")})
+
+class Tab_Knob(Knob):
+    pass
+
+class Boolean_Knob(Knob):
+    def __init__(self, name="", label=None, value=False):
+        Knob.__init__(self, name, label, bool(value))
+
+class String_Knob(Knob):
+    def __init__(self, name="", label=None, value=""):
+        Knob.__init__(self, name, label, value)
+
+class File_Knob(String_Knob):
+    pass
+
+class Int_Knob(Knob):
+    def __init__(self, name="", label=None, value=0):
+        Knob.__init__(self, name, label, value)
+
+class Double_Knob(Int_Knob):
+    pass
+
+class Enumeration_Knob(Knob):
+    def __init__(self, name="", label=None, values=()):
+        Knob.__init__(self, name, label, values[0] if values else "")
+        self._values = list(values)
+
+    def values(self):
+        return list(self._values)
+
+INVISIBLE = 0x400
+STARTLINE = 0x1000
+ENDLINE = 0x2000
+
+
+# ===============================
+# Nodes
+# ===============================
+class Node(object):
+    """
+    Knob values start out as plain dict entries; a Knob object is only made when
+    something asks for it, so building a 5,000-node script costs one dict per node.
+    """
+
+    def __init__(self, node_class, knobs=None, name=None):
+        self._class = node_class
+        self._knobs = {}        # name -> Knob, made on first access
+        self._vals = dict(_COMMON_KNOBS)
+        self._vals.update(_CLASS_KNOBS.get(node_class, ()))
+        self._inputs = {}
+        self._outputs = set()   # nodes with this one as an input (keeps delete() O(outputs))
+        self._metadata = {}
+        self._width, self._height = 1920, 1080
+        self._deleted = False
+        knobs = dict(knobs or ())
+        self._name = knobs.pop("name", None) or name or _next_name(node_class)
+        self._vals["name"] = self._name
+        for k, v in knobs.items():
+            self._vals[k] = int(v) if k in ("xpos", "ypos") else v
+
+    def _get(self, name):
+        k = self._knobs.get(name)
+        return k._value if k is not None else self._vals[name]
+
+    def _put(self, name, value):
+        k = self._knobs.get(name)
+        if k is not None:
+            k._value = value
+        else:
+            self._vals[name] = value
+
+    def _knob(self, name):
+        k = self._knobs.get(name)
+        if k is None and name in self._vals:
+            k = self._add(Knob(name, value=self._vals.pop(name)))
+        return k
+
+    def _add(self, knob):
+        knob._node = self
+        self._vals.pop(knob.name(), None)
+        self._knobs[knob.name()] = knob
+        return knob
+
+    # --- identity ---
+    def Class(self):
+        return self._class
+
+    def name(self):
+        self._alive()
+        return self._name
+
+    def fullName(self):
+        self._alive()
+        return self._name
+
+    def setName(self, name, uncollide=True):
+        if name == self._name:
+            return
+        if name in _nodes and uncollide:
+            name = _next_name(name)
+        indexed = _nodes.get(self._name) is self
+        if indexed:
+            _unindex(self)
+        self._name = name
+        self._put("name", name)
+        if indexed:
+            _index(self)
+
+    # --- knobs ---
+    def _alive(self):
+        if self._deleted:
+            raise ValueError("A PythonObject is not attached to a node")
+
+    def __getitem__(self, name):
+        self._alive()
+        k = self._knob(name)
+        if k is None:
+            raise NameError(f"knob {name} does not exist")
+        return k
+
+    def knob(self, name):
+        self._alive()
+        return self._knob(name)
+
+    def knobs(self):
+        for name in list(self._vals):
+            self._knob(name)
+        return dict(self._knobs)
+
+    def addKnob(self, knob):
+        self._add(knob)
+
+    def removeKnob(self, knob):
+        self._knobs.pop(knob.name(), None)
+
+    def readKnobs(self, text):
+        for k, v in _parse_tcl_args(text):
+            if k == "name":
+                self.setName(v)
+            else:
+                self._put(k, v) if (k in self._knobs or k in self._vals) else self._add(Knob(k, value=v))
+
+    # --- DAG ---
+    def xpos(self):
+        return int(self._get("xpos"))
+
+    def ypos(self):
+        return int(self._get("ypos"))
+
+    def setXpos(self, x):
+        self._put("xpos", int(x))
+
+    def setYpos(self, y):
+        self._put("ypos", int(y))
+
+    def setXYpos(self, x, y):
+        self.setXpos(x)
+        self.setYpos(y)
+
+    def screenWidth(self):
+        return self._get("bdwidth") if self._class == "BackdropNode" else TILE_W
+
+    def screenHeight(self):
+        return self._get("bdheight") if self._class == "BackdropNode" else TILE_H
+
+    def autoplace(self):
+        stats.autoplace_visits += len(_nodes)
+
+    def setInput(self, i, node):
+        old = self._inputs.pop(i, None)
+        if old is not None and old not in self._inputs.values():
+            old._outputs.discard(self)
+        if node is not None:
+            self._inputs[i] = node
+            node._outputs.add(self)
+        return True
+
+    def input(self, i):
+        return self._inputs.get(i)
+
+    def inputs(self):
+        return max(self._inputs) + 1 if self._inputs else 0
+
+    def dependencies(self, what=None):
+        return [n for n in self._inputs.values() if n is not None]
+
+    def dependent(self, what=None, forceEvaluate=True):
+        return list(self._outputs)
+
+    # --- selection ---
+    def isSelected(self):
+        return self._name in _selected
+
+    def setSelected(self, state):
+        stats.select_calls += 1
+        self._put("selected", bool(state))
+        if state:
+            _selected[self._name] = self
+        else:
+            _selected.pop(self._name, None)
+
+    # --- image info (Read) ---
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def format(self):
+        return Format(self._width, self._height, f"{self._width}x{self._height}")
+
+    def firstFrame(self):
+        try:
+            return int(self._get("first"))
+        except KeyError:
+            return int(root()["first_frame"].value())
+
+    def lastFrame(self):
+        try:
+            return int(self._get("last"))
+        except KeyError:
+            return int(root()["last_frame"].value())
+
+    def frameRange(self):
+        return (self.firstFrame(), self.lastFrame())
+
+    def metadata(self, key=None, *args):
+        return dict(self._metadata) if key is None else self._metadata.get(key)
+
+    def set_image_info(self, width=None, height=None, metadata=None):
+        """Stand-in only: what width()/height()/metadata() should report."""
+        if width:
+            self._width = width
+        if height:
+            self._height = height
+        if metadata:
+            self._metadata.update(metadata)
+
+    # --- misc ---
+    def showControlPanel(self):
+        _run_callbacks("knobChanged", self, self._knob("showPanel") or Knob("showPanel"))
+
+    def hideControlPanel(self):
+        pass
+
+    def __repr__(self):
+        return f"<{self._class} {self._name}>"
+
+
+class Root(Node):
+    def __init__(self, path=""):
+        Node.__init__(self, "Root", name="root")
+        self._vals.update(_ROOT_KNOBS)
+        self._vals["name"] = path or ""
+
+    def name(self):
+        return self._get("name") or "Root"
+
+    def fps(self):
+        return self._get("fps")
+
+    def modified(self):
+        return False
+
+
+class Format(object):
+    def __init__(self, width, height, name=""):
+        self._w, self._h, self._name = width, height, name
+
+    def width(self):
+        return self._w
+
+    def height(self):
+        return self._h
+
+    def name(self):
+        return self._name
+
+
+def _next_name(node_class):
+    n = _counters.get(node_class, 0) + 1
+    while f"{node_class}{n}" in _nodes:
+        n += 1
+    _counters[node_class] = n
+    return f"{node_class}{n}"
+
+def _index(node):
+    _nodes[node._name] = node
+    _by_class.setdefault(node._class, {})[node._name] = node
+    if node._get("selected"):
+        _selected[node._name] = node
+
+def _unindex(node):
+    _nodes.pop(node._name, None)
+    _by_class.get(node._class, {}).pop(node._name, None)
+    _selected.pop(node._name, None)
+
+def _register(node, user=False):
+    _index(node)
+    stats.created += 1
+    if _undo_depth[0] == 0:
+        stats.undo_steps += 1
+    _run_callbacks("onCreate", node)
+    if user:
+        _run_callbacks("onUserCreate", node)
+    return node
+
+_TCL_PAIR = re.compile(r"(\w+)\s+(\{[^}]*\}|\"[^\"]*\"|\S+)")
+
+def _parse_tcl_args(text):
+    out = []
+    for k, v in _TCL_PAIR.findall(text or ""):
+        if v[:1] in "{\"":
+            v = v[1:-1]
+        else:
+            try:
+                v = int(v)
+            except ValueError:
+                try:
+                    v = float(v)
+                except ValueError:
+                    pass
+        out.append((k, v))
+    return out
+
+
+class _NodeFactory(object):
+    """nuke.nodes.<Class>(**knobs): no autoplace, no selection change, no onUserCreate."""
+
+    def __getattr__(self, node_class):
+        if node_class.startswith("__"):
+            raise AttributeError(node_class)
+        return lambda **knobs: _register(Node(node_class, knobs))
+
+nodes = _NodeFactory()
+
+
+# ===============================
+# Graph API
+# ===============================
+def createNode(node_class, args="", inpanel=True):
+    """Like Nuke: autoplace next to the selection, select only the new node, onUserCreate."""
+    node = Node(node_class, dict(_parse_tcl_args(args)))
+    anchor = next(reversed(_selected.values()), None) if _selected else None
+    stats.autoplace_visits += len(_nodes)
+    for n in list(_selected.values()):
+        n.setSelected(False)
+    if anchor is not None:
+        node.setXYpos(anchor.xpos(), anchor.ypos() + 60)
+        node.setInput(0, anchor)
+    _register(node, user=True)
+    node.setSelected(True)
+    return node
+
+def allNodes(filter=None, group=None, recurseGroups=False):
+    found = list(_by_class.get(filter, {}).values()) if filter else list(_nodes.values())
+    stats.node_visits += len(found)
+    return found
+
+def selectedNodes(filter=None):
+    found = [n for n in _selected.values() if not filter or n._class == filter]
+    stats.node_visits += len(found)
+    return found
+
+def selectedNode():
+    if not _selected:
+        raise ValueError("no node selected")
+    return next(reversed(_selected.values()))
+
+def toNode(name):
+    if name == "root":
+        return root()
+    return _nodes.get(name)
+
+def delete(node):
+    _run_callbacks("onDestroy", node)
+    _unindex(node)
+    node._deleted = True
+    stats.deleted += 1
+    if _undo_depth[0] == 0:
+        stats.undo_steps += 1
+    for n in list(node._outputs):
+        for i, src in list(n._inputs.items()):
+            if src is node:
+                del n._inputs[i]
+    for src in node._inputs.values():
+        src._outputs.discard(node)
+
+def filename(node, type=None):
+    k = node.knob("file")
+    return k.value() if k is not None else None
+
+def root():
+    global _root
+    if _root is None:
+        _root = Root()
+    return _root
+
+def thisNode():
+    return _context[-1][0] if _context else root()
+
+def thisKnob():
+    return _context[-1][1] if _context else None
+
+def thisGroup():
+    return root()
+
+def zoom(*args, **kwargs):
+    return 1.0
+
+def center():
+    return (0, 0)
+
+def formats():
+    return list(_formats.values())
+
+def addFormat(spec):
+    parts = str(spec).split()
+    if len(parts) >= 7:
+        _formats[parts[-1]] = Format(int(parts[0]), int(parts[1]), parts[-1])
+    return _formats.get(parts[-1]) if parts else None
+
+
+class _Viewer(object):
+    def __init__(self):
+        self._node = None
+
+    def node(self):
+        if self._node is None or self._node.name() not in _nodes:
+            self._node = nodes.Viewer()
+        return self._node
+
+def activeViewer():
+    global _viewer
+    if _viewer is None:
+        _viewer = _Viewer()
+    return _viewer
+
+
+# ===============================
+# Undo
+# ===============================
+class Undo(object):
+    def __init__(self, *args):
+        self._open = False
+
+    def begin(self, label=None):
+        if _undo_depth[0] == 0:
+            stats.undo_steps += 1
+        _undo_depth[0] += 1
+        self._open = True
+
+    def end(self):
+        if self._open:
+            _undo_depth[0] -= 1
+            self._open = False
+
+    def cancel(self):
+        self.end()
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, *exc):
+        self.end()
+
+    @staticmethod
+    def disabled():
+        return False
+
+    @staticmethod
+    def disable():
+        pass
+
+    @staticmethod
+    def enable():
+        pass
+
+
+# ===============================
+# Callbacks
+# ===============================
+def _add_cb(kind):
+    def add(fn, args=(), kwargs=None, nodeClass="*"):
+        _callbacks.setdefault(kind, []).append((fn, args, kwargs or {}, nodeClass))
+    def remove(fn, args=(), kwargs=None, nodeClass="*"):
+        _callbacks[kind] = [c for c in _callbacks.get(kind, []) if c[0] is not fn]
+    return add, remove
+
+addOnCreate, removeOnCreate = _add_cb("onCreate")
+addOnUserCreate, removeOnUserCreate = _add_cb("onUserCreate")
+addOnDestroy, removeOnDestroy = _add_cb("onDestroy")
+addKnobChanged, removeKnobChanged = _add_cb("knobChanged")
+addOnScriptLoad, removeOnScriptLoad = _add_cb("onScriptLoad")
+addOnScriptSave, removeOnScriptSave = _add_cb("onScriptSave")
+addOnScriptClose, removeOnScriptClose = _add_cb("onScriptClose")
+addBeforeRender, removeBeforeRender = _add_cb("beforeRender")
+addAfterRender, removeAfterRender = _add_cb("afterRender")
+
+def _run_callbacks(kind, node=None, knob=None):
+    for fn, args, kwargs, node_class in list(_callbacks.get(kind, ())):
+        if node is not None and node_class not in ("*", node._class):
+            continue
+        _context.append((node if node is not None else root(), knob))
+        stats.callbacks += 1
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            stats.callback_errors += 1
+            printed.append(f"{kind} callback {getattr(fn, '__name__', fn)}: {type(e).__name__}: {e}")
+        finally:
+            _context.pop()
+
+def knob_changed(node, knob_name):
+    """Stand-in only: fire knobChanged as if the user edited `knob_name` in the panel."""
+    _run_callbacks("knobChanged", node, node.knob(knob_name) or Knob(knob_name))
+
+callbacks = types.SimpleNamespace(filenameFilter=lambda f: f, filenameFilters={})
+
+
+# ===============================
+# Dialogs / threads / session
+# ===============================
+def message(text):
+    stats.dialogs += 1
+    messages.append(("message", text))
+
+def ask(text):
+    stats.dialogs += 1
+    messages.append(("ask", text))
+    return answers["ask"]
+
+def choice(title, text, options, default=0):
+    stats.dialogs += 1
+    messages.append(("choice", text))
+    return answers["choice"]
+
+def getInput(text, default=""):
+    stats.dialogs += 1
+    messages.append(("getInput", text))
+    return answers["getInput"] or default
+
+def tprint(*args, **kwargs):
+    printed.append(" ".join(str(a) for a in args))
+
+def executeInMainThread(fn, args=(), kwargs=None):
+    fn(*(args if isinstance(args, tuple) else (args,)), **(kwargs or {}))
+
+def executeInMainThreadWithResult(fn, args=(), kwargs=None):
+    return fn(*(args if isinstance(args, tuple) else (args,)), **(kwargs or {}))
+
+
+class Panel(object):
+    def __init__(self, title=""):
+        self._values = {}
+
+    def _add(self, name, value):
+        self._values[name] = value
+
+    def addEnumerationPulldown(self, name, values):
+        self._add(name, (values or "").split()[0] if values else "")
+
+    def addSingleLineInput(self, name, value=""):
+        self._add(name, value)
+
+    def addBooleanCheckBox(self, name, value=False):
+        self._add(name, value)
+
+    def addButton(self, name):
+        pass
+
+    def setWidth(self, w):
+        pass
+
+    def value(self, name):
+        return self._values.get(name)
+
+    def show(self):
+        stats.dialogs += 1
+        return 1 if answers["panel"] else 0
+
+
+class ProgressTask(object):
+    def __init__(self, title=""):
+        self.progress = 0
+        self.text = ""
+
+    def setMessage(self, text):
+        self.text = text
+
+    def setProgress(self, value):
+        self.progress = value
+
+    def isCancelled(self):
+        return False
+
+
+class _Menu(object):
+    def __init__(self, name=""):
+        self._name = name
+        self._items = {}
+
+    def addMenu(self, name, *args, **kwargs):
+        return self._items.setdefault(name, _Menu(name))
+
+    def addCommand(self, name, command=None, *args, **kwargs):
+        self._items[name] = command
+        return self
+
+    def addSeparator(self, *args, **kwargs):
+        pass
+
+    def findItem(self, name):
+        return self._items.get(name)
+
+    def items(self):
+        return list(self._items.values())
+
+_menus = {}
+
+def menu(name):
+    return _menus.setdefault(name, _Menu(name))
+
+def toolbar(name):
+    return menu(name)
+
+plugin_paths = []
+
+def pluginAddPath(path, addToSysPath=True):
+    plugin_paths.append(path)
+
+addPath = pluginAddPath
+
+def pluginPath():
+    return list(plugin_paths)
+
+def scriptSave(path=None):
+    if path:
+        root()["name"].setValue(path)
+    _run_callbacks("onScriptSave")
+    return True
+
+def scriptSaveAs(path, overwrite=0):
+    return scriptSave(path)
+
+def scriptOpen(path):
+    reset(path)
+    _run_callbacks("onScriptLoad")
+
+def scriptClose(*args):
+    _run_callbacks("onScriptClose")
+    reset()
+
+def frame(f=None):
+    if f is not None:
+        root()["frame"].setValue(int(f))
+    return int(root()["frame"].value())
+
+
+# ===============================
+# nukescripts stand-in
+# ===============================
+class PythonPanel(object):
+    def __init__(self, title="", id=""):
+        self._knobs = []
+        self.title = title
+
+    def addKnob(self, knob):
+        self._knobs.append(knob)
+
+    def knobs(self):
+        return {k.name(): k for k in self._knobs}
+
+    def show(self):
+        return True
+
+    def showModal(self):
+        return True
+
+    def showModalDialog(self):
+        return True
+
+    def addToPane(self, pane=None):
+        pass
+
+    def setMinimumSize(self, w, h):
+        pass
+
+nukescripts = types.ModuleType("nukescripts")
+nukescripts.PythonPanel = PythonPanel
+nukescripts.panels = types.SimpleNamespace(registerWidgetAsPanel=lambda *a, **k: None)
+nukescripts.clear_selection_recursive = lambda *a: [n.setSelected(False) for n in selectedNodes()]
+
+
+# ===============================
+# Session control
+# ===============================
+def reset(script_path="", clear_callbacks=False):
+    """Empty script (optionally 'saved' at script_path); stats and dialog logs cleared."""
+    global _root, _viewer
+    _nodes.clear()
+    _by_class.clear()
+    _selected.clear()
+    _counters.clear()
+    _context[:] = []
+    _undo_depth[0] = 0
+    _root = Root(script_path)
+    _viewer = None
+    if clear_callbacks:
+        _callbacks.clear()
+    del messages[:]
+    del printed[:]
+    stats.reset()
+
+def install():
+    """Register this module as `nuke` (and the stand-in as `nukescripts`). Returns it."""
+    me = sys.modules[__name__]
+    current = sys.modules.get("nuke")
+    if current is not None and current is not me:
+        raise RuntimeError("a different `nuke` module is already imported (running inside Nuke?)")
+    sys.modules["nuke"] = me
+    sys.modules.setdefault("nukescripts", nukescripts)
+    return me
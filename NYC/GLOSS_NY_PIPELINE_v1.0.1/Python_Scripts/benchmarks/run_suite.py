@@ -0,0 +1,268 @@
+# benchmarks/run_suite.py
+# Benchmark suite for the path/SAN side of the pipeline on synthetic trees.
+# - Builds (or reuses) a benchmarks.synth_tree tree per scale
+# - Runs every case in a fresh subprocess pointed at that tree (GLOSS_POST_ROOT /
+#   GLOSS_CLOUD_ROOT, HOME redirected so no real ~/.nuke caches are touched)
+# - Writes machine-readable results (p50/p95/min per call) and can compare them
+#   against a previous run, exiting 1 on regressions
+#
+# Cases: project lookup, Approved folder lookup, frame range detection,
+# Send to Approved (MOV and sequence), RETOUCH scan (cold / warm), the headless
+# stages of the RETOUCH import (scan + header probe + shot matching) and Final
+# write-path resolution, then the shot catalog (full crawl, incremental refresh of an
+# unchanged tree, catalog-backed project lookup, shot search).
+#
+# Usage:
+#   python -m benchmarks.run_suite                                   # small + medium
+#   python -m benchmarks.run_suite --scales small medium large --out bench.json
+#   python -m benchmarks.run_suite --compare baseline.json --threshold 1.25
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import platform
+import tempfile
+import subprocess
+
+DEFAULT_ROOT   = os.path.join(tempfile.gettempdir(), "gloss_bench")
+DEFAULT_SCALES = ("small", "medium")
+SAMPLES        = 20     # job codes / shots sampled per case
+REPEAT         = 3
+
+
+# ===============================
+# Cases (run inside the worker process)
+# ===============================
+def _sample(seq, n, rng):
+    seq = list(seq)
+    return seq if len(seq) <= n else rng.sample(seq, n)
+
+def _plate_pattern(tree, job, shot):
+    return os.path.join(tree["gloss_root"], job["project"], f"IN-{job['code']}",
+                        "FOOTAGE", "PLATES", shot, f"{shot}.####.exr")
+
+def _cases(tree, rng):
+    """[(case name, [zero-arg callables, one per timed call], reset callable or None), ...]"""
+    from gloss_utils import paths_nyc as P
+    from gloss_utils import sequences as S
+    from gloss_utils import quicktime, shot_names
+    from read_node.ops_read_tools import send_to_approved
+    from tools import retouch_scan, shot_catalog
+
+    jobs = tree["jobs"]
+    # Always include the last project: worst case for a linear listing
+    sampled_jobs = _sample(jobs[:-1], SAMPLES - 1, rng) + [jobs[-1]]
+    shots = [(j, s) for j in jobs for s in j["shots"]]
+    sampled_shots = _sample(shots, SAMPLES, rng)
+    cases = []
+
+    cases.append(("find_project_folder_by_job_code",
+                  [lambda c=j["code"]: P.find_project_folder_by_job_code(c) for j in sampled_jobs], None))
+
+    cases.append(("find_approved_folder",
+                  [lambda j=j: P.find_approved_folder(j["code"], j["project"], prefer="new")
+                   for j in sampled_jobs], None))
+
+    cases.append(("detect_frame_range",
+                  [lambda p=_plate_pattern(tree, j, s): S.detect_frame_range(p) for j, s in sampled_shots], None))
+
+    movs = []
+    for j in _sample(jobs, SAMPLES // 2, rng):
+        first_day = os.path.join(tree["cloud_root"], j["cloud"], "VFX-CHN", "RETOUCH")
+        day = sorted(os.listdir(first_day))[0]
+        movs.append(os.path.join(first_day, day, f"{j['shots'][0]}_CHN_v001.mov"))
+    cases.append(("send_to_approved[mov]",
+                  [lambda p=p: send_to_approved(p, overwrite=True, prefer="new") for p in movs], None))
+
+    cases.append(("send_to_approved[sequence]",
+                  [lambda p=_plate_pattern(tree, j, s): send_to_approved(p, overwrite=True, prefer="new", sequence=True)
+                   for j, s in sampled_shots[:SAMPLES // 2]], None))
+
+    scan_jobs = _sample(jobs, max(1, SAMPLES // 4), rng)
+
+    def _drop_scan_state():
+        for j in scan_jobs:
+            try:
+                os.remove(os.path.join(retouch_scan.STATE_DIR, f"{j['cloud']}.json"))
+            except OSError:
+                pass
+
+    cases.append(("scan_retouch[cold]",
+                  [lambda c=j["cloud"]: retouch_scan.scan_retouch(c) for j in scan_jobs], _drop_scan_state))
+    cases.append(("scan_retouch[warm]",
+                  [lambda c=j["cloud"]: retouch_scan.scan_retouch(c) for j in scan_jobs], None))
+
+    def _import_stage(job):
+        """What import_retouched_shots does before touching the node graph."""
+        result = retouch_scan.scan_retouch(job["cloud"], latest_only=True)
+        clips = [p for _d, paths in result["folders"] for p in paths]
+        quicktime.probe_many(clips)
+        plates = shot_names.ShotIndex((s, _plate_pattern(tree, job, s)) for s in job["shots"])
+        return [plates.first(c) for c in clips]
+
+    cases.append(("import_retouched_shots[scan+probe+match]",
+                  [lambda j=j: _import_stage(j) for j in scan_jobs], None))
+
+    def _final_write_dir(script):
+        """write_nodes.final_output: script path -> VFX-NY folder (new or FOOTAGE/ layout)."""
+        code, project = P.derive_job_from_path(script)
+        in_root = P.glosspost_in_root(project, code)
+        new_dir = os.path.join(in_root, "VFX-NY")
+        old_dir = os.path.join(in_root, "FOOTAGE", "VFX-NY")
+        return new_dir if os.path.exists(new_dir) else old_dir if os.path.exists(old_dir) else new_dir
+
+    scripts = [os.path.join(P.progress_nuke_base(j["project"]), s, "Scripts", "COMP", f"{s}_NYC_v01.nk")
+               for j, s in sampled_shots]
+    cases.append(("write_path_resolution[final]",
+                  [lambda p=p: _final_write_dir(p) for p in scripts], None))
+
+    # Last: once the catalog exists, paths_nyc lookups above would go through it
+    cases.append(("shot_catalog.crawl", [lambda: shot_catalog.ShotCatalog().crawl()], None))
+    cases.append(("shot_catalog.refresh[unchanged]", [lambda: shot_catalog.ShotCatalog().refresh()], None))
+    cases.append(("find_project_folder_by_job_code[catalog]",
+                  [lambda c=j["code"]: P.find_project_folder_by_job_code(c) for j in sampled_jobs], None))
+    cases.append(("shot_catalog.find_shots",
+                  [lambda s=s: shot_catalog.get_catalog().find_shots(s) for _j, s in sampled_shots], None))
+    return cases
+
+
+def _stats(samples_ms):
+    from gloss_utils.nuke_helpers import percentile
+    return {
+        "calls": len(samples_ms),
+        "total_ms": round(sum(samples_ms), 3),
+        "min_ms": round(min(samples_ms), 4),
+        "p50_ms": round(percentile(samples_ms, 50), 4),
+        "p95_ms": round(percentile(samples_ms, 95), 4),
+    }
+
+def run_worker(tree_root, repeat=REPEAT, seed=0):
+    with open(os.path.join(tree_root, "synth_tree.json")) as fh:
+        tree = json.load(fh)
+    rng = random.Random(seed)
+    results = []
+    for name, calls, reset in _cases(tree, rng):
+        samples = []
+        error = None
+        for _ in range(repeat):
+            if reset:
+                reset()
+            for fn in calls:
+                t0 = time.perf_counter()
+                try:
+                    fn()
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                samples.append((time.perf_counter() - t0) * 1000)
+        rec = {"case": name, **_stats(samples)}
+        if error:
+            rec["error"] = error
+        results.append(rec)
+    return results
+
+
+# ===============================
+# Driver
+# ===============================
+def run_scale(scale, root, repeat=REPEAT):
+    from benchmarks.synth_tree import SCALES, make_tree
+    tree_root = os.path.join(root, scale)
+    t0 = time.time()
+    tree = make_tree(tree_root, **SCALES[scale])
+    built = time.time() - t0
+
+    env = dict(os.environ)
+    env.update({
+        "GLOSS_POST_ROOT": tree["gloss_root"],
+        "GLOSS_CLOUD_ROOT": tree["cloud_root"],
+        "HOME": os.path.join(root, f"_home_{scale}"),
+        "PYTHONPATH": os.pathsep.join(filter(None, [_package_root(), env.get("PYTHONPATH")])),
+    })
+    env.pop("GLOSS_SPAN_LOG", None)
+    os.makedirs(env["HOME"], exist_ok=True)
+    # Fresh catalog each run: cases before "shot_catalog.crawl" measure the plain SAN paths
+    env["GLOSS_CATALOG"] = os.path.join(env["HOME"], "shot_catalog.sqlite")
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(env["GLOSS_CATALOG"] + suffix):
+            os.remove(env["GLOSS_CATALOG"] + suffix)
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.run_suite", "--worker", tree_root, "--repeat", str(repeat)],
+        env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{scale}: worker failed\n{proc.stderr}")
+    results = json.loads(proc.stdout)
+    for r in results:
+        r["scale"] = scale
+    return {"scale": scale, "params": tree["params"], "files": tree["files"],
+            "tree_build_s": round(built, 2), "results": results}
+
+def _package_root():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def compare(current, baseline, threshold):
+    """[(scale, case, baseline p50, current p50, ratio)] for cases slower than threshold x baseline."""
+    base = {(r["scale"], r["case"]): r for s in baseline["scales"] for r in s["results"]}
+    worse = []
+    for s in current["scales"]:
+        for r in s["results"]:
+            b = base.get((r["scale"], r["case"]))
+            if not b or not b["p50_ms"]:
+                continue
+            ratio = r["p50_ms"] / b["p50_ms"]
+            if ratio > threshold:
+                worse.append((r["scale"], r["case"], b["p50_ms"], r["p50_ms"], ratio))
+    return worse
+
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Benchmark pipeline path/SAN operations on synthetic trees.")
+    ap.add_argument("--scales", nargs="+", default=list(DEFAULT_SCALES))
+    ap.add_argument("--root", default=DEFAULT_ROOT, help="where synthetic trees are built/reused")
+    ap.add_argument("--repeat", type=int, default=REPEAT)
+    ap.add_argument("--out", default="gloss_bench_results.json")
+    ap.add_argument("--compare", help="previous results file; exit 1 on regressions")
+    ap.add_argument("--threshold", type=float, default=1.25, help="p50 ratio counted as a regression")
+    ap.add_argument("--worker", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.repeat)))
+        return 0
+
+    report = {
+        "meta": {"host": socket.gethostname(), "python": platform.python_version(),
+                 "platform": platform.platform(), "time": time.time(), "repeat": args.repeat},
+        "scales": [],
+    }
+    for scale in args.scales:
+        res = run_scale(scale, args.root, args.repeat)
+        report["scales"].append(res)
+        print(f"\n[{scale}] {res['params']}  ({res['files']} files)")
+        print(f"  {'case':44} {'calls':>6} {'p50 ms':>10} {'p95 ms':>10} {'min ms':>10}")
+        for r in res["results"]:
+            flag = f"  ! {r['error']}" if r.get("error") else ""
+            print(f"  {r['case']:44} {r['calls']:>6} {r['p50_ms']:>10.3f} {r['p95_ms']:>10.3f} {r['min_ms']:>10.3f}{flag}")
+
+    with open(args.out, "w") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"\nResults: {os.path.abspath(args.out)}")
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        worse = compare(report, baseline, args.threshold)
+        for scale, case, b, c, ratio in worse:
+            print(f"REGRESSION [{scale}] {case}: p50 {b:.3f} -> {c:.3f} ms ({ratio:.2f}x)")
+        if worse:
+            return 1
+        print(f"No regressions above {args.threshold:.2f}x against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+# benchmarks/synth_tree.py
+# Synthetic GlossPost / CloudSync tree for benchmarking the pipeline off the SAN.
+#
+#   <root>/GlossPost/<code>_PRJ<n>_CLOUD/
+#       IN-<code>/FOOTAGE/PLATES/<shot>/<shot>.####.exr   EXR-like frames (magic + padding)
+#       IN-<code>/APPROVED_RETOUCH/                       even projects (new layout)
+#       IN-<code>/VFX-NY/  or  IN-<code>/FOOTAGE/VFX-NY/  even / odd projects
+#       PROGRESS-<code>/NUKE/Line_up_v01.nk               lineup with one Read per shot
+#       PROGRESS-<code>/NUKE/<shot>/Scripts/COMP/<shot>_NYC_v01.nk
+#   <root>/CloudSync/<code>_PRJ<n>/
+#       VFX-CHN/RETOUCH/<date>/<shot>_CHN_v<nnn>.mov      QuickTime stubs (real moov header)
+#       FOOTAGE_CLOUD/APPROVED_RETOUCH_CLOUD/             odd projects (legacy layout)
+#
+# A manifest (synth_tree.json) records the parameters; make_tree() reuses a tree built
+# with the same parameters instead of regenerating it.
+#
+# Usage:
+#   python -m benchmarks.synth_tree /tmp/gloss_synth --projects 20 --shots 40 --frames 12
+
+import os
+import sys
+import json
+import struct
+import shutil
+import datetime
+
+MANIFEST   = "synth_tree.json"
+EXR_MAGIC  = b"\x76\x2f\x31\x01"
+FIRST_FRAME = 1001
+
+# Named sizes used by benchmarks.run_suite
+SCALES = {
+    "small":  {"projects": 10,  "shots": 20, "frames": 10, "dates": 2},
+    "medium": {"projects": 50,  "shots": 40, "frames": 10, "dates": 3},
+    "large":  {"projects": 200, "shots": 50, "frames": 5,  "dates": 4},
+}
+
+
+def job_code(i):
+    return f"{101000 + i:06d}"
+
+def project_names(i):
+    """(GlossPost project folder, CloudSync job folder) for project i."""
+    code = job_code(i)
+    return f"{code}_PRJ{i:03d}_CLOUD", f"{code}_PRJ{i:03d}"
+
+def shot_name(i, j):
+    return f"P{i:03d}_SH{j:04d}"
+
+
+# ===============================
+# File stubs
+# ===============================
+def _box(kind, payload):
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+def _rate(fps):
+    """(timescale, sample delta) as cameras write them: 24000/1001 for 23.976 etc."""
+    nominal = int(round(fps))
+    if abs(fps - nominal) > 0.001:
+        return nominal * 1000, 1001
+    return nominal * 1000, 1000
+
+def _tmcd_trak(fps, tc_frame, drop_frame, chunk_offset):
+    """Timecode track: tmcd sample entry (flags, rate, fps) + one sample at chunk_offset."""
+    ts, delta = _rate(fps)
+    tkhd = _box(b"tkhd", b"\0" * 84)
+    mdhd = _box(b"mdhd", b"\0" * 4 + struct.pack(">IIII", 0, 0, ts, delta) + b"\0" * 4)
+    hdlr = _box(b"hdlr", b"\0" * 4 + b"mhlr" + b"tmcd" + b"\0" * 12 + b"\0")
+    entry = (struct.pack(">I4s", 34, b"tmcd") + b"\0" * 6 + struct.pack(">H", 1) + b"\0" * 4
+             + struct.pack(">III", 0x1 if drop_frame else 0, ts, delta) + bytes([int(round(fps)), 0]))
+    stsd = _box(b"stsd", b"\0" * 4 + struct.pack(">I", 1) + entry)
+    stts = _box(b"stts", b"\0" * 4 + struct.pack(">III", 1, 1, delta))
+    stco = _box(b"stco", b"\0" * 4 + struct.pack(">II", 1, chunk_offset))
+    stbl = _box(b"stbl", stsd + stts + stco)
+    return _box(b"trak", tkhd + _box(b"mdia", mdhd + hdlr + _box(b"minf", stbl)))
+
+def mov_stub_bytes(frames=48, fps=23.976, width=1920, height=1080, codec=b"apch", payload=4096,
+                   tc_frame=None, drop_frame=False):
+    """
+    A QuickTime file with a real moov header (mvhd/tkhd/mdhd/hdlr/stsd/stts) and padding mdat.
+    With tc_frame set, a tmcd track starts the clip at that frame number (its sample is the
+    first 4 bytes of mdat).
+    """
+    ts, delta = _rate(fps)
+    duration = frames * delta
+    mvhd = _box(b"mvhd", b"\0" * 4 + struct.pack(">IIII", 0, 0, ts, duration) + b"\0" * 80)
+    tkhd = _box(b"tkhd", b"\0" * 76 + struct.pack(">II", width << 16, height << 16))
+    mdhd = _box(b"mdhd", b"\0" * 4 + struct.pack(">IIII", 0, 0, ts, duration) + b"\0" * 4)
+    hdlr = _box(b"hdlr", b"\0" * 4 + b"mhlr" + b"vide" + b"\0" * 12 + b"\0")
+    entry = (struct.pack(">I4s", 86, codec) + b"\0" * 6 + struct.pack(">H", 1) + b"\0" * 16
+             + struct.pack(">HH", width, height))
+    entry += b"\0" * (86 - len(entry))
+    stsd = _box(b"stsd", b"\0" * 4 + struct.pack(">I", 1) + entry)
+    stts = _box(b"stts", b"\0" * 4 + struct.pack(">III", 1, frames, delta))
+    stbl = _box(b"stbl", stsd + stts)
+    mdia = _box(b"mdia", mdhd + hdlr + _box(b"minf", stbl))
+    ftyp = _box(b"ftyp", b"qt  " + b"\0" * 4 + b"qt  ")
+    traks = _box(b"trak", tkhd + mdia)
+    data = b"\0" * payload
+    if tc_frame is not None:
+        # The tmcd track's size does not depend on the offset, so measure it with 0 first.
+        moov_size = 8 + len(mvhd) + len(traks) + len(_tmcd_trak(fps, tc_frame, drop_frame, 0))
+        traks += _tmcd_trak(fps, tc_frame, drop_frame, len(ftyp) + moov_size + 8)
+        data = struct.pack(">I", tc_frame) + data[4:]
+    moov = _box(b"moov", mvhd + traks)
+    return ftyp + moov + _box(b"mdat", data)
+
+def exr_stub_bytes(size=2048):
+    return EXR_MAGIC + b"\0" * max(0, size - len(EXR_MAGIC))
+
+def _write(path, data):
+    with open(path, "wb") as fh:
+        fh.write(data)
+
+def _lineup_text(reads):
+    out = ["Root {\n inputs 0\n}"]
+    for name, path in reads:
+        out.append(f"Read {{\n inputs 0\n file \"{path}\"\n name {name}\n}}")
+    return "\n".join(out) + "\n"
+
+
+# ===============================
+# Tree
+# ===============================
+def make_tree(root, projects=10, shots=20, frames=10, dates=2, mov_payload=4096, frame_size=2048,
+              force=False):
+    """
+    Build (or reuse) a synthetic tree under `root`. Returns the manifest:
+    {"root", "gloss_root", "cloud_root", "params", "jobs": [{"code", "project", "cloud", "shots"}], "files"}
+    """
+    params = {"projects": projects, "shots": shots, "frames": frames, "dates": dates,
+              "mov_payload": mov_payload, "frame_size": frame_size}
+    manifest_path = os.path.join(root, MANIFEST)
+    if not force:
+        try:
+            with open(manifest_path) as fh:
+                existing = json.load(fh)
+            if existing.get("params") == params:
+                return existing
+        except Exception:
+            pass
+    if os.path.isdir(root):
+        shutil.rmtree(root)
+
+    gloss_root = os.path.join(root, "GlossPost")
+    cloud_root = os.path.join(root, "CloudSync")
+    mov = mov_stub_bytes(payload=mov_payload)
+    frame = exr_stub_bytes(frame_size)
+    day0 = datetime.date(2026, 1, 5)
+    jobs, files = [], 0
+
+    for i in range(projects):
+        code = job_code(i)
+        project, cloud = project_names(i)
+        proj_dir = os.path.join(gloss_root, project)
+        in_root = os.path.join(proj_dir, f"IN-{code}")
+        nuke_dir = os.path.join(proj_dir, f"PROGRESS-{code}", "NUKE")
+        cloud_dir = os.path.join(cloud_root, cloud)
+
+        if i % 2 == 0:
+            os.makedirs(os.path.join(in_root, "APPROVED_RETOUCH"))
+            os.makedirs(os.path.join(in_root, "VFX-NY"))
+        else:
+            os.makedirs(os.path.join(cloud_dir, "FOOTAGE_CLOUD", "APPROVED_RETOUCH_CLOUD"))
+            os.makedirs(os.path.join(in_root, "FOOTAGE", "VFX-NY"))
+
+        names, reads = [], []
+        for j in range(shots):
+            shot = shot_name(i, j)
+            names.append(shot)
+            plate_dir = os.path.join(in_root, "FOOTAGE", "PLATES", shot)
+            os.makedirs(plate_dir)
+            for f in range(FIRST_FRAME, FIRST_FRAME + frames):
+                _write(os.path.join(plate_dir, f"{shot}.{f:04d}.exr"), frame)
+            files += frames
+            reads.append((f"Read{j + 1}", os.path.join(plate_dir, f"{shot}.####.exr").replace("\\", "/")))
+
+            comp_dir = os.path.join(nuke_dir, shot, "Scripts", "COMP")
+            os.makedirs(comp_dir)
+            with open(os.path.join(comp_dir, f"{shot}_NYC_v01.nk"), "w") as fh:
+                fh.write(f"Root {{\n first_frame {FIRST_FRAME}\n last_frame {FIRST_FRAME + frames - 1}\n}}\n")
+            files += 1
+
+        with open(os.path.join(nuke_dir, "Line_up_v01.nk"), "w") as fh:
+            fh.write(_lineup_text(reads))
+
+        # RETOUCH deliveries: every shot in the first date folder, then a rolling subset re-delivered
+        for d in range(dates):
+            date_dir = os.path.join(cloud_dir, "VFX-CHN", "RETOUCH", (day0 + datetime.timedelta(days=d)).isoformat())
+            os.makedirs(date_dir)
+            delivered = names if d == 0 else names[d - 1::dates]
+            for shot in delivered:
+                _write(os.path.join(date_dir, f"{shot}_CHN_v{d + 1:03d}.mov"), mov)
+            files += len(delivered)
+
+        jobs.append({"code": code, "project": project, "cloud": cloud, "shots": names})
+
+    manifest = {"root": root, "gloss_root": gloss_root, "cloud_root": cloud_root,
+                "params": params, "jobs": jobs, "files": files}
+    with open(manifest_path, "w") as fh:
+        json.dump(manifest, fh)
+    return manifest
+
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Build a synthetic GlossPost/CloudSync tree.")
+    ap.add_argument("root")
+    ap.add_argument("--scale", choices=sorted(SCALES), help="preset sizes (overridden by explicit flags)")
+    ap.add_argument("--projects", type=int)
+    ap.add_argument("--shots", type=int, help="shots per project")
+    ap.add_argument("--frames", type=int, help="EXR frames per shot")
+    ap.add_argument("--dates", type=int, help="RETOUCH date folders per job")
+    ap.add_argument("--force", action="store_true", help="rebuild even if the manifest matches")
+    args = ap.parse_args(argv)
+
+    params = dict(SCALES[args.scale or "small"])
+    for key in ("projects", "shots", "frames", "dates"):
+        if getattr(args, key) is not None:
+            params[key] = getattr(args, key)
+    m = make_tree(os.path.abspath(args.root), force=args.force, **params)
+    print(f"{m['root']}: {len(m['jobs'])} project(s), {m['files']} file(s)")
+    print(f"  GLOSS_POST_ROOT={m['gloss_root']}")
+    print(f"  GLOSS_CLOUD_ROOT={m['cloud_root']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
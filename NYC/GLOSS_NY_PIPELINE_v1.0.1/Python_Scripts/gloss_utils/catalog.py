@@ -0,0 +1,147 @@
+# gloss_utils/catalog.py
+# Read side of the shot catalog built by tools/shot_catalog.py (no Nuke needed).
+# - CatalogReader: indexed queries over jobs, shots, media and task scripts
+# - get_catalog() / lookup_job(): one read-only connection per thread for paths_nyc
+#   and the panels; they never create the database
+# Crawling and refreshing live in tools/shot_catalog.py (ShotCatalog extends CatalogReader).
+#
+# Database: ~/.nuke/gloss_cache/shot_catalog.sqlite ($GLOSS_CATALOG overrides it)
+
+import os
+import sqlite3
+import threading
+
+from gloss_utils.shot_names import parse as parse_shot_name
+
+CATALOG_ENV  = "GLOSS_CATALOG"
+CATALOG_FILE = os.environ.get(CATALOG_ENV) or os.path.expanduser("~/.nuke/gloss_cache/shot_catalog.sqlite")
+
+
+def _default_roots():
+    # Imported here: paths_nyc itself looks jobs up through this module
+    from gloss_utils.paths_nyc import GLOSS_ROOT, CLOUD_ROOT
+    return GLOSS_ROOT, CLOUD_ROOT
+
+
+class CatalogReader(object):
+    """
+    Read-only connection to the catalog. One connection per instance (use from one
+    thread, or get_catalog() which keeps one per thread).
+    """
+
+    def __init__(self, path=None, gloss_root=None, cloud_root=None):
+        if gloss_root is None or cloud_root is None:
+            default_gloss, default_cloud = _default_roots()
+            gloss_root = gloss_root or default_gloss
+            cloud_root = cloud_root or default_cloud
+        self.path = path or CATALOG_FILE
+        self.gloss_root = gloss_root
+        self.cloud_root = cloud_root
+        self.conn = self._connect()
+        self.conn.row_factory = sqlite3.Row
+
+    def _connect(self):
+        return sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def close(self):
+        self.conn.close()
+
+    def meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def matches_roots(self):
+        """False when the catalog was built for other mounts (and must not be trusted)."""
+        return (self.meta("gloss_root") == self.gloss_root) and (self.meta("cloud_root") == self.cloud_root)
+
+    def job(self, code):
+        row = self.conn.execute("SELECT * FROM jobs WHERE code = ?", (code,)).fetchone()
+        return dict(row) if row else None
+
+    def find_shots(self, text, limit=50):
+        """[{"job", "key", "name"}, ...]: exact shot key first, then keys containing it."""
+        q = parse_shot_name((text or "").strip()).key
+        if not q:
+            return []
+        rows = self.conn.execute(
+            "SELECT job, key, name FROM shots WHERE key = ? "
+            "UNION ALL SELECT job, key, name FROM shots WHERE key != ? AND instr(key, ?) > 0 "
+            "LIMIT ?", (q, q, q, limit)).fetchall()
+        return [dict(r) for r in rows]
+
+    def media(self, job, shot=None, role=None):
+        """Media rows for a job (optionally one shot key / role), newest version first."""
+        sql, args = "SELECT * FROM media WHERE job = ?", [job]
+        if shot:
+            sql, args = sql + " AND shot = ?", args + [parse_shot_name(shot).key]
+        if role:
+            sql, args = sql + " AND role = ?", args + [role]
+        return [dict(r) for r in self.conn.execute(sql + " ORDER BY version DESC, path", args)]
+
+    def scripts(self, job, shot=None, task=None):
+        """Task scripts (and lineups when shot is None), newest version first."""
+        sql, args = "SELECT * FROM scripts WHERE job = ?", [job]
+        if shot:
+            sql, args = sql + " AND shot = ?", args + [parse_shot_name(shot).key]
+        if task:
+            sql, args = sql + " AND task = ?", args + [task]
+        return [dict(r) for r in self.conn.execute(sql + " ORDER BY version DESC, path", args)]
+
+    def dir_mtime(self, path):
+        """Folder mtime recorded by the last crawl, or None when the folder is not catalogued."""
+        row = self.conn.execute("SELECT mtime FROM dirs WHERE path = ?", (path,)).fetchone()
+        return row[0] if row else None
+
+    def latest_version(self, job, shot, role):
+        """Highest DN/PreComp/Final/... version for a shot, or None."""
+        row = self.conn.execute("SELECT max(version) FROM media WHERE job = ? AND shot = ? AND role = ?",
+                                (job, parse_shot_name(shot).key, role)).fetchone()
+        return row[0] if row else None
+
+    def is_approved(self, job, shot):
+        """True when anything for the shot sits in one of the job's Approved folders."""
+        return self.conn.execute("SELECT 1 FROM media WHERE job = ? AND shot = ? AND role = 'approved' LIMIT 1",
+                                 (job, parse_shot_name(shot).key)).fetchone() is not None
+
+    def stats(self):
+        out = {t: self.conn.execute(f"SELECT count(*) FROM {t}").fetchone()[0]
+               for t in ("jobs", "shots", "media", "scripts", "dirs")}
+        out["crawled"] = float(self.meta("crawled") or 0) or None
+        out["refreshed"] = float(self.meta("refreshed") or 0) or None
+        return out
+
+
+# ===============================
+# Shared read-only access (paths_nyc, panels)
+# ===============================
+_local = threading.local()
+
+def get_catalog():
+    """
+    Read-only catalog for the current thread, or None when there is none yet or it
+    was built for other SAN mounts. Never creates the database. The mounts are checked
+    on every call (two indexed SELECTs), so a later crawl is picked up either way.
+    """
+    cat = getattr(_local, "catalog", None)
+    if cat is None:
+        if not os.path.exists(CATALOG_FILE):
+            return None
+        try:
+            cat = CatalogReader(CATALOG_FILE)
+        except sqlite3.Error:
+            return None
+        _local.catalog = cat
+    try:
+        return cat if cat.matches_roots() else None
+    except sqlite3.Error:  # created but not filled yet
+        return None
+
+def lookup_job(code):
+    """Catalog row for a job code ({"project", "cloud", "approved_new", ...}) or None."""
+    cat = get_catalog()
+    if cat is None or not code:
+        return None
+    try:
+        return cat.job(code)
+    except sqlite3.Error:
+        return None
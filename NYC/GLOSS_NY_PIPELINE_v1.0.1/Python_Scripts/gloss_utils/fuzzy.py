@@ -0,0 +1,129 @@
+# utils/fuzzy.py
+# Subsequence fuzzy matching with ranking, for filter boxes.
+# - SearchIndex precomputes lowercased text, job code and char sets once
+# - Queries are matched as subsequences ("ckfa" matches "101181_CK_FA25_Mens")
+# - Results are ranked: substring > word-boundary starts > contiguous runs > gaps
+# No Nuke / Qt dependency.
+
+from __future__ import annotations
+import re
+from typing import Iterable, List, Optional, Tuple
+
+_JOB_CODE_RE = re.compile(r"^(\d{6})")
+_SEPARATORS  = "_- ./"
+
+# --- Score weights ---
+SCORE_MATCH      = 16   # per matched character
+BONUS_CONTIGUOUS = 12   # matched right after the previous match
+BONUS_BOUNDARY   = 10   # matched at start of text or after a separator / digit-letter switch
+BONUS_SUBSTRING  = 60   # whole query found as a substring
+BONUS_PREFIX     = 40   # text starts with the query
+BONUS_JOB_CODE   = 80   # query is a prefix of the 6-digit job code
+PENALTY_GAP      = 1    # per skipped character
+
+
+class SearchEntry(object):
+    __slots__ = ("text", "lower", "chars", "boundaries", "job_code")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lower = text.lower()
+        self.chars = frozenset(self.lower)
+        self.boundaries = _boundaries(self.lower)
+        m = _JOB_CODE_RE.match(text)
+        self.job_code = m.group(1) if m else ""
+
+
+def _boundaries(lower: str) -> frozenset:
+    out = {0}
+    for i in range(1, len(lower)):
+        prev, cur = lower[i - 1], lower[i]
+        if prev in _SEPARATORS or (prev.isdigit() != cur.isdigit() and cur.isalnum()):
+            out.add(i)
+    return frozenset(out)
+
+
+def score(query: str, entry: SearchEntry) -> Optional[int]:
+    """
+    Score `entry` for an already-lowercased, separator-free `query`.
+    Returns None when the query is not a subsequence of the text.
+    """
+    if not query:
+        return 0
+    if not entry.chars.issuperset(query):
+        return None
+
+    text = entry.lower
+    total = 0
+    if entry.job_code and entry.job_code.startswith(query):
+        total += BONUS_JOB_CODE
+
+    pos = text.find(query)
+    if pos >= 0:
+        total += BONUS_SUBSTRING + SCORE_MATCH * len(query) + BONUS_CONTIGUOUS * (len(query) - 1)
+        if pos == 0:
+            total += BONUS_PREFIX
+        elif pos in entry.boundaries:
+            total += BONUS_BOUNDARY
+        return total - pos * PENALTY_GAP
+
+    # Greedy subsequence walk (str.find keeps it in C for each character).
+    prev = -1
+    for ch in query:
+        i = text.find(ch, prev + 1)
+        if i < 0:
+            return None
+        total += SCORE_MATCH
+        if i == prev + 1:
+            total += BONUS_CONTIGUOUS
+        if i in entry.boundaries:
+            total += BONUS_BOUNDARY
+        total -= (i - prev - 1) * PENALTY_GAP
+        prev = i
+    return total
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and drop separators so 'CK FA' and 'ck_fa' behave the same."""
+    q = (query or "").lower()
+    return "".join(ch for ch in q if ch not in _SEPARATORS)
+
+
+class SearchIndex(object):
+    """Precomputed entries over a list of strings; rank() returns indices best-first."""
+
+    def __init__(self, texts: Iterable[str] = ()):
+        self.entries: List[SearchEntry] = []
+        self._last_query = ""
+        self._last_hits: Optional[List[int]] = None
+        self.extend(texts)
+
+    def extend(self, texts: Iterable[str]):
+        self.entries.extend(SearchEntry(t) for t in texts)
+        self._last_hits = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def rank(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Indices of matching entries, best score first (ties keep index order)."""
+        q = normalize_query(query)
+        if not q:
+            return list(range(len(self.entries)))[:limit]
+
+        # Typing extends the query: any new match must have matched the shorter one too.
+        if self._last_hits is not None and self._last_query and q.startswith(self._last_query):
+            candidates = self._last_hits
+        else:
+            candidates = range(len(self.entries))
+
+        entries = self.entries
+        scored: List[Tuple[int, int]] = []
+        for i in candidates:
+            s = score(q, entries[i])
+            if s is not None:
+                scored.append((-s, i))
+        scored.sort()
+        out = [i for _, i in scored]
+        self._last_query, self._last_hits = q, out
+        return out[:limit] if limit else out
@@ -2,7 +2,20 @@
 utils/nuke_helpers.py — Nuke helper functions for the Gloss NYC Pipeline
 """
 
-import nuke
+import os
+import json
+import math
+import time
+import socket
+import functools
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    import nuke
+except Exception:  # headless tools (watchers, CLIs) still use the log/span helpers
+    nuke = None
 from gloss_utils import constants as C
 
 def get_selected_nodes(node_class=None):
@@ -18,28 +31,46 @@ def get_selected_nodes(node_class=None):
 def select_single_node(node):
     """
     Clears selection and selects only the given node.
+    Only touches nodes that are currently selected (no walk over allNodes()).
+    """
+    apply_selection([node])
+
+def apply_selection(nodes):
+    """
+    Make `nodes` the selection, changing only nodes whose state actually differs.
     """
-    for n in nuke.allNodes():
-        n.setSelected(False)
-    node.setSelected(True)
+    wanted = {n.fullName(): n for n in nodes}
+    for n in nuke.selectedNodes():
+        if n.fullName() not in wanted:
+            n.setSelected(False)
+        else:
+            del wanted[n.fullName()]
+    for n in wanted.values():
+        n.setSelected(True)
+
+def _emit(text):
+    if nuke is not None:
+        nuke.tprint(text)
+    else:
+        print(text)
 
 def log_info(msg):
     """
     Logs a pipeline info message in the Nuke Script Editor.
     """
-    nuke.tprint(f"{C.LOG_PREFIX} ✅ {msg}")
+    _emit(f"{C.LOG_PREFIX} ✅ {msg}")
 
 def log_warning(msg):
     """
     Logs a pipeline warning message in the Nuke Script Editor.
     """
-    nuke.tprint(f"{C.LOG_PREFIX} ⚠️ {msg}")
+    _emit(f"{C.LOG_PREFIX} ⚠️ {msg}")
 
 def log_error(msg):
     """
     Logs a pipeline error message in the Nuke Script Editor.
     """
-    nuke.tprint(f"{C.LOG_PREFIX} ❌ {msg}")
+    _emit(f"{C.LOG_PREFIX} ❌ {msg}")
 
 def safe_get_knob(node, knob_name):
     """
@@ -59,3 +90,269 @@ def connect_nodes(input_node, output_node, input_index=0):
         output_node.setInput(input_index, input_node)
     except Exception as e:
         log_error(f"Failed to connect nodes: {e}")
+
+
+# ===============================
+# Performance spans
+# ===============================
+# Every traced operation leaves one record in an in-memory ring buffer:
+#   {"op", "ts", "ms", "wait_ms", "san_calls", "items", "ok", "error", "host", "user", ...fields}
+# "ms" excludes time spent in dialogs wrapped with user_wait().
+# Set GLOSS_SPAN_LOG to also append records to a JSON-lines file; "{host}" in the
+# path is replaced with the short hostname so every workstation writes its own file
+# (e.g. /Volumes/san-04/GlossUsers/gloss_logs/spans/{host}.jsonl).
+# tools/span_report.py summarizes those files (p50/p95 per op).
+SPAN_BUFFER_SIZE = 2000
+SPAN_LOG_ENV     = "GLOSS_SPAN_LOG"
+
+_HOST = socket.gethostname().split(".")[0]
+_USER = os.environ.get("USER") or os.environ.get("USERNAME") or ""
+_spans = deque(maxlen=SPAN_BUFFER_SIZE)
+_span_local = threading.local()
+_span_log_lock = threading.Lock()
+
+
+class Span(object):
+    """One running operation. SAN call counts are inclusive of nested spans."""
+
+    def __init__(self, name, items=0, **fields):
+        self.name = name
+        self.fields = fields
+        self.items = items
+        self.san_calls = 0
+        self.wait = 0.0
+        self.error = None
+        self.start = time.time()
+        self._t0 = time.perf_counter()
+
+    def add_items(self, n=1):
+        self.items += n
+
+    def san(self, n=1):
+        stack = _span_stack()
+        if self in stack:
+            for sp in stack[:stack.index(self) + 1]:
+                sp.san_calls += n
+        else:
+            self.san_calls += n
+
+    def set(self, **fields):
+        self.fields.update(fields)
+
+    def fail(self, message):
+        """Mark the op as failed when the error is handled (and not raised) inside it."""
+        self.error = str(message)
+
+
+def _span_stack():
+    stack = getattr(_span_local, "stack", None)
+    if stack is None:
+        stack = _span_local.stack = []
+    return stack
+
+def _span_log_path():
+    path = os.environ.get(SPAN_LOG_ENV)
+    return os.path.expanduser(path.replace("{host}", _HOST)) if path else None
+
+def _record_span(sp):
+    elapsed = time.perf_counter() - sp._t0
+    rec = {
+        "op": sp.name, "ts": round(sp.start, 3),
+        "ms": round(max(0.0, elapsed - sp.wait) * 1000, 2), "wait_ms": round(sp.wait * 1000, 2),
+        "san_calls": sp.san_calls, "items": sp.items,
+        "ok": sp.error is None, "error": sp.error,
+        "host": _HOST, "user": _USER,
+    }
+    rec.update(sp.fields)
+    _spans.append(rec)
+
+    path = _span_log_path()
+    if path:
+        try:
+            line = json.dumps(rec, default=str) + "\n"
+            with _span_log_lock:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "a") as fh:
+                    fh.write(line)
+        except Exception:
+            pass  # never let logging break the op
+    return rec
+
+@contextmanager
+def span(name, items=0, **fields):
+    """
+    Time a block of work.
+
+        with span("approved.copy", shot=shot) as sp:
+            for f in files:
+                shutil.copy(f, dst)
+                sp.san()
+            sp.add_items(len(files))
+    """
+    sp = Span(name, items, **fields)
+    stack = _span_stack()
+    stack.append(sp)
+    try:
+        yield sp
+    except BaseException as e:
+        sp.error = sp.error or f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        stack.pop()
+        _record_span(sp)
+
+def traced(name=None):
+    """Decorator: run the function inside span(name or "<module>.<function>")."""
+    def deco(fn):
+        op = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(op):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+def current_span():
+    """Innermost running span on this thread (a throwaway one if there is none)."""
+    stack = _span_stack()
+    return stack[-1] if stack else Span("")
+
+def san_call(n=1):
+    """Count a filesystem round trip to the SAN against every running span on this thread."""
+    for sp in _span_stack():
+        sp.san_calls += n
+
+@contextmanager
+def user_wait():
+    """Exclude a modal dialog (nuke.message/ask) from the running spans' durations."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        dt = time.perf_counter() - t0
+        for sp in _span_stack():
+            sp.wait += dt
+
+def recent_spans(op=None):
+    """Records from the in-memory ring buffer, oldest first."""
+    return [r for r in list(_spans) if op is None or r["op"] == op]
+
+def load_span_log(path):
+    """Records from a GLOSS_SPAN_LOG file (bad lines are skipped)."""
+    out = []
+    try:
+        with open(path) as fh:
+            for line in fh:
+                try:
+                    out.append(json.loads(line))
+                except ValueError:
+                    pass
+    except OSError:
+        pass
+    return out
+
+def percentile(values, pct):
+    """Nearest-rank percentile (pct 0-100) of a list of numbers; None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, int(math.ceil(pct / 100.0 * len(ordered))) - 1))
+    return ordered[k]
+
+def span_stats(records=None):
+    """{op: {"count", "errors", "p50_ms", "p95_ms", "max_ms", "avg_san_calls", "items"}}"""
+    groups = {}
+    for r in recent_spans() if records is None else records:
+        groups.setdefault(r.get("op"), []).append(r)
+    stats = {}
+    for op, recs in groups.items():
+        ms = [r.get("ms", 0.0) for r in recs]
+        stats[op] = {
+            "count": len(recs),
+            "errors": sum(1 for r in recs if not r.get("ok", True)),
+            "p50_ms": percentile(ms, 50),
+            "p95_ms": percentile(ms, 95),
+            "max_ms": max(ms),
+            "avg_san_calls": sum(r.get("san_calls", 0) for r in recs) / float(len(recs)),
+            "items": sum(r.get("items", 0) for r in recs),
+        }
+    return stats
+
+
+# ===============================
+# Bulk node-graph operations
+# ===============================
+class BulkOperation(object):
+    """
+    Collects node-graph work for bulk_operation():
+      - create() uses nuke.nodes.<Class>: no autoplace, no properties panel,
+        no selection change and no onUserCreate callbacks per node
+      - select()/deselect_all() only record the wanted selection; it is applied once on exit
+      - delete() defers deletes to the end of the block
+    """
+
+    def __init__(self, label):
+        self.label = label
+        self.created = []
+        self._selection = None   # None = leave selection alone
+        self._deletes = []
+
+    def create(self, node_class, **knobs):
+        node = getattr(nuke.nodes, node_class)(**knobs)
+        self.created.append(node)
+        return node
+
+    def select(self, nodes, add=True):
+        nodes = list(nodes) if isinstance(nodes, (list, tuple, set)) else [nodes]
+        if self._selection is None or not add:
+            self._selection = []
+        self._selection.extend(nodes)
+
+    def deselect_all(self):
+        self._selection = []
+
+    def delete(self, node):
+        self._deletes.append(node)
+
+    def _finish(self):
+        for node in self._deletes:
+            try:
+                nuke.delete(node)
+            except Exception as e:
+                log_warning(f"{self.label}: delete failed: {e}")
+        if self._selection is not None:
+            deleted = {id(n) for n in self._deletes}
+            apply_selection([n for n in self._selection if id(n) not in deleted])
+
+
+_bulk_depth = 0
+
+@contextmanager
+def bulk_operation(label="Gloss bulk operation"):
+    """
+    One undo group + batched selection for a block of node operations.
+
+        with bulk_operation("Import RETOUCH Shots") as bulk:
+            read = bulk.create("Read", file=path, xpos=x, ypos=y)
+            bulk.select(read)
+
+    Nested blocks join the outer undo group; each applies its own deferred work.
+    """
+    global _bulk_depth
+    op = BulkOperation(label)
+    undo = None
+    if _bulk_depth == 0:
+        try:
+            undo = nuke.Undo()
+            undo.begin(label)
+        except Exception:
+            undo = None
+    _bulk_depth += 1
+    try:
+        yield op
+        op._finish()
+    finally:
+        _bulk_depth -= 1
+        if undo is not None:
+            undo.end()
@@ -15,9 +15,13 @@ try:
 except Exception:
     nuke = None
 
+from gloss_utils.nuke_helpers import san_call, user_wait
+
 # --- Roots (adjust here if your mounts change) ---
-GLOSS_ROOT = "/Volumes/san-01/GlossPost"
-CLOUD_ROOT = "/Volumes/san-01/CloudSync"
+# GLOSS_POST_ROOT / GLOSS_CLOUD_ROOT override them, e.g. on Linux render nodes
+# where the SAN is mounted elsewhere.
+GLOSS_ROOT = os.environ.get("GLOSS_POST_ROOT") or "/Volumes/san-01/GlossPost"
+CLOUD_ROOT = os.environ.get("GLOSS_CLOUD_ROOT") or "/Volumes/san-01/CloudSync"
 
 # Approved subfolders
 APPROVED_NEW_SUB   = "APPROVED_RETOUCH"          # under IN-{code}
@@ -42,12 +46,34 @@ def extract_job_code(text: str) -> Optional[str]:
 def _norm(path: str) -> str:
     return path.replace("\\", "/") if path else path
 
+# Filesystem helpers: each one is a SAN round trip, counted against the running spans.
 def _listdir_safe(path: str) -> List[str]:
+    san_call()
     try:
         return os.listdir(path)
     except Exception:
         return []
 
+def _exists(path: str) -> bool:
+    san_call()
+    return os.path.exists(path)
+
+def _isdir(path: str) -> bool:
+    san_call()
+    return os.path.isdir(path)
+
+def _catalog_folder(job_code: str, column: str) -> Optional[str]:
+    """
+    Folder name the shot catalog (gloss_utils/catalog.py) has for a job, or None.
+    Only a hint: callers confirm it on disk with one stat instead of listing a root.
+    """
+    try:
+        from gloss_utils.catalog import lookup_job  # imported late: catalog reads roots from here
+        row = lookup_job(job_code)
+    except Exception:
+        return None
+    return row.get(column) if row else None
+
 def _nuke_print(msg: str):
     if nuke:
         try:
@@ -111,6 +137,11 @@ def _ask_which_approved(new_path: str, old_path: str, creating: bool = False):
         return "new"
 
 
+def _ask_approved_waiting(new_path: str, old_path: str, creating: bool = False):
+    """_ask_which_approved, with the time the dialog is open left out of the running spans."""
+    with user_wait():
+        return _ask_which_approved(new_path, old_path, creating)
+
 
 # --- Project folder resolution ---
 def find_project_folder_by_job_code(job_code: str) -> Optional[str]:
@@ -120,6 +151,9 @@ def find_project_folder_by_job_code(job_code: str) -> Optional[str]:
     """
     if not job_code:
         return None
+    hint = _catalog_folder(job_code, "project")
+    if hint and _isdir(os.path.join(GLOSS_ROOT, hint)):
+        return hint
     for name in sorted(_listdir_safe(GLOSS_ROOT)):
         if name.startswith(job_code):
             return name
@@ -228,13 +262,16 @@ def approved_old_path(job_code: str) -> Optional[str]:
     """
     if not job_code:
         return None
-    cloud_proj = next((f for f in _listdir_safe(CLOUD_ROOT) if f.startswith(job_code)), None)
+    cloud_proj = _catalog_folder(job_code, "cloud")
+    if not (cloud_proj and _isdir(os.path.join(CLOUD_ROOT, cloud_proj))):
+        cloud_proj = next((f for f in _listdir_safe(CLOUD_ROOT) if f.startswith(job_code)), None)
     if not cloud_proj:
         return None
     p = os.path.join(CLOUD_ROOT, cloud_proj, *APPROVED_OLD_CHAIN)
     return _norm(p)
 
 def ensure_dir(path: str) -> bool:
+    san_call()
     try:
         os.makedirs(path, exist_ok=True)
         return True
@@ -242,7 +279,8 @@ def ensure_dir(path: str) -> bool:
         _nuke_print(f"[NYC PATHS] Failed to create directory: {path}\n{e}")
         return False
 
-def find_approved_folder(job_code: str, job_folder_hint: Optional[str] = None) -> Optional[str]:
+def find_approved_folder(job_code: str, job_folder_hint: Optional[str] = None,
+                         prefer: Optional[str] = None, create: bool = True) -> Optional[str]:
     """
     Locate (or create) the Approved folder for a job.
     Preference:
@@ -251,10 +289,13 @@ def find_approved_folder(job_code: str, job_folder_hint: Optional[str] = None) -
       - If both exist -> ask: New / Legacy / Cancel (default New)
       - If neither exists but both are resolvable -> ask which to create
       - If only one is resolvable -> create that one
+    prefer="new"/"old" answers the question without a dialog (headless use).
+    create=False returns the folder that would be created without creating it (dry runs).
     """
     if not job_code:
         if nuke:
-            nuke.message("❌ No job code provided.")
+            with user_wait():
+                nuke.message("❌ No job code provided.")
         return None
 
     # Resolve project folder under GlossPost
@@ -263,8 +304,8 @@ def find_approved_folder(job_code: str, job_folder_hint: Optional[str] = None) -
     new_path = approved_new_path(project_folder, job_code) if project_folder else None
     old_path = approved_old_path(job_code)
 
-    new_exists = bool(new_path and os.path.exists(new_path))
-    old_exists = bool(old_path and os.path.exists(old_path))
+    new_exists = bool(new_path and _exists(new_path))
+    old_exists = bool(old_path and _exists(old_path))
 
     # Fast paths when only one exists
     if new_exists and not old_exists:
@@ -274,27 +315,28 @@ def find_approved_folder(job_code: str, job_folder_hint: Optional[str] = None) -
 
     # Both paths exist -> ask user which to use
     if new_exists and old_exists:
-        choice = _ask_which_approved(new_path, old_path, creating=False)
+        choice = prefer or _ask_approved_waiting(new_path, old_path, creating=False)
         if choice is None:
             return None  # cancel
         return new_path if choice == "new" else old_path
 
     # Neither exists but both are resolvable -> ask which to create
     if new_path and old_path:
-        choice = _ask_which_approved(new_path, old_path, creating=True)
+        choice = prefer or _ask_approved_waiting(new_path, old_path, creating=True)
         if choice is None:
             return None  # cancel
         target = new_path if choice == "new" else old_path
-        return target if ensure_dir(target) else None
+        return target if (not create or ensure_dir(target)) else None
 
     # Only one path is resolvable -> create that one
     target = new_path or old_path
-    if target and ensure_dir(target):
+    if target and (not create or ensure_dir(target)):
         return target
 
     # Could not resolve anything
     if nuke:
-        nuke.message("❌ No valid job folder found for Approved.")
+        with user_wait():
+            nuke.message("❌ No valid job folder found for Approved.")
     return None
 
 
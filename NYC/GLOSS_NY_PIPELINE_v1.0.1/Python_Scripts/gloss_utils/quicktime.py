@@ -0,0 +1,256 @@
+# utils/quicktime.py
+# Header-only QuickTime / MP4 probe (pure Python, no ffprobe, no Nuke).
+# - Walks top-level atoms by seeking; media data (mdat) is never read
+# - Parses moov -> mvhd / trak (tkhd, mdhd, hdlr, stsd, stts, stco/co64)
+# - Returns duration, frame rate, frame count, start timecode, codec FourCC and resolution
+# - probe_many() spreads files over a thread pool (I/O bound on the SAN)
+#
+#   info = probe("/path/shot_CHNv001.mov")
+#   info.fps, info.frames, info.timecode, info.codec, info.width, info.height
+
+from __future__ import annotations
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+MOV_EXTS      = (".mov", ".mp4", ".m4v")
+PROBE_THREADS = 16
+MAX_MOOV_SIZE = 64 * 1024 * 1024  # sanity cap; real moov atoms are a few KB to a few MB
+
+_U32 = struct.Struct(">I")
+_U64 = struct.Struct(">Q")
+
+
+class MovInfo(NamedTuple):
+    duration: float            # seconds
+    fps: Optional[float]
+    frames: Optional[int]
+    timecode: Optional[str]    # "HH:MM:SS:FF" (";" before frames when drop-frame)
+    codec: Optional[str]       # video sample FourCC, e.g. "apch", "avc1"
+    width: Optional[int]
+    height: Optional[int]
+
+
+def is_movie(path: str) -> bool:
+    return (path or "").lower().endswith(MOV_EXTS)
+
+
+# ===============================
+# Atom walking
+# ===============================
+def _iter_file_atoms(fh) -> Iterator[Tuple[bytes, int, int]]:
+    """Top-level atoms as (type, payload_offset, payload_size), seeking over each body."""
+    fh.seek(0, os.SEEK_END)
+    end = fh.tell()
+    pos = 0
+    while pos + 8 <= end:
+        fh.seek(pos)
+        header = fh.read(16)
+        if len(header) < 8:
+            return
+        size = _U32.unpack_from(header, 0)[0]
+        kind = header[4:8]
+        hdr = 8
+        if size == 1:
+            if len(header) < 16:
+                return
+            size, hdr = _U64.unpack_from(header, 8)[0], 16
+        elif size == 0:
+            size = end - pos
+        if size < hdr:
+            return
+        yield kind, pos + hdr, size - hdr
+        pos += size
+
+def _iter_atoms(buf: bytes, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Child atoms inside an in-memory buffer as (type, payload_offset, payload_end)."""
+    pos = start
+    while pos + 8 <= end:
+        size = _U32.unpack_from(buf, pos)[0]
+        kind = buf[pos + 4:pos + 8]
+        hdr = 8
+        if size == 1:
+            size, hdr = _U64.unpack_from(buf, pos + 8)[0], 16
+        elif size == 0:
+            size = end - pos
+        if size < hdr or pos + size > end:
+            return
+        yield kind, pos + hdr, pos + size
+        pos += size
+
+def _find(buf, start, end, path):
+    """First atom payload (offset, end) following a path of types, or None."""
+    for kind, s, e in _iter_atoms(buf, start, end):
+        if kind == path[0]:
+            return (s, e) if len(path) == 1 else _find(buf, s, e, path[1:])
+    return None
+
+
+# ===============================
+# Box parsers
+# ===============================
+def _media_header(buf, s):
+    """mvhd/mdhd -> (timescale, duration)"""
+    if buf[s] == 1:
+        return _U32.unpack_from(buf, s + 20)[0], _U64.unpack_from(buf, s + 24)[0]
+    return _U32.unpack_from(buf, s + 12)[0], _U32.unpack_from(buf, s + 16)[0]
+
+def _stts(buf, s):
+    """-> (total samples, most common sample delta)"""
+    count = _U32.unpack_from(buf, s + 4)[0]
+    total, best, best_n = 0, None, -1
+    for i in range(count):
+        n, delta = struct.unpack_from(">II", buf, s + 8 + i * 8)
+        total += n
+        if n > best_n:
+            best, best_n = delta, n
+    return total, best
+
+def _first_chunk_offset(buf, stbl):
+    box = _find(buf, stbl[0], stbl[1], (b"stco",))
+    if box and _U32.unpack_from(buf, box[0] + 4)[0]:
+        return _U32.unpack_from(buf, box[0] + 8)[0]
+    box = _find(buf, stbl[0], stbl[1], (b"co64",))
+    if box and _U32.unpack_from(buf, box[0] + 4)[0]:
+        return _U64.unpack_from(buf, box[0] + 8)[0]
+    return None
+
+def _parse_trak(buf, s, e):
+    hdlr = _find(buf, s, e, (b"mdia", b"hdlr"))
+    mdhd = _find(buf, s, e, (b"mdia", b"mdhd"))
+    stbl = _find(buf, s, e, (b"mdia", b"minf", b"stbl"))
+    if not (hdlr and mdhd and stbl):
+        return None
+    trak = {"handler": buf[hdlr[0] + 8:hdlr[0] + 12], "stbl": stbl}
+    trak["timescale"], trak["duration"] = _media_header(buf, mdhd[0])
+
+    stsd = _find(buf, stbl[0], stbl[1], (b"stsd",))
+    if stsd and _U32.unpack_from(buf, stsd[0] + 4)[0]:
+        entry = stsd[0] + 8
+        trak["format"] = buf[entry + 4:entry + 8]
+        trak["entry"] = entry
+    stts = _find(buf, stbl[0], stbl[1], (b"stts",))
+    if stts:
+        trak["samples"], trak["delta"] = _stts(buf, stts[0])
+
+    tkhd = _find(buf, s, e, (b"tkhd",))
+    if tkhd:
+        w, h = struct.unpack_from(">II", buf, tkhd[1] - 8)
+        trak["display"] = (w >> 16, h >> 16)
+    return trak
+
+
+# ===============================
+# Timecode
+# ===============================
+def frames_to_timecode(frame: int, fps_int: int, drop: bool = False) -> Optional[str]:
+    """Frame count -> SMPTE timecode (drop-frame aware for 29.97/59.94)."""
+    if fps_int <= 0:
+        return None
+    if drop:
+        dropped = 2 if fps_int == 30 else 4 if fps_int == 60 else 0
+        per_10min = fps_int * 600 - dropped * 9
+        per_min = fps_int * 60 - dropped
+        d, m = divmod(frame, per_10min)
+        if m > dropped:
+            frame += dropped * 9 * d + dropped * ((m - dropped) // per_min)
+        else:
+            frame += dropped * 9 * d
+    ff = frame % fps_int
+    ss = (frame // fps_int) % 60
+    mm = (frame // (fps_int * 60)) % 60
+    hh = (frame // (fps_int * 3600)) % 24
+    return f"{hh:02d}:{mm:02d}:{ss:02d}{';' if drop else ':'}{ff:02d}"
+
+def _read_timecode(fh, buf, trak):
+    """Start timecode from a tmcd track: one 4-byte frame number in its first sample."""
+    entry = trak.get("entry")
+    if entry is None:
+        return None
+    flags, _timescale, _frame_dur = struct.unpack_from(">III", buf, entry + 20)
+    fps_int = buf[entry + 32]
+    offset = _first_chunk_offset(buf, trak["stbl"])
+    if offset is None or not fps_int:
+        return None
+    fh.seek(offset)
+    data = fh.read(4)
+    if len(data) < 4:
+        return None
+    return frames_to_timecode(_U32.unpack(data)[0], fps_int, bool(flags & 0x1))
+
+
+# ===============================
+# Public API
+# ===============================
+def probe(path: str) -> Optional[MovInfo]:
+    """Parse the header of one QuickTime/MP4 file. Returns None if there is no usable moov."""
+    with open(path, "rb") as fh:
+        moov = None
+        for kind, offset, size in _iter_file_atoms(fh):
+            if kind == b"moov":
+                moov = (offset, size)
+                break
+        if moov is None or moov[1] > MAX_MOOV_SIZE:
+            return None
+        fh.seek(moov[0])
+        buf = fh.read(moov[1])
+
+        timescale = duration = 0
+        mvhd = _find(buf, 0, len(buf), (b"mvhd",))
+        if mvhd:
+            timescale, duration = _media_header(buf, mvhd[0])
+
+        video = tmcd = None
+        for kind, s, e in _iter_atoms(buf, 0, len(buf)):
+            if kind != b"trak":
+                continue
+            trak = _parse_trak(buf, s, e)
+            if not trak:
+                continue
+            if trak["handler"] == b"vide" and video is None:
+                video = trak
+            elif trak["handler"] == b"tmcd" or trak.get("format") == b"tmcd":
+                tmcd = tmcd or trak
+
+        fps = frames = codec = width = height = None
+        if video:
+            if video.get("delta"):
+                fps = round(video["timescale"] / video["delta"], 3)
+            frames = video.get("samples")
+            codec = video.get("format", b"").decode("latin-1") or None
+            entry = video.get("entry")
+            if entry is not None:
+                width, height = struct.unpack_from(">HH", buf, entry + 32)
+            if not (width and height) and video.get("display"):
+                width, height = video["display"]
+            if video["timescale"]:
+                timescale, duration = video["timescale"], video["duration"]
+
+        timecode = _read_timecode(fh, buf, tmcd) if tmcd else None
+
+    return MovInfo(
+        duration=(duration / timescale) if timescale else 0.0,
+        fps=fps, frames=frames, timecode=timecode, codec=codec,
+        width=width or None, height=height or None,
+    )
+
+def _probe_safe(path):
+    try:
+        return path, probe(path)
+    except (OSError, struct.error, IndexError, ValueError):
+        return path, None
+
+def probe_many(paths: Iterable[str], workers: int = PROBE_THREADS) -> Dict[str, Optional[MovInfo]]:
+    """Probe many files in parallel. Unreadable/unsupported files map to None."""
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(paths)))) as pool:
+        return dict(pool.map(_probe_safe, paths))
+
+
+if __name__ == "__main__":
+    import sys
+    for p, info in probe_many(sys.argv[1:]).items():
+        print(f"{p}\n  {info}")
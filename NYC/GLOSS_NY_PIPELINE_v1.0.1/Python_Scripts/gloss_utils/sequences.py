@@ -9,7 +9,7 @@ from __future__ import annotations
 import os
 import re
 import glob
-from typing import Optional, Tuple, Literal, List
+from typing import Optional, Tuple, Literal, List, Dict
 
 # Try to import nuke (optional; this module still works without Nuke for testing)
 try:
@@ -235,6 +235,70 @@ def detect_frame_range(path: str) -> Optional[Tuple[int, int, int]]:
     return (min(frames), max(frames), len(frames))
 
 
+def frame_regex(path: str) -> Optional["re.Pattern[str]"]:
+    """
+    Compiled regex matching the *basenames* of the frames of `path`;
+    group 1 is the frame number. Returns None if `path` is not a sequence.
+    """
+    det = detect_pattern(path)
+    if not det:
+        return None
+    _, width, head, _, tail = det
+    head_base = os.path.basename(head)
+    return re.compile(r"^%s(-?\d{%d,})%s$" % (re.escape(head_base), width, re.escape(tail)))
+
+
+def scan_sequence(path: str) -> Dict[int, os.stat_result]:
+    """
+    One os.scandir() pass over the sequence folder.
+    Returns {frame: stat_result} for every file matching `path` (empty if none/missing).
+    """
+    path = _norm(path)
+    rx = frame_regex(path)
+    if rx is None:
+        return {}
+    folder = os.path.dirname(normalize_padding(path)) or "."
+    frames: Dict[int, os.stat_result] = {}
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                m = rx.match(entry.name)
+                if not m:
+                    continue
+                try:
+                    frames[int(m.group(1))] = entry.stat()
+                except OSError:
+                    continue
+    except OSError:
+        return {}
+    return frames
+
+
+def group_frames(names, exts: Optional[Tuple[str, ...]] = None) -> Tuple[Dict[str, Tuple[int, int, int]], List[str]]:
+    """
+    Group a directory listing into sequences without touching the disk.
+    Returns ({hash basename: (first, last, count)}, other names). Names count as
+    frames when they end in digits + extension (optionally only for `exts`) and at
+    least two share head, padding and extension; single numbered files stay in "other".
+    """
+    groups: Dict[Tuple[str, int, str], List[int]] = {}
+    singles: List[str] = []
+    for name in names:
+        m = _RE_DIGITS.match(name)
+        if not m or (exts and m.group("ext").lower() not in exts):
+            singles.append(name)
+            continue
+        num = m.group("num")
+        groups.setdefault((m.group("head"), len(num), m.group("ext")), []).append(int(num))
+    seqs: Dict[str, Tuple[int, int, int]] = {}
+    for (head, width, ext), frames in groups.items():
+        if len(frames) < 2:
+            singles.append(f"{head}{frames[0]:0{width}d}{ext}")
+            continue
+        seqs[f"{head}{'#' * width}{ext}"] = (min(frames), max(frames), len(frames))
+    return seqs, singles
+
+
 def padding_width(path: str) -> Optional[int]:
     """Convenience: return the detected padding width, or None."""
     det = detect_pattern(path)
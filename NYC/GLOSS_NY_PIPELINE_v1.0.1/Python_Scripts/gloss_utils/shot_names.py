@@ -0,0 +1,147 @@
+# utils/shot_names.py
+# One shot-name grammar for the whole pipeline.
+# Splits a clip name into:
+#   base     e.g. "SH010_Hero"          (as written)
+#   key      e.g. "sh010_hero"          (case/separator-insensitive match key)
+#   dept     "CHN" | "Comp" | "DN" | "PreComp" | "Roto" | "Track" | None
+#   version  e.g. 3 for "_v003" / "_CHN003" / "-comp-v3", else None
+#
+# The department tag (and its version) is only recognised as a trailing suffix, so a
+# department word inside the shot name ("Nike_Track_Spikes") stays part of the base.
+# A plate's own version belongs to the shot: "SH010_v002" keeps it in base and key,
+# which is what its retouch "SH010_v002_CHNv001" is matched against.
+#
+# Examples:
+#   SH010_Hero_CHNv001.mov      -> base SH010_Hero,      dept CHN,  version 1
+#   sh010-hero_comp_v12.mov     -> base sh010-hero,      dept Comp, version 12
+#   SH010_Hero_v004.mov         -> base SH010_Hero_v004, dept None, version 4
+#   Nike_Track_Spikes.mov       -> base Nike_Track_Spikes, dept None, version None
+#   .../SH010_Hero_DN_v01/SH010_Hero_DN_v01.%04d.exr  -> from the sequence folder
+#
+# Parsing is cached (LRU); ShotIndex turns a batch of clips into O(1) lookups by key.
+# No Nuke dependency.
+
+from __future__ import annotations
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Generic, Iterable, List, NamedTuple, Optional, Tuple, TypeVar
+
+from gloss_utils.sequences import detect_pattern
+
+DEPARTMENTS = ("CHN", "Comp", "DN", "PreComp", "Roto", "Track")
+MOVIE_EXTS  = (".mov", ".mp4", ".mxf", ".avi")
+
+_DEPT_CANON = {d.lower(): d for d in DEPARTMENTS}
+_SEP        = r"[_\-. ]"
+
+# base, then a trailing department tag (separator before it) with an optional version
+_RE_DEPT = re.compile(
+    rf"^(?P<base>.+?){_SEP}+(?P<dept>precomp|comp|chn|dn|roto|track)"
+    rf"(?:{_SEP}*v?(?P<ver>\d+))?$",
+    re.IGNORECASE,
+)
+# trailing version of an untagged clip: SH010_v004 (kept in the base)
+_RE_VER  = re.compile(rf"{_SEP}v(?P<ver>\d+)$", re.IGNORECASE)
+_RE_KEY_SEPS = re.compile(rf"{_SEP}+")
+
+
+class ShotName(NamedTuple):
+    base: str
+    key: str
+    dept: Optional[str]
+    version: Optional[int]
+
+    @property
+    def is_original(self) -> bool:
+        """Plate/original clip: no department tag."""
+        return self.dept is None
+
+
+def normalize_key(text: str) -> str:
+    """Lowercase and collapse separator runs to '_' so 'SH010-Hero' == 'sh010_hero'."""
+    return _RE_KEY_SEPS.sub("_", (text or "").strip().lower()).strip("_")
+
+
+@lru_cache(maxsize=8192)
+def parse(name: str) -> ShotName:
+    """Parse a clip/folder name (extension allowed, no directories)."""
+    stem = name
+    root, ext = os.path.splitext(name)
+    if ext and ext[1:].isalnum() and not ext[1:].isdigit():
+        stem = root
+
+    m = _RE_DEPT.match(stem)
+    if m:
+        ver = m.group("ver")
+        return ShotName(m.group("base"), normalize_key(m.group("base")),
+                        _DEPT_CANON[m.group("dept").lower()], int(ver) if ver else None)
+    m = _RE_VER.search(stem)
+    return ShotName(stem, normalize_key(stem), None, int(m.group("ver")) if m else None)
+
+
+def clip_name(path: str) -> str:
+    """
+    Name that identifies the shot for a file path:
+    the parent folder for image sequences, the file name for movies.
+    Path-only (never globs), so it's safe to call per node.
+    """
+    p = (path or "").replace("\\", "/")
+    base = os.path.basename(p)
+    if not base.lower().endswith(MOVIE_EXTS) and detect_pattern(p):
+        return os.path.basename(os.path.dirname(p)) or base
+    return base
+
+
+def parse_path(path: str) -> ShotName:
+    return parse(clip_name(path))
+
+
+def shot_key(path: str) -> str:
+    return parse_path(path).key
+
+
+T = TypeVar("T")
+
+
+class ShotIndex(Generic[T]):
+    """
+    Batch index: key -> [(item, ShotName), ...] built once, then O(1) per lookup.
+    Items are whatever the caller wants back (Read nodes, paths, ...).
+    """
+
+    def __init__(self, pairs: Iterable[Tuple[T, str]] = ()):
+        self._by_key: Dict[str, List[Tuple[T, ShotName]]] = {}
+        for item, path in pairs:
+            self.add(item, path)
+
+    def add(self, item: T, path: str):
+        if not path:
+            return
+        sn = parse_path(path)
+        self._by_key.setdefault(sn.key, []).append((item, sn))
+
+    def __len__(self):
+        return sum(len(v) for v in self._by_key.values())
+
+    def matches(self, key_or_path: str) -> List[Tuple[T, ShotName]]:
+        """All entries for a shot key (or a path, which is parsed first)."""
+        key = key_or_path if key_or_path in self._by_key else shot_key(key_or_path)
+        return self._by_key.get(key, [])
+
+    def original(self, key_or_path: str, exclude: Optional[T] = None) -> Optional[T]:
+        """First entry for the shot that has no department tag."""
+        for item, sn in self.matches(key_or_path):
+            if sn.is_original and item is not exclude:
+                return item
+        return None
+
+    def first(self, key_or_path: str, exclude: Optional[T] = None) -> Optional[T]:
+        """First entry for the shot, preferring the original."""
+        hit = self.original(key_or_path, exclude)
+        if hit is not None:
+            return hit
+        for item, _ in self.matches(key_or_path):
+            if item is not exclude:
+                return item
+        return None
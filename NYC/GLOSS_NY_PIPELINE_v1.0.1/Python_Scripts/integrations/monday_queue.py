@@ -0,0 +1,346 @@
+# integrations/monday_queue.py
+# Batched, coalescing Monday.com update queue.
+# - enqueue() returns immediately; a background worker sends updates
+# - Repeated changes to the same item are merged (last value per column wins)
+# - Pending updates are sent as aliased mutations, BATCH_SIZE per HTTP request
+# - Unsent updates are persisted to disk and retried with backoff while offline
+# - Items the API rejects, and whole batches refused with a 4xx, are logged by id and
+#   kept in failed_items() (not retried)
+# - tag_selected() colors the selected nodes instantly and queues the status change
+#
+# Endpoint/token come from MONDAY_API_URL (default https://api.monday.com/v2) and
+# MONDAY_API_TOKEN, so the queue can be pointed at a local stand-in HTTP server.
+# Knob names, the status column and its labels come from ny_monday_actions_min (in
+# MONDAY_DIR) when it defines them, so both paths write the same values.
+#
+# Headless:
+#   python -m integrations.monday_queue status    # show persisted pending updates
+#   python -m integrations.monday_queue flush     # send them now
+
+import os
+import sys
+import json
+import time
+import threading
+import urllib.error
+import urllib.request
+
+try:
+    import nuke  # optional; only the Nuke helpers at the bottom need it
+except Exception:
+    nuke = None
+
+API_URL       = os.environ.get("MONDAY_API_URL", "https://api.monday.com/v2")
+TOKEN_ENV     = "MONDAY_API_TOKEN"
+PENDING_FILE  = os.path.expanduser("~/.nuke/gloss_cache/monday_pending.json")
+FLUSH_DELAY   = 0.5    # seconds to wait for more changes before sending
+BATCH_SIZE    = 25     # mutations per request
+HTTP_TIMEOUT  = 20
+MAX_BACKOFF   = 60
+
+MONDAY_DIR    = os.path.expanduser("~/.nuke/MONDAY_FOR_NUKE")
+ACTIONS_MODULE = "ny_monday_actions_min"
+
+# Defaults for where a Read stores its Monday link and which column holds the main
+# status; settings() prefers the values defined by ACTIONS_MODULE.
+ITEM_KNOB     = "monday_item_id"
+BOARD_KNOB    = "monday_board_id"
+STATUS_COLUMN = os.environ.get("MONDAY_STATUS_COLUMN", "status")
+STATUS_LABELS = {"chennai": "CHN", "nyc": "NYC", "reset": ""}
+
+_settings = None
+
+def settings():
+    """{"item_knob", "board_knob", "status_column", "status_labels"}, read once from ACTIONS_MODULE."""
+    global _settings
+    if _settings is None:
+        mon = None
+        if MONDAY_DIR not in sys.path and os.path.isdir(MONDAY_DIR):
+            sys.path.append(MONDAY_DIR)
+        try:
+            import importlib
+            mon = importlib.import_module(ACTIONS_MODULE)
+        except Exception:
+            pass
+        _settings = {
+            "item_knob": getattr(mon, "ITEM_KNOB", ITEM_KNOB),
+            "board_knob": getattr(mon, "BOARD_KNOB", BOARD_KNOB),
+            "status_column": getattr(mon, "STATUS_COLUMN", STATUS_COLUMN),
+            "status_labels": dict(STATUS_LABELS, **(getattr(mon, "STATUS_LABELS", None) or {})),
+        }
+    return _settings
+
+_MUTATION = "u{i}: change_multiple_column_values(board_id: $b{i}, item_id: $i{i}, column_values: $c{i}) {{ id }}"
+
+
+def _log(msg):
+    text = f"[GLOSS MONDAY] {msg}"
+    if nuke:
+        try:
+            nuke.tprint(text)
+            return
+        except Exception:
+            pass
+    print(text)
+
+
+class TransientError(Exception):
+    """Network down, 5xx or rate limited: keep the batch and retry later."""
+
+
+class RejectedError(Exception):
+    """4xx other than 429 (bad request, bad token): resending the batch cannot succeed."""
+
+
+class UpdateQueue(object):
+    def __init__(self, api_url=API_URL, token=None, pending_file=PENDING_FILE,
+                 flush_delay=FLUSH_DELAY, batch_size=BATCH_SIZE):
+        self.api_url = api_url
+        self.token = token if token is not None else os.environ.get(TOKEN_ENV, "")
+        self.pending_file = pending_file
+        self.flush_delay = flush_delay
+        self.batch_size = batch_size
+        self._pending = {}   # (board_id, item_id) -> {column_id: value}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._backoff = 0
+        self.sent_requests = 0
+        self.failed = {}     # (board_id, item_id) -> columns the API rejected
+        self._load()
+
+    # --- persistence ---
+    def _load(self):
+        try:
+            with open(self.pending_file) as fh:
+                for board, item, cols in json.load(fh):
+                    self._pending[(str(board), str(item))] = cols
+        except Exception:
+            pass
+
+    def _persist(self):
+        """Caller holds the lock."""
+        try:
+            os.makedirs(os.path.dirname(self.pending_file), exist_ok=True)
+            tmp = self.pending_file + ".tmp"
+            with open(tmp, "w") as fh:
+                json.dump([[b, i, c] for (b, i), c in self._pending.items()], fh)
+            os.replace(tmp, self.pending_file)
+        except Exception as e:
+            _log(f"could not persist pending updates: {e}")
+
+    # --- producer side ---
+    def enqueue(self, board_id, item_id, column_values):
+        """Queue column changes for one item; merged with anything still pending for it."""
+        key = (str(board_id), str(item_id))
+        with self._lock:
+            self._pending.setdefault(key, {}).update(column_values)
+            self._persist()
+        self._wake.set()
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    def failed_items(self):
+        """Item ids whose update was rejected this session."""
+        with self._lock:
+            return sorted(item for _board, item in self.failed)
+
+    # --- sending ---
+    def _request(self, query, variables):
+        body = json.dumps({"query": query, "variables": variables}).encode("utf-8")
+        req = urllib.request.Request(self.api_url, data=body, method="POST", headers={
+            "Content-Type": "application/json",
+            "Authorization": self.token,
+        })
+        try:
+            with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT) as resp:
+                payload = json.loads(resp.read().decode("utf-8") or "{}")
+        except urllib.error.HTTPError as e:
+            if e.code == 429 or e.code >= 500:
+                raise TransientError(f"HTTP {e.code}")
+            raise RejectedError(f"HTTP {e.code} {e.reason}")
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            raise TransientError(str(e))
+        self.sent_requests += 1
+        return payload
+
+    def _send_batch(self, batch):
+        """One request for up to batch_size items. Returns keys that failed permanently."""
+        parts, params, variables = [], [], {}
+        for i, ((board, item), cols) in enumerate(batch):
+            parts.append(_MUTATION.format(i=i))
+            params.append(f"$b{i}: ID!, $i{i}: ID!, $c{i}: JSON!")
+            variables.update({f"b{i}": board, f"i{i}": item, f"c{i}": json.dumps(cols)})
+        query = f"mutation ({', '.join(params)}) {{ {' '.join(parts)} }}"
+        try:
+            payload = self._request(query, variables)
+        except RejectedError as e:
+            _log(f"batch rejected: {e}")
+            return [key for key, _cols in batch]
+
+        if any("complexity" in str(err.get("message", "")).lower() for err in payload.get("errors") or ()):
+            raise TransientError("complexity budget exhausted")
+        data = payload.get("data") or {}
+        failed = []
+        for i, (key, _cols) in enumerate(batch):
+            if not data.get(f"u{i}"):
+                failed.append(key)
+        for err in payload.get("errors") or ():
+            _log(f"update rejected: {err.get('message')}")
+        return failed
+
+    def flush(self):
+        """Send everything pending now. Returns number of items sent; raises TransientError when offline."""
+        with self._lock:
+            snapshot = list(self._pending.items())
+        sent = 0
+        for start in range(0, len(snapshot), self.batch_size):
+            batch = snapshot[start:start + self.batch_size]
+            failed = set(self._send_batch(batch))
+            with self._lock:
+                for key, cols in batch:
+                    if key in failed:
+                        self.failed[key] = cols
+                    # Only drop what we sent; newer changes that arrived meanwhile stay queued.
+                    if self._pending.get(key) == cols:
+                        del self._pending[key]
+                self._persist()
+            if failed:
+                _log(f"{len(failed)} update(s) rejected, item id(s): "
+                     f"{', '.join(sorted(item for _board, item in failed))}")
+            sent += len(batch) - len(failed)
+        return sent
+
+    # --- worker ---
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._thread = threading.Thread(target=self._run, name="GlossMondayQueue", daemon=True)
+        self._thread.start()
+        if self._pending:
+            self._wake.set()  # updates left over from an offline session
+        return self
+
+    def _run(self):
+        while True:
+            self._wake.wait(timeout=self._backoff or None)
+            self._wake.clear()
+            time.sleep(self.flush_delay)  # coalescing window
+            if not self._pending:
+                continue
+            try:
+                self.flush()
+                self._backoff = 0
+            except TransientError as e:
+                self._backoff = min(MAX_BACKOFF, (self._backoff or 2) * 2)
+                _log(f"offline ({e}); {self.pending_count()} update(s) kept, retrying in {self._backoff}s")
+            except Exception as e:
+                self._backoff = MAX_BACKOFF
+                _log(f"send failed: {e}")
+
+
+_queue = None
+
+def get_queue():
+    """Session-wide queue with its worker running."""
+    global _queue
+    if _queue is None:
+        _queue = UpdateQueue().start()
+    return _queue
+
+
+# ===============================
+# Nuke helpers
+# ===============================
+def linked_item(node):
+    """(board_id, item_id) stored on a node, or None."""
+    cfg = settings()
+    try:
+        board = node.knob(cfg["board_knob"])
+        item = node.knob(cfg["item_knob"])
+        if board is not None and item is not None and board.value() and item.value():
+            return str(board.value()), str(item.value())
+    except Exception:
+        pass
+    return None
+
+def tag_selected(status_key, color, fallback=None):
+    """
+    Color every selected node right away and queue its Monday status change.
+    Reads without a stored Monday link go through `fallback()` (the synchronous
+    Monday action, which works on the selection and can look up/create the item) one
+    node at a time: each is selected on its own for the call, then the original
+    selection is restored.
+    """
+    nodes = nuke.selectedNodes()
+    if not nodes:
+        nuke.message("Select a node to set its color.")
+        return
+    for n in nodes:
+        try:
+            n["tile_color"].setValue(color)
+        except Exception:
+            pass
+
+    cfg = settings()
+    label = cfg["status_labels"][status_key]
+    queue, unlinked = None, []
+    for n in nodes:
+        link = linked_item(n)
+        if link is None:
+            if n.Class() == "Read":
+                unlinked.append(n)
+            continue
+        queue = queue or get_queue()
+        queue.enqueue(link[0], link[1], {cfg["status_column"]: {"label": label} if label else ""})
+
+    if not (unlinked and fallback):
+        return
+    try:
+        for n in unlinked:
+            for other in nuke.selectedNodes():
+                other.setSelected(False)
+            n.setSelected(True)
+            try:
+                fallback()
+            except Exception as e:
+                _log(f"{n.name()}: Monday update failed: {e}")
+    finally:
+        for other in nuke.selectedNodes():
+            other.setSelected(False)
+        for n in nodes:
+            try:
+                n.setSelected(True)
+            except Exception:
+                pass  # deleted by the fallback
+
+
+# ===============================
+# Headless entry point
+# ===============================
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Monday update queue.")
+    ap.add_argument("cmd", choices=("status", "flush"))
+    args = ap.parse_args(argv)
+
+    q = UpdateQueue()
+    if args.cmd == "status":
+        print(f"{q.pending_count()} pending update(s) in {q.pending_file}")
+        return 0
+    try:
+        sent = q.flush()
+    except TransientError as e:
+        print(f"offline: {e}; {q.pending_count()} update(s) kept")
+        return 1
+    print(f"sent {sent} update(s) in {q.sent_requests} request(s)")
+    if q.failed:
+        print(f"rejected item id(s): {', '.join(q.failed_items())}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
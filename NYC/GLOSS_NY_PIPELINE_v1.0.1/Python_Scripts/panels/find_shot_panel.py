@@ -1,9 +1,245 @@
 """
-Minimal floating panel with a search box and clear button.
-Filters Read nodes by name or filename and selects the first match.
+Minimal floating panel with a search box, clear and next/previous buttons.
+Finds Read nodes by name or file basename using a token + trigram index,
+ranks the matches and selects them, centering on the current one.
+"All Lineups" looks the shot up in the offline cross-lineup index
+(tools/lineup_index.py) without opening any other script.
 """
-import os, re, nuke, nukescripts
+import os, re, threading, nuke, nukescripts
 
+SEARCH_DEBOUNCE_MS = 150
+LINEUP_HITS_SHOWN  = 12
+_TOKEN_SPLIT = re.compile(r"[^a-z0-9]+")
+
+# Rank weights (higher is better)
+RANK_EXACT_NAME   = 100
+RANK_EXACT_TOKEN  = 80
+RANK_TOKEN_PREFIX = 60
+RANK_IN_NAME      = 40
+RANK_IN_FILE      = 20
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class ReadSearchIndex(object):
+    """
+    Token + trigram index over Read node names and file basenames.
+    Entries are keyed by node name; the index only changes when told to
+    (add/remove), so typing never touches the node graph.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.entries = {}     # key -> (name_lower, file_lower, tokens)
+        self._trigrams = {}   # trigram -> set(keys)
+        self._tokens = {}     # token -> set(keys)
+
+    def add(self, key, name, path):
+        self.remove(key)
+        name_l = (name or "").lower()
+        file_l = os.path.basename(path or "").lower()
+        tokens = {t for t in _TOKEN_SPLIT.split(name_l + " " + file_l) if t}
+        self.entries[key] = (name_l, file_l, tokens)
+        for tri in _trigrams(name_l) | _trigrams(file_l):
+            self._trigrams.setdefault(tri, set()).add(key)
+        for tok in tokens:
+            self._tokens.setdefault(tok, set()).add(key)
+
+    def remove(self, key):
+        old = self.entries.pop(key, None)
+        if not old:
+            return
+        name_l, file_l, tokens = old
+        for tri in _trigrams(name_l) | _trigrams(file_l):
+            s = self._trigrams.get(tri)
+            if s:
+                s.discard(key)
+        for tok in tokens:
+            s = self._tokens.get(tok)
+            if s:
+                s.discard(key)
+
+    def _candidates(self, q):
+        if len(q) >= 3:
+            sets = [self._trigrams.get(t, ()) for t in _trigrams(q)]
+            if not all(sets):
+                return set()
+            sets.sort(key=len)
+            out = set(sets[0])
+            for s in sets[1:]:
+                out &= s
+            return out
+        # Too short for trigrams: any token starting with q, plus a substring scan.
+        out = set()
+        for tok, keys in self._tokens.items():
+            if tok.startswith(q):
+                out |= keys
+        out.update(k for k, (n, f, _) in self.entries.items() if q in n or q in f)
+        return out
+
+    def search(self, query):
+        """Keys matching `query`, best first."""
+        q = (query or "").strip().lower()
+        if not q:
+            return []
+        ranked = []
+        for key in self._candidates(q):
+            name_l, file_l, tokens = self.entries[key]
+            if name_l == q:
+                score = RANK_EXACT_NAME
+            elif q in tokens:
+                score = RANK_EXACT_TOKEN
+            elif any(t.startswith(q) for t in tokens):
+                score = RANK_TOKEN_PREFIX
+            elif q in name_l:
+                score = RANK_IN_NAME
+            elif q in file_l:
+                score = RANK_IN_FILE
+            else:
+                continue  # trigram false positive
+            ranked.append((-score, name_l, key))
+        ranked.sort()
+        return [key for _, _, key in ranked]
+
+
+# ===============================
+# Live index of the current script
+# ===============================
+_index = ReadSearchIndex()
+_pending = set()        # node names created/changed since the last query
+_needs_rebuild = True   # first use, renames, script changes
+_callbacks_installed = False
+
+
+def _read_file(node):
+    try:
+        return node["file"].value()
+    except Exception:
+        return ""
+
+def _top_level_key(node):
+    """Index key for a root-level Read, None for Reads inside groups (never indexed)."""
+    key = node.fullName()
+    return None if "." in key else key
+
+def _on_create():
+    try:
+        key = _top_level_key(nuke.thisNode())
+        if key:
+            _pending.add(key)
+    except Exception:
+        pass
+
+def _on_destroy():
+    try:
+        key = nuke.thisNode().fullName()
+        _pending.discard(key)
+        _index.remove(key)
+    except Exception:
+        pass
+
+def _on_knob_changed():
+    global _needs_rebuild
+    try:
+        k = nuke.thisKnob()
+        if k is None:
+            return
+        if k.name() == "file":
+            key = _top_level_key(nuke.thisNode())
+            if key:
+                _pending.add(key)
+        elif k.name() == "name":
+            _needs_rebuild = True  # old key is unknown
+    except Exception:
+        pass
+
+def _on_script_change():
+    global _needs_rebuild
+    _needs_rebuild = True
+
+def install_callbacks():
+    """Keep the index in step with Read create/delete/file changes (idempotent)."""
+    global _callbacks_installed
+    if _callbacks_installed:
+        return
+    nuke.addOnCreate(_on_create, nodeClass="Read")
+    nuke.addOnDestroy(_on_destroy, nodeClass="Read")
+    nuke.addKnobChanged(_on_knob_changed, nodeClass="Read")
+    nuke.addOnScriptLoad(_on_script_change)
+    nuke.addOnScriptClose(_on_script_change)
+    _callbacks_installed = True
+
+def current_index():
+    """
+    The Read index (root-level Reads, the same scope the callbacks track),
+    rebuilt or patched only where something changed.
+    """
+    global _needs_rebuild
+    if _needs_rebuild:
+        _index.clear()
+        for node in nuke.allNodes("Read"):
+            _index.add(node.fullName(), node.name(), _read_file(node))
+        _pending.clear()
+        _needs_rebuild = False
+    elif _pending:
+        for key in list(_pending):
+            node = nuke.toNode(key)
+            if node is not None:
+                _index.add(key, node.name(), _read_file(node))
+        _pending.clear()
+    return _index
+
+
+_lineup_crawl_started = False
+
+def _refresh_lineup_index_async(idx):
+    """Incremental recrawl of the lineup index once per session, off the main thread."""
+    global _lineup_crawl_started
+    if _lineup_crawl_started:
+        return
+    _lineup_crawl_started = True
+
+    def _bg():
+        try:
+            stats = idx.crawl()
+            idx.save()
+            nuke.executeInMainThread(nuke.tprint, args=(
+                f"[GLOSS NYC] Lineup index: {stats['lineups']} lineups, {stats['parsed']} re-read "
+                f"in {stats['elapsed']:.1f}s",))
+        except Exception as e:
+            nuke.executeInMainThread(nuke.tprint, args=(f"[GLOSS NYC] Lineup index crawl failed: {e}",))
+
+    threading.Thread(target=_bg, name="GlossLineupIndex", daemon=True).start()
+
+
+def _catalog_status(keyword):
+    """Status text from the shot catalog (gloss_utils/catalog.py) for shots in no lineup."""
+    try:
+        from gloss_utils.catalog import get_catalog
+        cat = get_catalog()
+        if cat is None:
+            return None
+        hits = cat.find_shots(keyword, limit=LINEUP_HITS_SHOWN)
+        lines = []
+        for h in hits:
+            script = next(iter(cat.scripts(h["job"], h["key"])), None)
+            where = os.path.basename(script["path"]) if script else "no task script"
+            flag = "  (approved)" if cat.is_approved(h["job"], h["key"]) else ""
+            lines.append(f"{h['job']}  {h['name']}  {where}{flag}")
+    except Exception:
+        return None
+    if not lines:
+        return None
+    return f"In no lineup; {len(lines)} catalog shot(s):\n" + "\n".join(lines)
+
+
+# ===============================
+# Panel
+# ===============================
 class ShotFinderPanel(nukescripts.PythonPanel):
     def __init__(self):
         super(ShotFinderPanel, self).__init__("Find Shot in Lineup")
@@ -11,40 +247,119 @@ class ShotFinderPanel(nukescripts.PythonPanel):
         self.addKnob(self.search_knob)
         self.clear_btn = nuke.PyScript_Knob("clear", "Clear")
         self.addKnob(self.clear_btn)
-        self.all_reads = list(nuke.allNodes("Read"))
+        self.prev_btn = nuke.PyScript_Knob("prev", "< Prev")
+        self.addKnob(self.prev_btn)
+        self.next_btn = nuke.PyScript_Knob("next", "Next >")
+        self.addKnob(self.next_btn)
+        self.lineups_btn = nuke.PyScript_Knob("all_lineups", "All Lineups")
+        self.addKnob(self.lineups_btn)
+        self.status_knob = nuke.Text_Knob("status", "", "")
+        self.addKnob(self.status_knob)
+
+        install_callbacks()
+        self.matches = []      # ranked node keys
+        self.current = -1
+        self._timer = self._make_timer()
+
+    def _make_timer(self):
+        try:
+            try:
+                from PySide6 import QtCore
+            except Exception:
+                from PySide2 import QtCore
+            t = QtCore.QTimer()
+            t.setSingleShot(True)
+            t.setInterval(SEARCH_DEBOUNCE_MS)
+            t.timeout.connect(self._run_search)
+            return t
+        except Exception:
+            return None  # no Qt: search immediately
 
     def knobChanged(self, knob):
         if knob is self.search_knob:
-            keyword = self.search_knob.value().strip()
-            self._filter_and_select(keyword)
+            if self._timer is not None:
+                self._timer.start()  # restarts while typing
+            else:
+                self._run_search()
         elif knob is self.clear_btn:
             self.search_knob.setValue("")
             self._clear_selection()
+        elif knob is self.next_btn:
+            self._step(1)
+        elif knob is self.prev_btn:
+            self._step(-1)
+        elif knob is self.lineups_btn:
+            self._search_all_lineups()
+
+    def _run_search(self):
+        self._filter_and_select(self.search_knob.value().strip())
 
     def _filter_and_select(self, keyword: str):
         if not keyword:
             self._clear_selection()
             return
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-        found = False
-        for node in self.all_reads:
-            try:
-                name = node.name()
-                path = node["file"].value()
-                filename = os.path.basename(path)
-                match = pattern.search(name) or pattern.search(filename)
-                node.setSelected(bool(match))
-                if match and not found:
-                    found = True
-                    nuke.zoomToFitSelected()
-            except Exception:
-                continue
-        if not found:
-            nuke.message(f"No Read nodes found for: {keyword}")
+        self.matches = current_index().search(keyword)
+        self._apply_selection(set(self.matches))
+        if not self.matches:
+            self.current = -1
+            self.status_knob.setValue(f"No Read nodes found for: {keyword}")
+            return
+        self.current = 0
+        self._focus_current()
+
+    def _step(self, delta):
+        if not self.matches:
+            return
+        self.current = (self.current + delta) % len(self.matches)
+        self._focus_current()
+
+    def _focus_current(self):
+        key = self.matches[self.current]
+        node = nuke.toNode(key)
+        self.status_knob.setValue(f"{self.current + 1} / {len(self.matches)}   {key}")
+        if node is None:
+            return
+        try:
+            x = node.xpos() + node.screenWidth() / 2
+            y = node.ypos() + node.screenHeight() / 2
+            nuke.zoom(nuke.zoom() or 1, [x, y])
+        except Exception:
+            pass
+
+    def _search_all_lineups(self):
+        keyword = self.search_knob.value().strip()
+        if not keyword:
+            return
+        from tools import lineup_index
+        idx = lineup_index.get_index()
+        hits = idx.find(keyword, limit=LINEUP_HITS_SHOWN)
+        if hits:
+            lines = [f"{idx.data['lineups'][l]['project']}  v{v:02d}  {node}" for l, v, node, _ in hits]
+            self.status_knob.setValue(f"In {len(hits)} lineup Read(s):\n" + "\n".join(lines))
+        else:
+            self.status_knob.setValue(_catalog_status(keyword) or f"Not in any indexed lineup: {keyword}")
+        _refresh_lineup_index_async(idx)
+
+    def _apply_selection(self, wanted):
+        """
+        Only touch nodes whose selected state actually changes. The current selection
+        is read on every call: the artist may have clicked in the DAG since the last search.
+        """
+        selected = {n.fullName() for n in nuke.selectedNodes("Read")}
+        for key in selected - wanted:
+            node = nuke.toNode(key)
+            if node is not None:
+                node.setSelected(False)
+        for key in wanted - selected:
+            node = nuke.toNode(key)
+            if node is not None:
+                node.setSelected(True)
 
     def _clear_selection(self):
-        for node in self.all_reads:
-            node.setSelected(False)
+        self.matches = []
+        self.current = -1
+        self.status_knob.setValue("")
+        self._apply_selection(set())
 
     def showModal(self):
         try:
@@ -0,0 +1,261 @@
+# proxies/make_proxies.py
+# Headless dailies/proxy generator for Gloss output sequences.
+# - Takes any EXR/DPX/PNG/TIF sequence (printf, hash or digit style path)
+# - Writes half or quarter resolution 8-bit JPEG/PNG proxies
+# - Applies a simple view transform (linear -> sRGB/Rec709 for EXR)
+# - Spreads frames over a process pool
+# - Only regenerates frames whose source is newer than the existing proxy
+# - From Nuke, runs as a separate standalone python process (never forks/spawns the
+#   Nuke process itself); $GLOSS_PYTHON picks the interpreter, else python3 on PATH
+#
+# Layout (the proxy folder keeps the shot folder name, so shot detection still works):
+#   .../DN/shot_DN_v01/shot_DN_v01.%04d.exr
+#   .../DN/_proxy_half/shot_DN_v01/shot_DN_v01.%04d.jpg
+#
+# Backends (first available wins): OpenImageIO python module, then the ffmpeg CLI.
+
+import os
+import sys
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from gloss_utils.sequences import detect_pattern, normalize_padding, resolve_frame_path, scan_sequence
+
+try:
+    import OpenImageIO as oiio  # optional
+except Exception:
+    oiio = None
+
+SCALES       = {"half": 2, "quarter": 4}
+FORMATS      = ("jpg", "png")
+VIEWS        = ("auto", "srgb", "rec709", "none")
+LINEAR_EXTS  = (".exr",)
+PROXY_PREFIX = "_proxy_"
+PYTHON_ENV   = "GLOSS_PYTHON"
+
+
+def _log(msg):
+    print(f"[GLOSS PROXY] {msg}", flush=True)
+
+
+# ===============================
+# Paths
+# ===============================
+def proxy_path_for(src_path, scale="half", fmt="jpg"):
+    """Printf-style proxy path for a source sequence path."""
+    src = normalize_padding((src_path or "").replace("\\", "/"))
+    seq_dir = os.path.dirname(src)
+    parent, shot_dir = os.path.split(seq_dir)
+    base = os.path.basename(src)
+    stem = base[: base.rfind(".")] if "." in base else base
+    return "/".join([parent, f"{PROXY_PREFIX}{scale}", shot_dir, f"{stem}.{fmt}"])
+
+def frames_to_update(src_path, proxy_path):
+    """
+    Frames whose proxy is missing or older than the source.
+    One directory scan each for the source and proxy folders.
+    """
+    src_frames = scan_sequence(src_path)
+    proxy_frames = scan_sequence(proxy_path)
+    stale = []
+    for f, st in sorted(src_frames.items()):
+        pst = proxy_frames.get(f)
+        if pst is None or pst.st_mtime < st.st_mtime:
+            stale.append(f)
+    return stale
+
+
+# ===============================
+# Backends
+# ===============================
+def available_backend():
+    if oiio is not None:
+        return "oiio"
+    if shutil.which("ffmpeg"):
+        return "ffmpeg"
+    return None
+
+def _view_for(src, view):
+    if view != "auto":
+        return view
+    return "srgb" if src.lower().endswith(LINEAR_EXTS) else "none"
+
+def _transcode_oiio(src, dst, factor, view):
+    buf = oiio.ImageBuf(src)
+    spec = buf.spec()
+    nch = min(spec.nchannels, 3)
+    if nch != spec.nchannels:
+        buf = oiio.ImageBufAlgo.channels(buf, tuple(range(nch)))
+    w, h = max(1, spec.width // factor), max(1, spec.height // factor)
+    buf = oiio.ImageBufAlgo.resize(buf, roi=oiio.ROI(0, w, 0, h, 0, 1, 0, nch))
+    if view == "srgb":
+        buf = oiio.ImageBufAlgo.colorconvert(buf, "linear", "sRGB")
+    elif view == "rec709":
+        buf = oiio.ImageBufAlgo.colorconvert(buf, "linear", "Rec709")
+    buf.set_write_format(oiio.UINT8)
+    if not buf.write(dst):
+        raise RuntimeError(buf.geterror() or f"write failed: {dst}")
+
+def _transcode_ffmpeg(src, dst, factor, view):
+    cmd = ["ffmpeg", "-v", "error", "-y"]
+    if view == "srgb":
+        cmd += ["-apply_trc", "iec61966_2_1"]
+    elif view == "rec709":
+        cmd += ["-apply_trc", "bt709"]
+    cmd += ["-i", src, "-vf", f"scale=iw/{factor}:ih/{factor}:flags=area", "-frames:v", "1"]
+    if dst.lower().endswith(".jpg"):
+        cmd += ["-q:v", "2"]
+    else:
+        cmd += ["-pix_fmt", "rgb24"]
+    cmd.append(dst)
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError((proc.stdout or "").strip() or f"ffmpeg exit {proc.returncode}")
+
+def _transcode_frame(job):
+    """Process-pool worker. job = (frame, src, dst, factor, view, backend)."""
+    frame, src, dst, factor, view, backend = job
+    try:
+        tmp = dst + ".tmp" + os.path.splitext(dst)[1]
+        if backend == "oiio":
+            _transcode_oiio(src, tmp, factor, view)
+        else:
+            _transcode_ffmpeg(src, tmp, factor, view)
+        os.replace(tmp, dst)  # readers never see a half-written proxy
+        return frame, None
+    except Exception as e:
+        return frame, str(e)
+
+
+# ===============================
+# Public API
+# ===============================
+def make_proxies(src_path, scale="half", fmt="jpg", view="auto", workers=None,
+                 force=False, on_progress=None):
+    """
+    Generate proxies for one sequence. Returns {"proxy", "updated", "skipped", "failed"}.
+    `on_progress(done, total)` is called after every frame.
+    """
+    if scale not in SCALES:
+        raise ValueError(f"scale must be one of {sorted(SCALES)}")
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}")
+    if not detect_pattern(src_path):
+        raise ValueError(f"Not a sequence path: {src_path}")
+    backend = available_backend()
+    if backend is None:
+        raise RuntimeError("No proxy backend: install OpenImageIO (python) or ffmpeg.")
+
+    proxy = proxy_path_for(src_path, scale, fmt)
+    all_frames = sorted(scan_sequence(src_path))
+    frames = all_frames if force else frames_to_update(src_path, proxy)
+    result = {"proxy": proxy, "updated": [], "skipped": len(all_frames) - len(frames), "failed": {}}
+    if not frames:
+        return result
+
+    os.makedirs(os.path.dirname(proxy), exist_ok=True)
+    factor = SCALES[scale]
+    view = _view_for(src_path, view)
+    jobs = [(f, resolve_frame_path(src_path, f), resolve_frame_path(proxy, f), factor, view, backend)
+            for f in frames]
+
+    workers = max(1, int(workers or os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = [pool.submit(_transcode_frame, j) for j in jobs]
+        for i, fut in enumerate(as_completed(futures), 1):
+            frame, err = fut.result()
+            if err:
+                result["failed"][frame] = err
+            else:
+                result["updated"].append(frame)
+            if on_progress:
+                on_progress(i, len(jobs))
+    result["updated"].sort()
+    return result
+
+
+# ===============================
+# Nuke entry point
+# ===============================
+def standalone_python():
+    """A real python interpreter for the headless run (inside Nuke sys.executable is Nuke)."""
+    return os.environ.get(PYTHON_ENV) or shutil.which("python3") or shutil.which("python")
+
+def headless_command(paths, scale="half", python=None):
+    """(argv, env) running this module's CLI in a standalone interpreter."""
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    argv = [python or standalone_python(), "-m", "proxies.make_proxies", *paths, "--scale", scale]
+    return argv, env
+
+def make_proxies_for_selected(scale="half"):
+    """
+    Menu entry: proxies for the selected Read/Write sequences. The work runs in a
+    separate python process (a process pool inside the Nuke GUI would fork a threaded
+    Qt process, or relaunch Nuke as every worker on macOS); a thread waits for it.
+    """
+    import threading
+    import nuke
+
+    paths = []
+    for n in nuke.selectedNodes():
+        if n.Class() in ("Read", "Write"):
+            p = nuke.filename(n)
+            if p and detect_pattern(p) and not p.lower().endswith((".mov", ".mp4")):
+                paths.append(p)
+    if not paths:
+        nuke.message("Select Read or Write nodes with image sequences.")
+        return
+    python = standalone_python()
+    if not python:
+        nuke.message(f"No standalone python found for proxies.\nSet ${PYTHON_ENV} or put python3 on PATH.")
+        return
+    argv, env = headless_command(paths, scale, python)
+
+    def _bg():
+        try:
+            proc = subprocess.run(argv, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            out = (proc.stdout or "").strip() or f"exit {proc.returncode}"
+        except Exception as e:
+            out = str(e)
+        msg = "Proxies done:\n\n" + out.replace("[GLOSS PROXY] ", "")
+        nuke.executeInMainThread(nuke.tprint, args=(msg,))
+        nuke.executeInMainThread(nuke.message, args=(msg,))
+
+    threading.Thread(target=_bg, name="GlossProxies", daemon=True).start()
+
+
+# ===============================
+# Headless entry point
+# ===============================
+def main(argv=None):
+    """python -m proxies.make_proxies SEQ_PATH [SEQ_PATH ...] [--scale half|quarter] [--format jpg|png]"""
+    import argparse
+    ap = argparse.ArgumentParser(description="Generate 8-bit proxies for Gloss output sequences.")
+    ap.add_argument("paths", nargs="+", help="sequence path, e.g. /path/shot.%%04d.exr")
+    ap.add_argument("--scale", choices=sorted(SCALES), default="half")
+    ap.add_argument("--format", choices=FORMATS, default="jpg")
+    ap.add_argument("--view", choices=VIEWS, default="auto")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--force", action="store_true", help="regenerate every frame")
+    args = ap.parse_args(argv)
+
+    failed = False
+    for p in args.paths:
+        try:
+            r = make_proxies(p, args.scale, args.format, args.view, args.workers, args.force)
+        except Exception as e:
+            _log(f"{p}: {e}")
+            failed = True
+            continue
+        _log(f"{p} -> {r['proxy']}: {len(r['updated'])} new, {r['skipped']} up to date, {len(r['failed'])} failed")
+        for frame, err in sorted(r["failed"].items())[:10]:
+            _log(f"  frame {frame}: {err}")
+        failed = failed or bool(r["failed"])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
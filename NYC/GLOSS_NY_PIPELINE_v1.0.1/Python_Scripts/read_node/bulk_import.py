@@ -0,0 +1,98 @@
+# read_node/bulk_import.py
+# Bulk Read creation for the RETOUCH and Approved imports.
+# - nuke.nodes.Read(...) instead of nuke.createNode: no per-node selection changes, no autoplace,
+#   no onUserCreate hook per node
+# - Everything happens inside one bulk_operation (one Ctrl+Z removes the whole import,
+#   the new Reads become the selection in a single pass at the end)
+# - Positions are computed up front by the caller; backdrops are sized from those
+#   positions instead of querying each node
+# - nuke.nodes.Read does not detect the frame range, so specs without first/last get it
+#   from the sequence listing or the QuickTime header (probed in parallel, before the undo group)
+# - The Gloss UI is attached lazily the first time a node's panel is opened
+#   (the Reads are marked here; read_node.ui_read_panel installs it on marked Reads only)
+
+from gloss_utils import quicktime
+from gloss_utils.sequences import detect_frame_range
+from gloss_utils.nuke_helpers import log_warning, bulk_operation
+from read_node.ui_read_panel import mark_for_lazy_ui
+
+# Default Read tile size in the DAG (used for layout without asking each node)
+READ_W, READ_H = 80, 78
+
+BACKDROP_MARGIN_X, BACKDROP_MARGIN_Y = 100, 60
+
+
+def _frame_ranges(specs):
+    """{file: (first, last)} for specs that don't set first/last themselves."""
+    todo = [s["file"] for s in specs if "first" not in (s.get("knobs") or {})]
+    movs = [f for f in todo if quicktime.is_movie(f)]
+    ranges = {}
+    for path, info in quicktime.probe_many(movs).items():
+        if info and info.frames:
+            ranges[path] = (1, info.frames)
+    for path in todo:
+        if path not in ranges and not quicktime.is_movie(path):
+            try:
+                found = detect_frame_range(path)
+            except Exception:
+                found = None
+            if found:
+                ranges[path] = found[:2]
+    return ranges
+
+def _make_read(bulk, spec, frame_range=None):
+    node = bulk.create("Read", file=spec["file"], xpos=int(spec.get("xpos", 0)), ypos=int(spec.get("ypos", 0)))
+    knobs = dict(spec.get("knobs") or {})
+    if frame_range:
+        first, last = frame_range
+        knobs = {"first": first, "last": last, "origfirst": first, "origlast": last, **knobs}
+    for name, value in knobs.items():
+        node[name].setValue(value)
+    mark_for_lazy_ui(node)
+    return node
+
+def _make_backdrop(bulk, label, specs, color):
+    min_x = min(s["xpos"] for s in specs)
+    max_x = max(s["xpos"] for s in specs) + READ_W
+    min_y = min(s["ypos"] for s in specs)
+    max_y = max(s["ypos"] for s in specs) + READ_H
+    return bulk.create(
+        "BackdropNode",
+        label=label,
+        note_font_size=30,
+        tile_color=color,
+        z_order=-1,
+        xpos=min_x - BACKDROP_MARGIN_X,
+        ypos=min_y - BACKDROP_MARGIN_Y,
+        bdwidth=(max_x - min_x) + 2 * BACKDROP_MARGIN_X,
+        bdheight=(max_y - min_y) + 2 * BACKDROP_MARGIN_Y,
+    )
+
+def create_reads(specs, backdrops=None, undo_label="Import Reads"):
+    """
+    Create many Read nodes in one undo group.
+
+    specs:     [{"file": path, "xpos": int, "ypos": int, "knobs": {name: value}}, ...]
+               (first/last are detected from disk when "knobs" doesn't set them)
+    backdrops: [(label, [spec, ...], tile_color), ...] sized from the spec positions
+
+    Returns (nodes, errors): nodes line up with specs (None where creation failed),
+    errors is [(file, message), ...].
+    """
+    nodes, errors = [], []
+    ranges = _frame_ranges(specs)
+    with bulk_operation(undo_label) as bulk:
+        for spec in specs:
+            try:
+                nodes.append(_make_read(bulk, spec, ranges.get(spec["file"])))
+            except Exception as e:
+                nodes.append(None)
+                errors.append((spec.get("file"), str(e)))
+        for label, members, color in backdrops or ():
+            if members:
+                try:
+                    _make_backdrop(bulk, label, members, color)
+                except Exception as e:
+                    log_warning(f"Backdrop '{label}' failed: {e}")
+        bulk.select([n for n in nodes if n is not None], add=False)
+    return nodes, errors
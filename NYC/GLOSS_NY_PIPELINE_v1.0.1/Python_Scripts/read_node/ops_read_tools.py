@@ -3,9 +3,16 @@ import re
 import glob
 import shutil
 import subprocess
-import nuke
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import nuke
+except Exception:  # headless use through tools.gloss_cli: only the path-based functions work
+    nuke = None
 
 from gloss_utils import constants as C
+from gloss_utils import shot_names
+from gloss_utils import quicktime
 from gloss_utils.nuke_helpers import (
     get_selected_nodes,
     select_single_node,
@@ -14,6 +21,11 @@ from gloss_utils.nuke_helpers import (
     log_error,
     safe_get_knob,
     connect_nodes,
+    bulk_operation,
+    traced,
+    user_wait,
+    current_span,
+    san_call,
 )
 
 
@@ -26,7 +38,9 @@ try:
         get_glob_pattern,
         resolve_frame_path,
         is_sequence,
+        is_sequence_path,
         derive_shot_from_sequence_dir,
+        detect_frame_range,
     )
 except Exception as e:
     log_warning(f"Sequence utils not fully available yet: {e}")
@@ -41,10 +55,11 @@ except Exception as e:
     def resolve_frame_path(path: str, frame: int) -> str:
         path = normalize_padding(path)
         return re.sub(r'%0(\d+)d', lambda m: f"{frame:0{int(m.group(1))}d}", path)
+    def is_sequence_path(path: str, confirm_files: bool = False) -> bool:
+        return bool(re.search(r'%0?\d*d|#+|\.\d+\.[A-Za-z0-9]+$', path or ""))
     def is_sequence(read_node) -> bool:
         try:
-            fp = nuke.filename(read_node)
-            return bool(re.search(r'%0?\d*d|#+|\.\d+\.[A-Za-z0-9]+$', fp or ""))
+            return is_sequence_path(nuke.filename(read_node))
         except Exception:
             return False
     def derive_shot_from_sequence_dir(path_or_read):
@@ -53,6 +68,8 @@ except Exception as e:
             return os.path.basename(os.path.dirname(p)) if p else None
         except Exception:
             return None
+    def detect_frame_range(path: str):
+        return None
 
 # ===============================
 # NYC paths (centralized)
@@ -75,7 +92,7 @@ except Exception as e:
             return None
         code = project_folder.split("_", 1)[0]
         return f"/Volumes/san-01/GlossPost/{project_folder}/PROGRESS-{code}/NUKE"
-    def find_approved_folder(job_code, job_folder_hint=None):
+    def find_approved_folder(job_code, job_folder_hint=None, prefer=None):
         gloss_root = "/Volumes/san-01/GlossPost"
         cloud_root = "/Volumes/san-01/CloudSync"
         gloss_proj = next((f for f in os.listdir(gloss_root) if f.startswith(job_code)), None)
@@ -84,7 +101,10 @@ except Exception as e:
         cloud_path = os.path.join(cloud_root, cloud_proj, "FOOTAGE_CLOUD", "APPROVED_RETOUCH_CLOUD") if cloud_proj else None
         if gloss_path and os.path.exists(gloss_path): return gloss_path
         if cloud_path and os.path.exists(cloud_path): return cloud_path
-        use_new = nuke.ask((f"No approved folder found.\n\nNew → {gloss_path}\nOld → {cloud_path}\n\nUse NEW?")) if gloss_path and cloud_path else True
+        if prefer or not (gloss_path and cloud_path):
+            use_new = prefer != "old"
+        else:
+            use_new = nuke.ask((f"No approved folder found.\n\nNew → {gloss_path}\nOld → {cloud_path}\n\nUse NEW?"))
         target = gloss_path if use_new else cloud_path
         if target:
             try:
@@ -113,28 +133,21 @@ def _selected_read():
     nuke.message("Select a Read node first.")
     return None
 
-def _clean_base_mov_name(name: str) -> str:
-    """MOVs: strip pipeline suffixes (Comp/CHN/Roto/Track/DN/PreComp) to form a stable base."""
-    m = re.match(r'^(.+?)(?:_(?:Comp.*|CHN.*|Roto.*|Track.*|DN.*|PreComp.*))?$', name, re.IGNORECASE)
-    return m.group(1) if m else name
-
 def _shot_key(read) -> str | None:
     """
-    Stable match key for pairing:
+    Stable match key for pairing (see gloss_utils.shot_names):
       - Sequences: parent folder name
-      - MOV: cleaned base name (without pipeline suffixes)
+      - MOV: base name without a trailing pipeline suffix (Comp/CHN/Roto/Track/DN/PreComp + version)
     """
     p = nuke.filename(read)
     if not p:
         return None
-    if is_sequence(read):
-        return derive_shot_from_sequence_dir(read)
-    base = os.path.splitext(os.path.basename(p))[0]
-    return _clean_base_mov_name(base)
+    return shot_names.shot_key(p)
 
 # ===============================
 # Node color utilities
 # ===============================
+@traced()
 def set_node_color(hex_color_value):
     try:
         node = _selected_read() or nuke.selectedNode()
@@ -142,6 +155,7 @@ def set_node_color(hex_color_value):
     except Exception:
         nuke.message("Select a node to set its color.")
 
+@traced()
 def reset_node_color():
     try:
         node = _selected_read() or nuke.selectedNode()
@@ -152,6 +166,7 @@ def reset_node_color():
 # ===============================
 # File/clipboard utilities
 # ===============================
+@traced()
 def copy_file_path():
     read = _selected_read()
     if not read:
@@ -164,6 +179,7 @@ def copy_file_path():
         log_error(f"Unable to copy file path: {e}")
         nuke.message("Unable to copy file path.")
 
+@traced()
 def go_to_directory():
     read = _selected_read()
     if not read:
@@ -178,6 +194,7 @@ def go_to_directory():
         log_error(f"Go to directory failed: {e}")
         nuke.message(f"❌ Error:\n{e}")
 
+@traced()
 def copy_shot_filename():
     read = _selected_read()
     if not read:
@@ -195,24 +212,23 @@ def copy_shot_filename():
 # QC tools
 # ===============================
 def _find_original_read_for(read):
-    key = _shot_key(read)
-    if not key:
+    """The untagged (plate) Read for the same shot, or None."""
+    path = nuke.filename(read)
+    if not path:
         return None
+    # First untagged Read with the same key; stops there instead of indexing every Read
+    key = shot_names.shot_key(path)
     for node in nuke.allNodes("Read"):
         if node is read:
             continue
-        alt_key = _shot_key(node)
-        if alt_key != key:
-            continue
-        alt_path = nuke.filename(node)
-        if not alt_path:
-            continue
-        alt_name = os.path.basename(alt_path)
-        if re.search(r'_(Comp|CHN|Roto|Track|DN|PreComp)\b', alt_name, re.IGNORECASE):
-            continue
-        return node
+        p = nuke.filename(node)
+        if p:
+            sn = shot_names.parse_path(p)
+            if sn.is_original and sn.key == key:
+                return node
     return None
 
+@traced()
 def qc_compare_with_original():
     read = _selected_read()
     if not read:
@@ -226,17 +242,23 @@ def qc_compare_with_original():
         nuke.message("❌ Original shot not found.")
         return
 
-    merge = nuke.createNode("Merge2")
-    merge.setInput(0, original)
-    merge.setInput(1, read)
-    merge["operation"].setValue("difference")
-    merge["label"].setValue("QC: Diff vs Original")
-    merge["note_font_size"].setValue(30)
-    merge["tile_color"].setValue(0x6666FFFF)
-    merge.setXpos((original.xpos() + read.xpos()) // 2)
-    merge.setYpos(max(original.ypos(), read.ypos()) + 100)
+    # nuke.nodes: no autoplace/panel pop; one undo step for create + wiring + layout
+    with bulk_operation("QC Compare with Original") as bulk:
+        merge = bulk.create(
+            "Merge2",
+            operation="difference",
+            label="QC: Diff vs Original",
+            note_font_size=30,
+            tile_color=0x6666FFFF,
+            xpos=(original.xpos() + read.xpos()) // 2,
+            ypos=max(original.ypos(), read.ypos()) + 100,
+        )
+        merge.setInput(0, original)
+        merge.setInput(1, read)
+        bulk.select(merge)
     log_info("QC compare merge created.")
 
+@traced()
 def toggle_wipe_viewer():
     read = _selected_read()
     if not read:
@@ -252,10 +274,11 @@ def toggle_wipe_viewer():
         nuke.message("❌ Original shot not found.")
         return
 
-    # Remove any prior QC compare node
-    for node in nuke.allNodes("Merge2"):
-        if node['label'].value() == "QC: Diff vs Original":
-            nuke.delete(node)
+    # Remove any prior QC compare node (one undo step however many there are)
+    with bulk_operation("Remove QC Compare") as bulk:
+        for node in nuke.allNodes("Merge2"):
+            if node['label'].value() == "QC: Diff vs Original":
+                bulk.delete(node)
 
     viewer.setInput(0, original)
     viewer.setInput(1, read)
@@ -269,10 +292,74 @@ def toggle_wipe_viewer():
 # ===============================
 # Approved folder flow (centralized paths)
 # ===============================
+COPY_WORKERS = 8  # parallel frame copies per sequence (bound by SAN latency, not CPU)
+
+def _is_sequence_file(path):
+    """Path-only is_sequence(): digit-style names only count when sibling frames exist."""
+    return is_sequence_path(path, confirm_files=not re.search(r"%0?\d*d|#", path or ""))
+
+@traced()
+def send_to_approved(src_path, approved_root=None, overwrite=False, prefer=None,
+                     sequence=None, workers=COPY_WORKERS):
+    """
+    Copy a MOV or an image sequence into its job's Approved folder (no Nuke needed).
+    - approved_root is resolved from the path when not given; prefer="new"/"old"
+      picks GlossPost or CloudSync without a dialog
+    - sequences go to <Approved>/<shot folder>/ (frames already there are overwritten)
+    - a single file that already exists raises FileExistsError unless overwrite=True
+    Returns {"src", "dst", "files", "sequence"}; raises ValueError if nothing resolves.
+    """
+    sp = current_span()
+    if approved_root is None:
+        job_code, project_folder = derive_job_from_path(src_path)
+        if not job_code:
+            raise ValueError(f"Could not determine job code: {src_path}")
+        approved_root = find_approved_folder(job_code, project_folder, prefer=prefer)
+        if not approved_root:
+            raise ValueError(f"No Approved folder for job {job_code}")
+        sp.set(job=job_code)
+    if sequence is None:
+        sequence = _is_sequence_file(src_path)
+
+    if sequence:
+        shot_name = derive_shot_from_sequence_dir(src_path) or os.path.basename(os.path.dirname(src_path))
+        dst_dir = os.path.join(approved_root, shot_name)
+        glob_pattern = get_glob_pattern(src_path)
+        files = sorted(glob.glob(glob_pattern.replace('\\', '/')))
+        san_call()
+        if not files:
+            raise ValueError(f"No files matched:\n{glob_pattern}")
+        os.makedirs(dst_dir, exist_ok=True)
+        san_call()
+
+        def _copy(f):
+            shutil.copy(f, os.path.join(dst_dir, os.path.basename(f)))
+
+        if workers > 1 and len(files) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(_copy, files))
+        else:
+            for f in files:
+                _copy(f)
+        san_call(len(files))  # one copy per frame, made on the pool threads
+        sp.add_items(len(files))
+        return {"src": src_path, "dst": dst_dir, "files": len(files), "sequence": True}
+
+    dst_path = os.path.join(approved_root, os.path.basename(src_path))
+    san_call()
+    if os.path.exists(dst_path) and not overwrite:
+        raise FileExistsError(dst_path)
+    shutil.copy(src_path, dst_path)
+    san_call()
+    sp.add_items(1)
+    return {"src": src_path, "dst": dst_path, "files": 1, "sequence": False}
+
+@traced()
 def copy_to_approved():
     read = _selected_read()
     if not read:
         return
+    sp = current_span()
     try:
         evaluated_path = read['file'].evaluate()
         job_code, project_folder = derive_job_from_path(evaluated_path)
@@ -283,37 +370,31 @@ def copy_to_approved():
         approved_root = find_approved_folder(job_code, project_folder)
         if not approved_root:
             return
+        sp.set(job=job_code)
 
-        if is_sequence(read):
-            shot_name = derive_shot_from_sequence_dir(read) or os.path.basename(os.path.dirname(evaluated_path))
-            approved_seq_dir = os.path.join(approved_root, shot_name)
-            os.makedirs(approved_seq_dir, exist_ok=True)
-
-            glob_pattern = get_glob_pattern(evaluated_path)
-            files = sorted(glob.glob(glob_pattern.replace('\\', '/')))
-            if not files:
-                nuke.message(f"No files matched:\n{glob_pattern}")
+        try:
+            result = send_to_approved(evaluated_path, approved_root, sequence=is_sequence(read))
+        except FileExistsError as e:
+            with user_wait():
+                overwrite = nuke.ask(f"File already exists:\n{e}\n\nOverwrite?")
+            if not overwrite:
                 return
+            result = send_to_approved(evaluated_path, approved_root, overwrite=True, sequence=False)
 
-            for f in files:
-                shutil.copy(f, os.path.join(approved_seq_dir, os.path.basename(f)))
-
-            set_node_color(C.COLOR_NYC)  # or a specific “approved” color if you prefer
-            nuke.message(f"✅ Copied {len(files)} frames to:\n{approved_seq_dir}")
-
-        else:
-            dst_path = os.path.join(approved_root, os.path.basename(evaluated_path))
-            if os.path.exists(dst_path):
-                if not nuke.ask(f"File already exists:\n{dst_path}\n\nOverwrite?"):
-                    return
-            shutil.copy(evaluated_path, dst_path)
-            set_node_color(C.COLOR_NYC)
-            nuke.message(f"✅ Copied to:\n{dst_path}")
+        set_node_color(C.COLOR_NYC)  # or a specific “approved” color if you prefer
+        with user_wait():
+            if result["sequence"]:
+                nuke.message(f"✅ Copied {result['files']} frames to:\n{result['dst']}")
+            else:
+                nuke.message(f"✅ Copied to:\n{result['dst']}")
 
     except Exception as e:
+        sp.fail(e)
         log_error(f"Copy to approved failed: {e}")
-        nuke.message(f"❌ Error:\n{str(e)}")
+        with user_wait():
+            nuke.message(f"❌ Error:\n{str(e)}")
 
+@traced()
 def go_to_approved_directory():
     read = _selected_read()
     if not read:
@@ -334,57 +415,99 @@ def go_to_approved_directory():
         log_error(f"Open approved directory failed: {e}")
         nuke.message(f"❌ Error:\n{str(e)}")
 
+_NO_APPROVED_FOLDER = "No approved folder."  # find_approved_folder already told the user
+
+def _approved_path_for(read, approved_roots):
+    """(approved_path, None) or (None, reason). approved_roots caches job -> folder."""
+    file_path = read['file'].evaluate()
+    job_code, project_folder = derive_job_from_path(file_path)
+    if not job_code:
+        return None, "Could not determine job code."
+
+    if job_code not in approved_roots:
+        approved_roots[job_code] = find_approved_folder(job_code, project_folder)
+    approved_root = approved_roots[job_code]
+    if not approved_root:
+        return None, _NO_APPROVED_FOLDER
+
+    if is_sequence(read):
+        shot_name = derive_shot_from_sequence_dir(read) or os.path.basename(os.path.dirname(file_path))
+        approved_dir = os.path.join(approved_root, shot_name)
+        if not os.path.isdir(approved_dir):
+            return None, f"Approved sequence directory not found:\n{approved_dir}"
+
+        image_files = sorted(
+            f for f in glob.glob(os.path.join(approved_dir, '*'))
+            if re.search(r"\.(exr|dpx|jpg|jpeg|tif|tiff|png)$", f, re.IGNORECASE)
+        )
+        if not image_files:
+            return None, f"No image sequence files found in:\n{approved_dir}"
+
+        first_frame_name = os.path.basename(image_files[0])
+        m = re.match(r"^(.*?)(\d+)(\.[a-zA-Z0-9]+)$", first_frame_name)
+        if m:
+            prefix, padding, ext = m.groups()
+            pad_len = len(padding)
+            return os.path.join(approved_dir, f"{prefix}%0{pad_len}d{ext}"), None
+        return image_files[0], None
+
+    approved_path = os.path.join(approved_root, os.path.basename(file_path))
+    if not os.path.exists(approved_path):
+        return None, "Approved file not found."
+    return approved_path, None
+
+@traced()
 def import_approved_version():
-    read = _selected_read()
-    if not read:
+    """Import the approved version of every selected Read in one bulk, undoable step."""
+    reads = get_selected_nodes("Read")
+    if not reads:
+        nuke.message("Select a Read node first.")
         return
     try:
-        file_path = read['file'].evaluate()
-        job_code, project_folder = derive_job_from_path(file_path)
-        if not job_code:
-            nuke.message("Could not determine job code.")
-            return
-
-        approved_root = find_approved_folder(job_code, project_folder)
-        if not approved_root:
-            return
+        from read_node.bulk_import import create_reads, READ_W
 
-        if is_sequence(read):
-            shot_name = derive_shot_from_sequence_dir(read) or os.path.basename(os.path.dirname(file_path))
-            approved_dir = os.path.join(approved_root, shot_name)
-            if not os.path.isdir(approved_dir):
-                nuke.message(f"Approved sequence directory not found:\n{approved_dir}")
-                return
+        found, problems, approved_roots = [], [], {}
+        for read in reads:
+            approved_path, reason = _approved_path_for(read, approved_roots)
+            if approved_path:
+                found.append((read, approved_path))
+            else:
+                problems.append((read.name(), reason))
 
-            image_files = sorted(
-                f for f in glob.glob(os.path.join(approved_dir, '*'))
-                if re.search(r"\.(exr|dpx|jpg|jpeg|tif|tiff|png)$", f, re.IGNORECASE)
-            )
-            if not image_files:
-                nuke.message(f"No image sequence files found in:\n{approved_dir}")
-                return
+        # Movie frame ranges come from the QuickTime header (parallel, no decoding);
+        # anything the probe can't read keeps the source Read's range.
+        movie_info = quicktime.probe_many(p for _, p in found if quicktime.is_movie(p))
 
-            first_frame_name = os.path.basename(image_files[0])
-            m = re.match(r"^(.*?)(\d+)(\.[a-zA-Z0-9]+)$", first_frame_name)
-            if m:
-                prefix, padding, ext = m.groups()
-                pad_len = len(padding)
-                approved_path = os.path.join(approved_dir, f"{prefix}%0{pad_len}d{ext}")
+        specs = []
+        for read, approved_path in found:
+            info = movie_info.get(approved_path)
+            if info and info.frames:
+                first, last = 1, info.frames
             else:
-                approved_path = image_files[0]
-        else:
-            approved_path = os.path.join(approved_root, os.path.basename(file_path))
-            if not os.path.exists(approved_path):
-                nuke.message("Approved file not found.")
-                return
+                first, last = read['first'].value(), read['last'].value()
+            specs.append({
+                "file": approved_path,
+                "xpos": read.xpos() + READ_W + 40,
+                "ypos": read.ypos(),
+                "knobs": {
+                    "first": first, "last": last,
+                    "origfirst": first, "origlast": last,
+                    "tile_color": C.COLOR_REVIEW_NEEDED,
+                },
+            })
+
+        if len(reads) == 1 and problems:
+            if problems[0][1] != _NO_APPROVED_FOLDER:
+                nuke.message(problems[0][1])
+            return
 
-        new_node = nuke.createNode("Read", f"file {{{approved_path}}}")
-        new_node['first'].setValue(read['first'].value())
-        new_node['last'].setValue(read['last'].value())
-        new_node['origfirst'].setValue(read['first'].value())
-        new_node['origlast'].setValue(read['last'].value())
-        new_node['tile_color'].setValue(C.COLOR_REVIEW_NEEDED)
-        log_info("Imported approved version.")
+        _, errors = create_reads(specs, undo_label="Import Approved")
+        problems += [(os.path.basename(f), e) for f, e in errors]
+        imported = len(specs) - len(errors)
+        log_info(f"Imported {imported} approved version(s).")
+        if problems:
+            details = "\n".join(f"{name}: {reason}" for name, reason in problems[:10])
+            nuke.message(f"Imported {imported} approved version(s).\n\nSkipped {len(problems)}:\n{details}")
 
     except Exception as e:
         log_error(f"Import approved version failed: {e}")
@@ -393,6 +516,7 @@ def import_approved_version():
 # ===============================
 # Launch Nuke helpers
 # ===============================
+@traced()
 def launch_nuke_with_script(script_path):
     try:
         apps = "/Applications"
@@ -414,76 +538,155 @@ def launch_nuke_with_script(script_path):
 # ===============================
 # Task script creation (uses progress_nuke_base)
 # ===============================
+DEFAULT_FPS = 23.976
+
+@traced()
+def task_script_plan(src_path, task_name, width=None, height=None, fps=None,
+                     first=None, last=None, sequence=None):
+    """
+    Resolve everything a task script needs from the source path alone (no Nuke):
+      {"clip", "tag", "folder", "existing", "script", "width", "height", "fps", "first", "last"}
+    "existing" is the latest matching script in the task folder (or None), "script" the v01
+    that would be created. Values passed in win; otherwise MOVs use the QuickTime header
+    (read only when something is missing) and sequences the frames on disk.
+    width/height stay None when nothing provides them.
+    Raises ValueError if the path, clip name or NUKE base can't be resolved.
+    """
+    if sequence is None:
+        sequence = _is_sequence_file(src_path)
+
+    # Clip/shot name + frame range
+    if sequence:
+        clip = derive_shot_from_sequence_dir(src_path)
+        if first is None or last is None:
+            rng = detect_frame_range(src_path)
+            san_call()
+            if rng:
+                first = rng[0] if first is None else first
+                last = rng[1] if last is None else last
+        concrete_first = resolve_frame_path(src_path, first if first is not None else 1)
+    else:
+        clip = os.path.splitext(os.path.basename(src_path))[0]
+        concrete_first = src_path
+    san_call()
+    if not os.path.exists(concrete_first):
+        raise ValueError(f"Invalid file path: {concrete_first}")
+    if not clip:
+        raise ValueError("Could not derive clip/shot name.")
+
+    # MOVs: fill missing res/fps/range from the QuickTime header
+    if not sequence and quicktime.is_movie(src_path) and (width is None or first is None or not fps):
+        try:
+            san_call()
+            info = quicktime.probe(src_path)
+        except Exception as e:
+            info = None
+            log_warning(f"QuickTime probe failed for {src_path}: {e}")
+        if info:
+            if info.width and info.height and width is None:
+                width, height = info.width, info.height
+            if info.frames and first is None:
+                first, last = 1, info.frames
+            fps = fps or info.fps
+
+    # Resolve project folder & PROGRESS-*/NUKE base
+    _, project_folder = derive_job_from_path(src_path)
+    base = progress_nuke_base(project_folder) if project_folder else None
+    if not base:
+        raise ValueError("Could not resolve NUKE project base.")
+
+    tag = "NYC" if task_name == "COMP" else task_name
+    pattern = f"{clip}_{tag}_v"
+    folder = os.path.join(base, clip, "Scripts", task_name)
+    existing = None
+    san_call()
+    if os.path.isdir(folder):
+        san_call()
+        found = sorted(f for f in os.listdir(folder) if f.startswith(pattern) and f.endswith(".nk"))
+        if found:
+            existing = os.path.join(folder, found[-1])
+
+    return {
+        "clip": clip, "tag": tag, "folder": folder, "existing": existing,
+        "script": os.path.join(folder, f"{clip}_{tag}_v01.nk"),
+        "width": width, "height": height, "fps": fps or DEFAULT_FPS,
+        "first": first if first is not None else 1, "last": last if last is not None else 1,
+    }
+
+@traced()
+def write_task_script(plan):
+    """Write the v01 script for a task_script_plan() (format defined inline). Returns its path."""
+    if not (plan["width"] and plan["height"]):
+        raise ValueError("Resolution unknown.")
+    w, h = int(plan["width"]), int(plan["height"])
+    os.makedirs(plan["folder"], exist_ok=True)
+    san_call()
+    with open(plan["script"], "w") as f:
+        san_call()
+        f.write(f"""Root {{
+ format \"{w} {h} 0 0 {w} {h} 1 Clip_{w}x{h}\"
+ first_frame {plan['first']}
+ last_frame {plan['last']}
+ lock_range true
+ fps {plan['fps']}
+}}""")
+    return plan["script"]
+
+def _read_knob_range(read):
+    """(first, last) from the Read's knobs, or (None, None) when they can't be read."""
+    try:
+        return int(read['first'].value()), int(read['last'].value())
+    except Exception:
+        return None, None
+
+@traced()
 def create_task_script(task_name):
     read = _selected_read()
     if not read:
         return
     try:
         file_path = nuke.filename(read)
-        first_frame = int(read.firstFrame())
-
-        # Validate existence at first frame
-        concrete_first = resolve_frame_path(file_path, first_frame) if is_sequence(read) else file_path
-        if not os.path.exists(concrete_first):
-            nuke.message("Invalid file path.")
-            return
-
-        # Clip/shot name
-        if is_sequence(read):
-            clip = derive_shot_from_sequence_dir(read)
+        seq = is_sequence(read)
+
+        # The live Read's knobs win; for MOVs the QuickTime header is only read for
+        # whatever the Read does not provide.
+        if seq:
+            first_frame = int(read.firstFrame())
+            if not os.path.exists(resolve_frame_path(file_path, first_frame)):
+                nuke.message("Invalid file path.")
+                return
+            plan = task_script_plan(
+                file_path, task_name, sequence=True,
+                width=read.width(), height=read.height(),
+                first=int(read['first'].value()), last=int(read['last'].value()),
+                fps=read.metadata("input/framesPerSecond"),
+            )
         else:
-            clip = os.path.splitext(os.path.basename(file_path))[0]
-        if not clip:
-            nuke.message("Could not derive clip/shot name.")
-            return
-
-        width, height = read.width(), read.height()
-        first = int(read['first'].value())
-        last = int(read['last'].value())
-        fps = read.metadata("input/framesPerSecond") or 23.976
+            first, last = _read_knob_range(read)
+            plan = task_script_plan(
+                file_path, task_name, sequence=False,
+                width=read.width() or None, height=read.height() or None,
+                first=first, last=last,
+                fps=read.metadata("input/framesPerSecond"),
+            )
 
-        # Resolve project folder & PROGRESS-*/NUKE base
-        _, project_folder = derive_job_from_path(file_path)
-        base = progress_nuke_base(project_folder) if project_folder else None
-        if not base:
-            nuke.message("Could not resolve NUKE project base.")
+        if plan["existing"]:
+            launch_nuke_with_script(plan["existing"])
             return
 
-        tag = "NYC" if task_name == "COMP" else task_name
-        pattern = f"{clip}_{tag}_v"
-
-        shot_folder = os.path.join(base, clip, "Scripts", task_name)
-        if os.path.exists(shot_folder):
-            existing = sorted(f for f in os.listdir(shot_folder) if f.startswith(pattern) and f.endswith(".nk"))
-            if existing:
-                latest_script = os.path.join(shot_folder, existing[-1])
-                if os.path.exists(latest_script):
-                    launch_nuke_with_script(latest_script)
-                    return
-
-        confirm = nuke.ask(
-            f"Create new {task_name} script?\n"
-            f"Clip: {clip}\nRes: {width}x{height}\nFPS: {fps}\nFrames: {first} - {last}"
-        )
+        with user_wait():
+            confirm = nuke.ask(
+                f"Create new {task_name} script?\n"
+                f"Clip: {plan['clip']}\nRes: {plan['width']}x{plan['height']}\nFPS: {plan['fps']}\n"
+                f"Frames: {plan['first']} - {plan['last']}"
+            )
         if not confirm:
             return
 
-        os.makedirs(shot_folder, exist_ok=True)
-        format_name = f"Clip_{width}x{height}"
-        if format_name not in [f.name() for f in nuke.formats()]:
-            nuke.addFormat(f"{width} {height} 0 0 {width} {height} 1 {format_name}")
-
-        new_script_path = os.path.join(shot_folder, f"{clip}_{tag}_v01.nk")
-        with open(new_script_path, "w") as f:
-            f.write(f"""Root {{
- format \"{format_name}\"
- first_frame {first}
- last_frame {last}
- lock_range true
- fps {fps}
-}}""")
-        launch_nuke_with_script(new_script_path)
+        launch_nuke_with_script(write_task_script(plan))
 
+    except ValueError as e:
+        nuke.message(str(e))
     except Exception as e:
         log_error(f"Create task script failed: {e}")
         nuke.message(f"❌ Script creation failed:\n{e}")
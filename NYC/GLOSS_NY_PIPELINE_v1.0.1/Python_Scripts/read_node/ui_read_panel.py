@@ -40,7 +40,10 @@ def add_buttons_to_read_node():
     node = _current_or_selected_read()
     if not node:
         return
+    install_gloss_ui(node)
 
+def install_gloss_ui(node):
+    """Add the Gloss tab and buttons to `node` (no-op if already there)."""
     # Prevent duplicates
     if node.knob("_gloss_ui_installed"):
         return
@@ -93,6 +96,34 @@ def add_buttons_to_read_node():
     node.addKnob(nuke.Text_Knob("gloss_div_slate", "Slate Overlay"))
     _add_btn(node, "gloss_slateToggle", "Toggle Slate", "toggle_slate()")
 
+# ===============================
+# Lazy install for bulk-created Reads
+# ===============================
+# nuke.nodes.Read() skips onUserCreate, so bulk_import.create_reads marks its Reads with
+# a hidden knob and they get the Gloss UI the first time their panel is opened. Reads
+# made by hand or loaded from old scripts carry no marker and are left alone. Checking
+# knobs (rather than remembering node names) also covers reopened scripts and renamed nodes.
+LAZY_UI_MARKER = "_gloss_ui_pending"
+
+def mark_for_lazy_ui(node):
+    """Flag a Read created without onUserCreate so its panel gets the Gloss UI when opened."""
+    if node.knob(LAZY_UI_MARKER) is None:
+        k = nuke.Boolean_Knob(LAZY_UI_MARKER, "")
+        node.addKnob(k)
+        k.setValue(True)
+        k.setVisible(False)
+
+def _on_show_panel():
+    try:
+        if nuke.thisKnob().name() != "showPanel":
+            return
+        node = nuke.thisNode()
+        if node.knob(LAZY_UI_MARKER) is not None and node.knob("_gloss_ui_installed") is None:
+            install_gloss_ui(node)
+    except Exception:
+        pass
+
 def install():
     """Auto-install the Gloss UI on new Read nodes."""
     nuke.addOnUserCreate(add_buttons_to_read_node, nodeClass="Read")
+    nuke.addKnobChanged(_on_show_panel, nodeClass="Read")
@@ -0,0 +1,8 @@
+# tests/conftest.py
+# Pure-Python tests for the Nuke-free parts of the pipeline.
+# Run from Python_Scripts:  python -m pytest -q tests
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
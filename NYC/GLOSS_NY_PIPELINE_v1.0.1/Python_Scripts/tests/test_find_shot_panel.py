@@ -0,0 +1,54 @@
+# tests/test_find_shot_panel.py
+# Find Shot panel: Read index scope and selection, against the stand-in nuke.
+
+import types
+
+import pytest
+
+from benchmarks import fake_nuke
+
+fake_nuke.install()
+
+from panels import find_shot_panel as fsp  # noqa: E402  (needs `nuke` installed first)
+
+
+@pytest.fixture
+def reads():
+    fake_nuke.reset(clear_callbacks=True)
+    fsp._needs_rebuild = True
+    return {name: fake_nuke.nodes.Read(name=name, file=f"/plates/{name}.mov")
+            for name in ("Nike_A010", "Nike_A020", "Puma_B010")}
+
+
+def _selected():
+    return sorted(n.name() for n in fake_nuke.selectedNodes("Read"))
+
+
+def test_search_ranks_exact_name_first(reads):
+    assert fsp.current_index().search("nike_a020")[0] == "Nike_A020"
+    assert set(fsp.current_index().search("nike")) == {"Nike_A010", "Nike_A020"}
+
+
+def test_selection_follows_manual_changes_between_searches(reads):
+    panel = fsp.ShotFinderPanel()
+    panel._filter_and_select("nike")
+    assert _selected() == ["Nike_A010", "Nike_A020"]
+
+    reads["Nike_A010"].setSelected(False)  # artist clicks around in the DAG
+    reads["Puma_B010"].setSelected(True)
+    panel._filter_and_select("a010")
+    assert _selected() == ["Nike_A010"]
+
+    panel._clear_selection()
+    assert _selected() == []
+
+
+def test_callbacks_skip_reads_inside_groups(reads):
+    fsp.current_index()
+    inner = types.SimpleNamespace(fullName=lambda: "Group1.Nike_A030")
+    fake_nuke._context.append((inner, None))
+    try:
+        fsp._on_create()
+    finally:
+        fake_nuke._context.pop()
+    assert "Group1.Nike_A030" not in fsp._pending
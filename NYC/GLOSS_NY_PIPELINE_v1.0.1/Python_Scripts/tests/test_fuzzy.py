@@ -0,0 +1,51 @@
+# tests/test_fuzzy.py
+# Ranked fuzzy filtering used by the lineup browser.
+
+from gloss_utils.fuzzy import SearchIndex, normalize_query
+
+PROJECTS = [
+    "101181_CK_FA25_Mens_CLOUD",
+    "101182_Nike_Spring_Track",
+    "100990_CK_SS25_Womens",
+    "101200_Puma_Kicks",
+    "099001_Archive_CK",
+]
+
+
+def _rank(query, limit=None, texts=PROJECTS):
+    idx = SearchIndex(texts)
+    return [texts[i] for i in idx.rank(query, limit)]
+
+
+def test_empty_query_keeps_order():
+    assert _rank("") == PROJECTS
+    assert _rank("  ", limit=2) == PROJECTS[:2]
+
+
+def test_job_code_prefix_ranks_first():
+    assert _rank("1011")[:2] == ["101181_CK_FA25_Mens_CLOUD", "101182_Nike_Spring_Track"]
+    assert _rank("101200") == ["101200_Puma_Kicks"]
+
+
+def test_separators_and_case_are_ignored():
+    assert normalize_query("CK FA") == normalize_query("ck_fa") == "ckfa"
+    assert _rank("CK fa")[0] == "101181_CK_FA25_Mens_CLOUD"
+
+
+def test_subsequence_matches_rank_below_substrings():
+    hits = _rank("ck")
+    assert set(hits) == {"101181_CK_FA25_Mens_CLOUD", "100990_CK_SS25_Womens",
+                         "099001_Archive_CK", "101200_Puma_Kicks", "101182_Nike_Spring_Track"}
+    assert hits.index("101200_Puma_Kicks") > hits.index("099001_Archive_CK")
+
+
+def test_non_matches_are_dropped_and_narrowing_reuses_hits():
+    idx = SearchIndex(PROJECTS)
+    assert idx.rank("zzz") == []
+    wide = idx.rank("nik")
+    narrow = idx.rank("nike")
+    assert narrow == [1] and set(narrow) <= set(wide)
+    # A query that does not extend the last one searches everything again.
+    assert [PROJECTS[i] for i in idx.rank("puma")] == ["101200_Puma_Kicks"]
+    idx.extend(["101300_Nike_Air"])
+    assert set(idx.rank("nike")) == {1, 5}
@@ -0,0 +1,72 @@
+# tests/test_gloss_cli.py
+# Headless `gloss` CLI: argument types and the approve dry run on a tmp tree.
+
+import json
+import os
+import shutil
+
+import pytest
+
+from benchmarks.synth_tree import make_tree, project_names, shot_name
+from gloss_utils import catalog, paths_nyc
+from tools import gloss_cli
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    t = make_tree(str(tmp_path / "san"), projects=2, shots=1, frames=2, dates=1)
+    monkeypatch.setattr(paths_nyc, "GLOSS_ROOT", t["gloss_root"])
+    monkeypatch.setattr(paths_nyc, "CLOUD_ROOT", t["cloud_root"])
+    monkeypatch.setattr(catalog, "CATALOG_FILE", str(tmp_path / "no_catalog.sqlite"))
+    monkeypatch.setattr(catalog, "_local", type(catalog._local)())
+    return t
+
+
+def _plate(tree, i):
+    project = project_names(i)[0]
+    code = project[:6]
+    return os.path.join(tree["gloss_root"], project, f"IN-{code}", "FOOTAGE", "PLATES",
+                        shot_name(i, 0), f"{shot_name(i, 0)}.1001.exr")
+
+
+def _dry_run(capsys, path, prefer):
+    assert gloss_cli.main(["--json", "approve", path, "--dry-run", "--prefer", prefer]) == 0
+    return json.loads(capsys.readouterr().out)[0]["approved"]
+
+
+def test_dry_run_uses_the_approved_resolver(tree, capsys):
+    plate = _plate(tree, 0)
+    code = project_names(0)[0][:6]
+    new = paths_nyc.approved_new_path(project_names(0)[0], code)
+    old = paths_nyc.approved_old_path(code)
+
+    # Only the new folder exists: used even with --prefer old.
+    assert _dry_run(capsys, plate, "old") == new
+
+    # Both exist: --prefer decides.
+    os.makedirs(old)
+    assert _dry_run(capsys, plate, "old") == old
+
+    # Neither exists: the preferred one is reported but not created.
+    shutil.rmtree(new)
+    shutil.rmtree(old)
+    assert _dry_run(capsys, plate, "new") == new
+    assert not os.path.exists(new) and not os.path.exists(old)
+
+
+@pytest.mark.parametrize("argv", [
+    ["task", "/x.mov", "--res", "1920"],
+    ["task", "/x.mov", "--res", "0x1080"],
+    ["task", "/x.mov", "--range", "10-a"],
+    ["task", "/x.mov", "--range", "20-10"],
+])
+def test_bad_values_are_usage_errors(argv, capsys):
+    with pytest.raises(SystemExit) as e:
+        gloss_cli.build_parser().parse_args(argv)
+    assert e.value.code == 2
+    assert "error: argument --" in capsys.readouterr().err
+
+
+def test_good_values_parse():
+    args = gloss_cli.build_parser().parse_args(["task", "/x.mov", "--res", "1920X1080", "--range", "1001"])
+    assert args.res == (1920, 1080) and args.range == (1001, 1001)
@@ -0,0 +1,75 @@
+# tests/test_lineup_index.py
+# Cross-lineup shot index: .nk Read parsing and an incremental crawl of a tmp tree.
+
+import os
+
+import pytest
+
+from benchmarks.synth_tree import make_tree, project_names, shot_name
+from tools.lineup_index import LineupIndex, parse_reads
+
+NK = r'''Root {
+ inputs 0
+ name /comp/Line_up_v03.nk
+}
+Read {
+ inputs 0
+ file /plates/A010/A010.####.exr
+ name Read1
+}
+Group {
+ name Precomp
+}
+ Read {
+  inputs 0
+  file "/plates/B 020/B 020_v002.mov"
+  name Read_B020
+ }
+end_group
+Read {
+ inputs 0
+ name Read_NoFile
+}
+Write {
+ file /renders/out.####.exr
+ name Write1
+}
+Read {
+ file {/plates/C030/C030_comp_v004.mov}
+}
+'''
+
+
+def test_parse_reads(tmp_path):
+    nk = tmp_path / "Line_up_v03.nk"
+    nk.write_text(NK)
+    assert parse_reads(str(nk)) == [
+        ("Read1", "/plates/A010/A010.####.exr"),
+        ("Read_B020", "/plates/B 020/B 020_v002.mov"),
+        ("Read", "/plates/C030/C030_comp_v004.mov"),
+    ]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    return make_tree(str(tmp_path / "san"), projects=2, shots=3, frames=1, dates=1)
+
+
+def test_crawl_find_and_recrawl(tree, tmp_path):
+    idx = LineupIndex(path=str(tmp_path / "index.json"), root=tree["gloss_root"])
+    first = idx.crawl(threads=2)
+    assert (first["lineups"], first["parsed"]) == (2, 2)
+    hits = idx.find(shot_name(1, 2))
+    assert [(idx.data["lineups"][l]["project"], v) for l, v, _n, _f in hits] == [(project_names(1)[0], 1)]
+
+    idx.save()
+    again = LineupIndex(path=idx.path, root=tree["gloss_root"]).load()
+    second = again.crawl(threads=2)
+    assert (second["lineups"], second["parsed"], second["removed"]) == (2, 0, 0)
+
+    nuke_dir = os.path.dirname(hits[0][0])
+    os.remove(hits[0][0])
+    os.utime(nuke_dir, (1, 1))  # mtime changes even on coarse-clock filesystems
+    third = again.crawl(threads=2)
+    assert (third["lineups"], third["removed"]) == (1, 1)
+    assert again.find(shot_name(1, 2)) == []
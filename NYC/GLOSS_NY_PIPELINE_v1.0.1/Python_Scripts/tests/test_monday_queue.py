@@ -0,0 +1,110 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from benchmarks import fake_nuke
+from integrations import monday_queue as mq
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    """Answers aliased change_multiple_column_values mutations like api.monday.com."""
+    requests = []
+    reject = set()     # item ids answered with null
+    status = 200
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests.append(body)
+        if self.status != 200:
+            self.send_response(self.status)
+            self.end_headers()
+            return
+        v = body["variables"]
+        data = {f"u{k[1:]}": (None if v[k] in self.reject else {"id": v[k]})
+                for k in v if k.startswith("i")}
+        out = json.dumps({"data": data}).encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _StandIn.requests, _StandIn.reject, _StandIn.status = [], set(), 200
+    httpd = HTTPServer(("127.0.0.1", 0), _StandIn)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}/v2"
+    httpd.shutdown()
+
+
+@pytest.fixture
+def queue(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(mq, "nuke", None)  # headless: _log prints (other tests install the stand-in nuke)
+    return mq.UpdateQueue(api_url=server, token="t", pending_file=str(tmp_path / "pending.json"), batch_size=25)
+
+
+def test_updates_coalesce_and_batch(queue):
+    for i in range(30):
+        queue.enqueue(1, i, {"status": {"label": "CHN"}})
+        queue.enqueue(1, i, {"status": {"label": "NYC"}})
+    assert queue.pending_count() == 30
+    assert queue.flush() == 30
+    assert len(_StandIn.requests) == 2
+    cols = {v for r in _StandIn.requests for k, v in r["variables"].items() if k.startswith("c")}
+    assert cols == {json.dumps({"status": {"label": "NYC"}})}
+    assert queue.pending_count() == 0
+
+
+def test_rejected_items_are_reported(queue, capsys):
+    _StandIn.reject = {"3", "7"}
+    for i in range(10):
+        queue.enqueue(1, i, {"status": ""})
+    assert queue.flush() == 8
+    assert queue.failed_items() == ["3", "7"]
+    assert "3, 7" in capsys.readouterr().out
+
+
+def test_server_errors_keep_updates_pending(queue, tmp_path):
+    _StandIn.status = 503
+    queue.enqueue(1, 5, {"status": ""})
+    with pytest.raises(mq.TransientError):
+        queue.flush()
+    assert queue.pending_count() == 1
+    reloaded = mq.UpdateQueue(api_url=queue.api_url, pending_file=queue.pending_file)
+    assert reloaded.pending_count() == 1
+
+
+def test_tag_selected_falls_back_per_unlinked_read(queue, monkeypatch):
+    fake_nuke.reset()
+    monkeypatch.setattr(mq, "nuke", fake_nuke)
+    monkeypatch.setattr(mq, "get_queue", lambda: queue)
+    linked = fake_nuke.nodes.Read(file="/a.mov")
+    for name, value in (("monday_board_id", "1"), ("monday_item_id", "42")):
+        linked.addKnob(fake_nuke.String_Knob(name))
+        linked[name].setValue(value)
+    plain = [fake_nuke.nodes.Read(file=f"/b{i}.mov") for i in range(3)]
+    for n in [linked] + plain:
+        n.setSelected(True)
+
+    seen = []
+    mq.tag_selected("nyc", 0x00FF00FF, lambda: seen.append([n.name() for n in fake_nuke.selectedNodes()]))
+
+    assert sorted(seen) == sorted([[n.name()] for n in plain])
+    assert queue._pending == {("1", "42"): {mq.settings()["status_column"]: {"label": "NYC"}}}
+    assert {n.name() for n in fake_nuke.selectedNodes()} == {n.name() for n in [linked] + plain}
+
+
+def test_client_errors_fail_the_batch_instead_of_retrying(queue):
+    _StandIn.status = 401
+    for i in range(3):
+        queue.enqueue(1, i, {"status": ""})
+    assert queue.flush() == 0
+    assert queue.failed_items() == ["0", "1", "2"]
+    assert queue.pending_count() == 0
+    assert len(_StandIn.requests) == 1
@@ -0,0 +1,80 @@
+# tests/test_quicktime.py
+# Header-only QuickTime probe on atom streams built by benchmarks/synth_tree.py.
+
+import struct
+
+import pytest
+
+from benchmarks.synth_tree import mov_stub_bytes
+from gloss_utils import quicktime
+
+
+def _write(tmp_path, name, data):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+def _split_atoms(data):
+    atoms, pos = [], 0
+    while pos < len(data):
+        size = struct.unpack_from(">I", data, pos)[0]
+        atoms.append(data[pos:pos + size])
+        pos += size
+    return atoms
+
+
+@pytest.mark.parametrize("fps, frames, size, codec", [
+    (23.976, 48, (1920, 1080), b"apch"),
+    (25.0, 250, (3840, 2160), b"ap4x"),
+    (29.97, 10, (1280, 720), b"avc1"),
+])
+def test_probe_reads_the_header(tmp_path, fps, frames, size, codec):
+    path = _write(tmp_path, "clip.mov", mov_stub_bytes(frames=frames, fps=fps, width=size[0],
+                                                        height=size[1], codec=codec))
+    info = quicktime.probe(path)
+    assert info.fps == pytest.approx(fps, abs=0.001)
+    assert info.frames == frames
+    assert (info.width, info.height) == size
+    assert info.codec == codec.decode()
+    assert info.duration == pytest.approx(frames / fps, rel=1e-3)
+    assert info.timecode is None
+
+
+@pytest.mark.parametrize("fps, tc_frame, drop, tc", [
+    (24.0, 86400 + 24 * 30 + 5, False, "01:00:30:05"),
+    (29.97, 107892 + 1800, True, "01:01:00;02"),
+])
+def test_probe_reads_the_start_timecode(tmp_path, fps, tc_frame, drop, tc):
+    path = _write(tmp_path, "tc.mov", mov_stub_bytes(frames=24, fps=fps, tc_frame=tc_frame, drop_frame=drop))
+    info = quicktime.probe(path)
+    assert info.timecode == tc
+    assert info.frames == 24
+
+
+def test_moov_after_mdat_is_found(tmp_path):
+    ftyp, moov, mdat = _split_atoms(mov_stub_bytes(frames=12, payload=1 << 16))
+    info = quicktime.probe(_write(tmp_path, "tail.mov", ftyp + mdat + moov))
+    assert info.frames == 12
+
+
+def test_files_without_a_header(tmp_path):
+    ftyp, _moov, mdat = _split_atoms(mov_stub_bytes())
+    assert quicktime.probe(_write(tmp_path, "nomoov.mov", ftyp + mdat)) is None
+    bad = _write(tmp_path, "text.mov", b"not a movie at all")
+    good = _write(tmp_path, "good.mov", mov_stub_bytes(frames=5))
+    infos = quicktime.probe_many([bad, good, good])
+    assert set(infos) == {bad, good}
+    assert infos[bad] is None and infos[good].frames == 5
+
+
+@pytest.mark.parametrize("frame, fps, drop, tc", [
+    (0, 24, False, "00:00:00:00"),
+    (86400, 24, False, "01:00:00:00"),
+    (1799, 30, True, "00:00:59;29"),
+    (1800, 30, True, "00:01:00;02"),
+    (17982, 30, True, "00:10:00;00"),
+    (107892, 30, True, "01:00:00;00"),
+])
+def test_timecode(frame, fps, drop, tc):
+    assert quicktime.frames_to_timecode(frame, fps, drop) == tc
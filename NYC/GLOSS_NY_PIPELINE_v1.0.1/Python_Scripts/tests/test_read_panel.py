@@ -0,0 +1,30 @@
+# tests/test_read_panel.py
+# Lazy Gloss UI on bulk-imported Reads, against the stand-in nuke.
+
+from benchmarks import fake_nuke
+
+fake_nuke.install()
+
+from read_node import ui_read_panel  # noqa: E402  (needs `nuke` installed first)
+from read_node.bulk_import import create_reads  # noqa: E402
+
+
+def _open_panel(node):
+    fake_nuke._context.append((node, fake_nuke.Knob("showPanel")))
+    try:
+        ui_read_panel._on_show_panel()
+    finally:
+        fake_nuke._context.pop()
+
+
+def test_only_bulk_created_reads_get_the_ui_on_open():
+    fake_nuke.reset()
+    (bulk,), errors = create_reads([{"file": "/plates/A010.mov", "knobs": {"first": 1, "last": 10}}])
+    by_hand = fake_nuke.nodes.Read(file="/plates/B010.mov")
+    assert not errors
+
+    _open_panel(bulk)
+    _open_panel(by_hand)
+    assert bulk.knob("_gloss_ui_installed") is not None
+    assert by_hand.knob("_gloss_ui_installed") is None
+    assert by_hand.knob(ui_read_panel.LAZY_UI_MARKER) is None
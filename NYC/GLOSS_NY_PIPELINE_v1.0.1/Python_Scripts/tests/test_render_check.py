@@ -0,0 +1,63 @@
+# tests/test_render_check.py
+# afterRender completeness check against the stand-in nuke (benchmarks/fake_nuke.py).
+
+import pytest
+
+from benchmarks import fake_nuke
+
+fake_nuke.install()
+
+from write_nodes import render_check as rc  # noqa: E402  (needs `nuke` installed first)
+from write_nodes.render_queue import executed_ranges  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _log_in_tmp(tmp_path, monkeypatch):
+    monkeypatch.setattr(rc, "CHECK_LOG_FILE", str(tmp_path / "render_checks.log"))
+
+
+def _render(write, frames):
+    """Run the Write's render hooks as Nuke would for `frames`, writing one file per frame."""
+    fake_nuke._context.append((write, None))
+    try:
+        rc.begin_render()
+        for f in frames:
+            fake_nuke.frame(f)
+            with open(write["file"].value() % f, "wb") as fh:
+                fh.write(b"x" * 100)
+            rc.note_rendered_frame()
+        rc.after_render_check()
+    finally:
+        fake_nuke._context.pop()
+
+
+def test_checks_the_frames_actually_rendered(tmp_path):
+    fake_nuke.reset()
+    fake_nuke.root()["first_frame"].setValue(1)
+    fake_nuke.root()["last_frame"].setValue(100)
+    w = fake_nuke.nodes.Write(file=str(tmp_path / "out.%04d.exr"))
+
+    _render(w, range(11, 16))
+    assert w["label"].value() == "Frames: 5/5 OK"
+
+    # A later render of other frames does not inherit the earlier range.
+    _render(w, [40, 41])
+    assert w["label"].value() == "Frames: 2/2 OK"
+
+
+def test_falls_back_to_the_write_range_without_frame_hooks(tmp_path):
+    fake_nuke.reset()
+    w = fake_nuke.nodes.Write(file=str(tmp_path / "out.%04d.exr"), use_limit=True, first=1, last=4)
+    open(str(tmp_path / "out.0001.exr"), "wb").write(b"x")
+    fake_nuke._context.append((w, None))
+    try:
+        rc.after_render_check()
+    finally:
+        fake_nuke._context.pop()
+    assert w["label"].value() == "Frames: 1/4 3 missing"
+
+
+def test_executed_ranges_span_the_chunks():
+    chunks = [{"write": "A", "first": 11, "last": 20}, {"write": "B", "first": 1, "last": 5},
+              {"write": "A", "first": 1, "last": 10}]
+    assert executed_ranges(chunks) == {"A": (1, 20), "B": (1, 5)}
@@ -0,0 +1,43 @@
+# tests/test_render_queue.py
+# Chunking and cancellation of the local render queue, with a stand-in render command.
+
+import sys
+import threading
+import time
+
+from benchmarks import fake_nuke
+
+fake_nuke.install()
+
+from write_nodes import render_queue as rq  # noqa: E402  (needs `nuke` installed first)
+
+
+def test_single_file_writes_render_as_one_chunk():
+    fake_nuke.reset()
+    fake_nuke.root()["first_frame"].setValue(1001)
+    fake_nuke.root()["last_frame"].setValue(1030)
+    fake_nuke.nodes.Write(name="Gloss_Final_Write", file="/out/shot.%04d.exr")
+    fake_nuke.nodes.Write(name="Gloss_Review_Write", file="/out/shot.mov", file_type="mov")
+    fake_nuke.nodes.Write(name="Gloss_DN_Write", file="/out/shot_dn.mp4", file_type="")
+
+    chunks = rq.chunks_from_script(chunk_size=10)
+    by_write = {}
+    for c in chunks:
+        by_write.setdefault(c["write"], []).append((c["first"], c["last"]))
+    assert by_write["Gloss_Final_Write"] == [(1001, 1010), (1011, 1020), (1021, 1030)]
+    assert by_write["Gloss_Review_Write"] == [(1001, 1030)]
+    assert by_write["Gloss_DN_Write"] == [(1001, 1030)]
+
+
+def test_cancel_terminates_running_renders():
+    chunks = rq.build_chunks([("Gloss_Final_Write", 1, 4)], chunk_size=1)
+    cancel = threading.Event()
+    cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+    threading.Timer(0.5, cancel.set).start()
+
+    t0 = time.time()
+    result = rq.run_queue("unused.nk", chunks, command=cmd, workers=2, retries=2, cancel_event=cancel)
+    assert time.time() - t0 < 10
+    assert not result["done"]
+    assert [c["error"] for c in result["failed"]] == ["canceled"] * 4
+    assert all(c["attempts"] <= 1 for c in result["failed"])
@@ -0,0 +1,48 @@
+# tests/test_retouch_scan.py
+# Incremental RETOUCH scanner on a tmp tree.
+
+import os
+
+import pytest
+
+from tools import retouch_scan
+
+
+@pytest.fixture
+def retouch(tmp_path, monkeypatch):
+    monkeypatch.setattr(retouch_scan, "STATE_DIR", str(tmp_path / "state"))
+    base = tmp_path / "RETOUCH"
+    for date, clips in (("20250101", ["A_CHN_v001.mov"]), ("20250102", ["B_CHN_v001.mov"]),
+                        ("20250103", ["C_CHN_v001.mov", "C_notes.txt"])):
+        (base / date).mkdir(parents=True)
+        for c in clips:
+            (base / date / c).write_bytes(b"x")
+    return str(base)
+
+
+def _count_io(monkeypatch):
+    touched = []
+    real_stat, real_scandir = os.stat, os.scandir
+    monkeypatch.setattr(retouch_scan.os, "stat", lambda p, *a, **k: touched.append(p) or real_stat(p, *a, **k))
+    monkeypatch.setattr(retouch_scan.os, "scandir", lambda p: touched.append(p) or real_scandir(p))
+    return touched
+
+
+def test_full_scan_then_cached(retouch):
+    first = retouch_scan.scan_retouch("101000_JOB", base_path=retouch)
+    assert [d for d, _ in first["folders"]] == ["20250101", "20250102", "20250103"]
+    assert [os.path.basename(c) for c in first["new"]] == ["A_CHN_v001.mov", "B_CHN_v001.mov", "C_CHN_v001.mov"]
+    again = retouch_scan.scan_retouch("101000_JOB", base_path=retouch)
+    assert again["rescanned"] == 0 and again["new"] == []
+
+
+def test_latest_only_touches_the_newest_folder_alone(retouch, monkeypatch):
+    touched = _count_io(monkeypatch)
+    result = retouch_scan.scan_retouch("101000_JOB", latest_only=True, base_path=retouch)
+    assert [d for d, _ in result["folders"]] == ["20250103"]
+    assert [os.path.basename(c) for c in result["folders"][0][1]] == ["C_CHN_v001.mov"]
+    assert not any(("20250101" in p) or ("20250102" in p) for p in map(str, touched))
+
+    # The older folders are still listed by the next full scan.
+    full = retouch_scan.scan_retouch("101000_JOB", base_path=retouch)
+    assert [d for d, _ in full["folders"]] == ["20250101", "20250102", "20250103"]
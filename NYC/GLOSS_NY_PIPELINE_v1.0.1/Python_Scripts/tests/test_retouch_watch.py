@@ -0,0 +1,31 @@
+# tests/test_retouch_watch.py
+# inotify event handling of the RETOUCH watcher, with a scripted event source.
+
+from tools import retouch_watch as rw
+
+ISDIR_CREATE = rw._Inotify.IN_ISDIR | rw._Inotify.IN_CREATE
+
+
+class _ScriptedInotify(object):
+    def __init__(self, reads):
+        self.reads = list(reads)
+
+    def read(self, timeout):
+        return self.reads.pop(0) if self.reads else []
+
+
+def test_events_arriving_while_settling_are_handled(monkeypatch):
+    monkeypatch.setattr(rw.time, "sleep", lambda s: None)
+    watcher = rw.RetouchWatcher(["JOB_A", "JOB_B"])
+    refreshed, rewatched = [], []
+    watcher.refresh_job = refreshed.append
+    watcher._watch_tree = lambda ino, watched: rewatched.append(True)
+    watched = {"/cloud/JOB_A/RETOUCH": "JOB_A", "/cloud/JOB_B/RETOUCH": "JOB_B"}
+
+    first = [("/cloud/JOB_A/RETOUCH", "clip_v001.mov", rw._Inotify.IN_CLOSE_WRITE)]
+    settle = [[("/cloud/JOB_B/RETOUCH", "20260101", ISDIR_CREATE)],
+              [("/cloud/JOB_A/RETOUCH", "clip_v002.mov", rw._Inotify.IN_MOVED_TO)]]
+    watcher._handle_events(_ScriptedInotify(settle), watched, first)
+
+    assert refreshed == ["JOB_A", "JOB_B"]
+    assert rewatched == [True]
@@ -0,0 +1,33 @@
+# tests/test_sequences.py
+# Sequence helpers that list a folder once instead of globbing per frame.
+
+from gloss_utils.sequences import group_frames, scan_sequence
+
+
+def _touch(folder, names, size=10):
+    for n in names:
+        (folder / n).write_bytes(b"x" * size)
+
+
+def test_scan_sequence_matches_only_its_frames(tmp_path):
+    _touch(tmp_path, ["A010.1001.exr", "A010.1002.exr", "A010.1004.exr",
+                      "A010.10001.exr",            # wider than the padding: still a frame
+                      "A010_v2.1001.exr", "A010.1001.exr.tmp", "B010.1001.exr", "A010.abc.exr"])
+    (tmp_path / "A010.1003.exr").write_bytes(b"")
+    for style in ("A010.%04d.exr", "A010.####.exr", "A010.1001.exr"):
+        frames = scan_sequence(str(tmp_path / style))
+        assert sorted(frames) == [1001, 1002, 1003, 1004, 10001], style
+    assert scan_sequence(str(tmp_path / "A010.%04d.exr"))[1003].st_size == 0
+
+
+def test_scan_sequence_missing_or_not_a_sequence(tmp_path):
+    assert scan_sequence(str(tmp_path / "gone" / "A010.%04d.exr")) == {}
+    assert scan_sequence(str(tmp_path / "clip.mov")) == {}
+
+
+def test_group_frames_without_touching_disk():
+    names = ["A.1001.exr", "A.1002.exr", "A.1005.exr", "A.0001.exr", "B_v002.mov",
+             "C.1001.exr", "D.1001.dpx", "D.1002.dpx", "notes.txt", "E_0010.tif", "E_0011.tif"]
+    seqs, other = group_frames(names, (".exr", ".tif"))
+    assert seqs == {"A.####.exr": (1, 1005, 4), "E_####.tif": (10, 11, 2)}
+    assert sorted(other) == ["B_v002.mov", "C.1001.exr", "D.1001.dpx", "D.1002.dpx", "notes.txt"]
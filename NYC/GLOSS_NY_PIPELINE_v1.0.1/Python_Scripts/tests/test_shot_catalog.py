@@ -0,0 +1,90 @@
+import os
+import shutil
+
+import pytest
+
+from benchmarks.synth_tree import make_tree, job_code, project_names, shot_name
+from gloss_utils import catalog, paths_nyc
+from tools.shot_catalog import ShotCatalog
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    t = make_tree(str(tmp_path / "san"), projects=3, shots=4, frames=3, dates=2)
+    monkeypatch.setattr(paths_nyc, "GLOSS_ROOT", t["gloss_root"])
+    monkeypatch.setattr(paths_nyc, "CLOUD_ROOT", t["cloud_root"])
+    monkeypatch.setattr(catalog, "CATALOG_FILE", str(tmp_path / "catalog.sqlite"))
+    monkeypatch.setattr(catalog, "_local", type(catalog._local)())
+    return t
+
+
+def _catalog(tree):
+    return ShotCatalog(catalog.CATALOG_FILE, tree["gloss_root"], tree["cloud_root"])
+
+
+def test_crawl_fills_jobs_shots_media_and_scripts(tree):
+    cat = _catalog(tree)
+    s = cat.crawl(threads=4)
+    assert s["jobs"] == 3 and s["shots"] == 12
+    job = cat.job(job_code(0))
+    assert (job["project"], job["cloud"]) == project_names(0)
+    assert job["approved_new"] and not job["approved_old"]   # even projects use the new layout
+    assert cat.job(job_code(1))["approved_old"]
+
+    shot = shot_name(0, 1)
+    roles = {m["role"]: m for m in cat.media(job_code(0), shot)}
+    assert roles["plate"]["kind"] == "sequence" and roles["plate"]["frames"] == 3
+    assert roles["retouch"]["kind"] == "mov" and roles["retouch"]["fps"]
+    assert [r["task"] for r in cat.scripts(job_code(0), shot)] == ["COMP"]
+    assert [h["key"] for h in cat.find_shots(shot)][0] == shot.lower()
+
+
+def test_get_catalog_never_creates_and_rechecks_roots(tree):
+    assert catalog.get_catalog() is None
+    assert not os.path.exists(catalog.CATALOG_FILE)
+
+    other = ShotCatalog(catalog.CATALOG_FILE, "/elsewhere/GlossPost", tree["cloud_root"])
+    other.crawl(threads=4)
+    assert catalog.get_catalog() is None            # built for other mounts
+    _catalog(tree).crawl(threads=4)
+    assert catalog.get_catalog() is not None        # same thread picks up the new crawl
+
+
+def test_paths_use_catalog_hint_without_listing(tree, monkeypatch):
+    _catalog(tree).crawl(threads=4)
+    listed = []
+    real = paths_nyc._listdir_safe
+    monkeypatch.setattr(paths_nyc, "_listdir_safe", lambda p: listed.append(p) or real(p))
+    assert paths_nyc.find_project_folder_by_job_code(job_code(2)) == project_names(2)[0]
+    assert listed == []
+
+
+def test_refresh_falls_back_to_a_full_crawl(tree):
+    s = _catalog(tree).refresh(threads=4)
+    assert s["full"] and s["jobs"] == 3
+
+
+def test_refresh_picks_up_changes_only(tree):
+    cat = _catalog(tree)
+    cat.crawl(threads=4)
+    s = cat.refresh(threads=4)
+    assert (s["full"], s["changed"], s["listed"], s["removed"], s["pending"]) == (False, 0, 0, 0, 0)
+
+    project = project_names(0)[0]
+    plates = os.path.join(tree["gloss_root"], project, f"IN-{job_code(0)}", "FOOTAGE", "PLATES")
+    new_shot = os.path.join(plates, "P000_SH9001")
+    os.makedirs(new_shot)
+    for f in (1001, 1002, 1003, 1004):
+        open(os.path.join(new_shot, f"P000_SH9001.{f}.exr"), "wb").close()
+    shutil.rmtree(os.path.join(plates, shot_name(0, 1)))
+
+    s = cat.refresh(threads=4)
+    assert not s["full"] and s["pending"] == 0
+    assert s["removed"] == 1 and s["media"] == 1
+    plate = [m for m in cat.media(job_code(0), "P000_SH9001") if m["role"] == "plate"]
+    assert [(m["first"], m["last"], m["frames"]) for m in plate] == [(1001, 1004, 4)]
+    assert cat.find_shots("P000_SH9001")[0]["key"] == "p000_sh9001"
+    # The removed plate folder's shot keeps its other media (retouch MOVs, task script).
+    assert [m["role"] for m in cat.media(job_code(0), shot_name(0, 1)) if m["role"] == "plate"] == []
+    assert cat.scripts(job_code(0), shot_name(0, 1))
+
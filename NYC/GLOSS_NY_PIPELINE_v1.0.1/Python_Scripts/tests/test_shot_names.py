@@ -0,0 +1,45 @@
+import pytest
+
+from gloss_utils.shot_names import ShotIndex, parse, parse_path, shot_key
+
+
+@pytest.mark.parametrize("name, base, dept, version", [
+    ("SH010_Hero_CHNv001.mov", "SH010_Hero", "CHN", 1),
+    ("sh010-hero_comp_v12.mov", "sh010-hero", "Comp", 12),
+    ("SH010_CHN003.mov", "SH010", "CHN", 3),
+    ("SH010-comp-v3", "SH010", "Comp", 3),
+    ("SH010_Hero_DN_v01", "SH010_Hero", "DN", 1),
+    ("SH010_Hero_v004.mov", "SH010_Hero_v004", None, 4),
+    ("SH010", "SH010", None, None),
+])
+def test_parse(name, base, dept, version):
+    sn = parse(name)
+    assert (sn.base, sn.dept, sn.version) == (base, dept, version)
+
+
+def test_versioned_plate_pairs_with_its_retouch():
+    plate, retouch = parse("SH010_v002.mov"), parse("SH010_v002_CHNv001.mov")
+    assert plate.key == retouch.key == "sh010_v002"
+    assert plate.is_original and not retouch.is_original
+
+
+def test_department_word_inside_the_name_is_not_a_tag():
+    sn = parse("Nike_Track_Spikes.mov")
+    assert sn.base == "Nike_Track_Spikes" and sn.dept is None
+    assert sn.key != parse("Nike_Track_Laces.mov").key
+
+
+def test_key_ignores_case_and_separators():
+    assert parse("SH010-Hero.mov").key == parse("sh010_hero.mov").key == "sh010_hero"
+
+
+def test_sequence_uses_its_folder():
+    assert parse_path("/job/DN/SH010_Hero_DN_v01/SH010_Hero_DN_v01.%04d.exr").dept == "DN"
+    assert shot_key("/job/plates/SH010_Hero/SH010_Hero.####.exr") == "sh010_hero"
+
+
+def test_index_prefers_the_original():
+    index = ShotIndex([("chn", "/cloud/SH010_v002_CHNv001.mov"), ("plate", "/post/SH010_v002.mov")])
+    assert index.first("/cloud/SH010_v002_CHNv002.mov") == "plate"
+    assert index.original("sh010_v002", exclude="plate") is None
+    assert index.first("sh010_v002", exclude="plate") == "chn"
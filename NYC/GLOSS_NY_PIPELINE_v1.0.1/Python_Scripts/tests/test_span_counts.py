@@ -0,0 +1,63 @@
+# tests/test_span_counts.py
+# SAN round trips are counted where they happen (I/O helpers), not estimated per op.
+
+import os
+import time
+
+import pytest
+
+from benchmarks.synth_tree import make_tree, job_code, project_names
+from gloss_utils import catalog, paths_nyc
+from gloss_utils.nuke_helpers import span, recent_spans
+from tools import retouch_scan
+from tools.shot_catalog import ShotCatalog
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    t = make_tree(str(tmp_path / "san"), projects=2, shots=2, frames=2, dates=2)
+    monkeypatch.setattr(paths_nyc, "GLOSS_ROOT", t["gloss_root"])
+    monkeypatch.setattr(paths_nyc, "CLOUD_ROOT", t["cloud_root"])
+    monkeypatch.setattr(catalog, "CATALOG_FILE", str(tmp_path / "catalog.sqlite"))
+    monkeypatch.setattr(catalog, "_local", type(catalog._local)())
+    monkeypatch.setattr(retouch_scan, "STATE_DIR", str(tmp_path / "state"))
+    return t
+
+
+def test_approved_lookup_counts_its_checks(tree):
+    with span("test.approved") as sp:
+        paths_nyc.find_approved_folder(job_code(0), project_names(0)[0], prefer="new")
+    # project hint absent: one root listing for the cloud folder + the two exists checks
+    assert sp.san_calls == 3
+
+
+def test_dialog_time_is_excluded(tree, monkeypatch):
+    def slow_dialog(new_path, old_path, creating=False):
+        time.sleep(0.2)
+        return "new"
+    monkeypatch.setattr(paths_nyc, "_ask_which_approved", slow_dialog)
+    os.makedirs(paths_nyc.approved_old_path(job_code(0)))
+    with span("test.dialog") as sp:
+        paths_nyc.find_approved_folder(job_code(0), project_names(0)[0])
+    assert sp.wait >= 0.2
+    assert recent_spans("test.dialog")[-1]["ms"] < 150
+
+
+def test_retouch_scan_counts_each_listing(tree):
+    job = project_names(0)[1]
+    base = os.path.join(tree["cloud_root"], job, *retouch_scan.RETOUCH_SUB)
+    retouch_scan.scan_retouch(job, base_path=base)
+    cold = recent_spans("retouch_scan.scan_retouch")[-1]["san_calls"]
+    retouch_scan.scan_retouch(job, base_path=base)
+    warm = recent_spans("retouch_scan.scan_retouch")[-1]["san_calls"]
+    # cold: root stat + listing, then a stat and a listing per date folder
+    assert (cold, warm) == (2 + 2 * 2, 1 + 2)
+
+
+def test_catalog_crawl_counts_pool_listings(tree):
+    cat = ShotCatalog(catalog.CATALOG_FILE, tree["gloss_root"], tree["cloud_root"])
+    stats = cat.crawl(threads=4, probe=False)
+    rec = recent_spans("shot_catalog.crawl")[-1]
+    # two root listings, then at least a stat and a listing per crawled folder
+    assert rec["san_calls"] >= 2 + 2 * stats["dirs"]
+    cat.close()
@@ -0,0 +1,42 @@
+# tests/test_task_script.py
+# Task script plan for MOVs: values from the Read win; the QuickTime header fills the gaps.
+
+import glob
+import os
+
+import pytest
+
+from benchmarks.synth_tree import make_tree
+from gloss_utils import catalog, paths_nyc, quicktime
+from read_node import ops_read_tools as ops
+
+
+@pytest.fixture
+def mov(tmp_path, monkeypatch):
+    t = make_tree(str(tmp_path / "san"), projects=1, shots=1, frames=1, dates=1)
+    monkeypatch.setattr(paths_nyc, "GLOSS_ROOT", t["gloss_root"])
+    monkeypatch.setattr(paths_nyc, "CLOUD_ROOT", t["cloud_root"])
+    monkeypatch.setattr(catalog, "CATALOG_FILE", str(tmp_path / "no_catalog.sqlite"))
+    monkeypatch.setattr(catalog, "_local", type(catalog._local)())
+    return sorted(glob.glob(os.path.join(t["cloud_root"], "*", "VFX-CHN", "RETOUCH", "*", "*.mov")))[0]
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    seen = []
+    real = quicktime.probe
+    monkeypatch.setattr(quicktime, "probe", lambda p: seen.append(p) or real(p))
+    return seen
+
+
+def test_read_values_skip_the_header(mov, probes):
+    plan = ops.task_script_plan(mov, "COMP", sequence=False, width=3840, height=2160,
+                                fps=25.0, first=11, last=59)
+    assert probes == []
+    assert (plan["width"], plan["height"], plan["fps"], plan["first"], plan["last"]) == (3840, 2160, 25.0, 11, 59)
+
+
+def test_missing_range_comes_from_the_header(mov, probes):
+    plan = ops.task_script_plan(mov, "COMP", sequence=False, width=3840, height=2160, fps=25.0)
+    assert probes == [mov]
+    assert (plan["width"], plan["first"], plan["last"]) == (3840, 1, 48)
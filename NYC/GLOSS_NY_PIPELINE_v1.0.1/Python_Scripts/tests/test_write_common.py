@@ -0,0 +1,67 @@
+# tests/test_write_common.py
+# Write helpers (write_nodes/common.py) against the stand-in nuke.
+
+from benchmarks import fake_nuke
+
+fake_nuke.install()
+
+from write_nodes import common  # noqa: E402  (needs `nuke` installed first)
+
+
+def test_save_refresh_drops_only_deleted_writes(monkeypatch):
+    fake_nuke.reset(clear_callbacks=True)
+    warnings = []
+    monkeypatch.setattr(common, "log_warning", warnings.append)
+    monkeypatch.setattr(common, "_PATH_REFRESH", [])
+
+    def refresh(w):
+        if w.name() == "Broken":
+            raise ValueError("bad template")
+        w["file"].setValue(f"/renders/{w.name()}.%04d.exr")
+
+    kept, broken, gone = (fake_nuke.nodes.Write(name=n) for n in ("Kept", "Broken", "Gone"))
+    for w in (kept, broken, gone):
+        common.register_path_refresh(w, refresh)
+    fake_nuke.delete(gone)
+
+    common._refresh_paths_on_save()
+    assert [w.name() for w, _ in common._PATH_REFRESH] == ["Kept", "Broken"]
+    assert kept["file"].value() == "/renders/Kept.%04d.exr"
+    assert warnings == ["Write path refresh failed for Broken: bad template"]
+
+
+def test_output_folders_are_recreated_every_render(tmp_path):
+    fake_nuke.reset()
+    w = fake_nuke.nodes.Write(file=str(tmp_path / "out" / "a.%04d.exr"))
+    assert common.ensure_output_dirs([w]) == [str(tmp_path / "out")]
+    (tmp_path / "out").rmdir()
+    common.ensure_output_dirs([w])
+    assert (tmp_path / "out").is_dir()
+
+
+def test_vfx_layout_is_chosen_at_render_time(tmp_path):
+    fake_nuke.reset()
+    in_root = tmp_path / "101000_PRJ" / "IN-101000"
+    w = fake_nuke.nodes.Write(file=f"{in_root}/VFX-NY/2026-10-18/clip_v001.mov")
+
+    # Only the old layout exists: render into FOOTAGE/VFX-NY.
+    (in_root / "FOOTAGE" / "VFX-NY").mkdir(parents=True)
+    common.ensure_output_dirs([w])
+    assert w["file"].value() == f"{in_root}/FOOTAGE/VFX-NY/2026-10-18/clip_v001.mov"
+    assert not (in_root / "VFX-NY").exists()
+
+    # The new layout was created since: the next render switches back.
+    (in_root / "VFX-NY").mkdir()
+    common.ensure_output_dirs([w])
+    assert w["file"].value() == f"{in_root}/VFX-NY/2026-10-18/clip_v001.mov"
+    assert (in_root / "VFX-NY" / "2026-10-18").is_dir()
+
+
+def test_render_hooks_keep_existing_callbacks():
+    fake_nuke.reset()
+    w = fake_nuke.nodes.Write(beforeRender="import studio_tools; studio_tools.pre_render()")
+    common.install_render_hook(w)
+    common.install_render_hook(w)
+    assert w["beforeRender"].value() == "import studio_tools; studio_tools.pre_render()\n" + common.RENDER_HOOK_CMD
+    assert w["afterFrameRender"].value() == common.RENDER_FRAME_CMD
+    assert w["afterRender"].value() == common.RENDER_CHECK_CMD
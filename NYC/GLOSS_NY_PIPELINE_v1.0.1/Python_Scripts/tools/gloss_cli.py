@@ -0,0 +1,270 @@
+# tools/gloss_cli.py
+# Headless `gloss` command line for pipeline operations (no Nuke, no license).
+# - seq      sequence detection: pattern style, padding, frame range
+# - job      job code / project folder / PROGRESS, VFX-NY and Approved paths for any file
+# - approve  Send to Approved for many MOVs/sequences in parallel
+# - retouch  incremental RETOUCH scan of a CloudSync job (optionally with QuickTime headers)
+# - task     task-script creation (same plan/writer as the Read panel's Create Task Script)
+#
+# Reuses gloss_utils and read_node.ops_read_tools; their nuke import is optional.
+# --gloss-root/--cloud-root (or GLOSS_POST_ROOT/GLOSS_CLOUD_ROOT) point at another mount.
+#
+# Usage:
+#   python -m tools.gloss_cli seq /path/A001_C002.%04d.exr
+#   python -m tools.gloss_cli job /Volumes/san-01/CloudSync/101181_CK_FA25/...mov --json
+#   python -m tools.gloss_cli approve *.mov --prefer new --workers 16
+#   python -m tools.gloss_cli retouch 101181_CK_FA25 --latest --probe
+#   python -m tools.gloss_cli task /path/shot_v001.mov --task COMP
+#   ./gloss <command> ...          (wrapper next to this package)
+
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_WORKERS = max(1, min(32, (os.cpu_count() or 4) * 2))
+
+
+def _out(args, data, lines):
+    if args.json:
+        print(json.dumps(data, indent=2, default=str))
+    else:
+        for line in lines:
+            print(line)
+
+
+# ===============================
+# Commands
+# ===============================
+def cmd_seq(args):
+    from gloss_utils import sequences as S
+    rows = []
+    for path in args.paths:
+        det = S.detect_pattern(path)
+        rng = S.detect_frame_range(path) if det else None
+        rows.append({
+            "path": path,
+            "sequence": bool(det),
+            "style": det[0] if det else None,
+            "padding": S.padding_width(path) if det else None,
+            "printf": S.to_printf(path) if det else None,
+            "first": rng[0] if rng else None,
+            "last": rng[1] if rng else None,
+            "count": rng[2] if rng else 0,
+            "missing": (rng[1] - rng[0] + 1 - rng[2]) if rng else None,
+        })
+    lines = []
+    for r in rows:
+        if not r["sequence"]:
+            lines.append(f"{r['path']}: not a sequence")
+        elif r["first"] is None:
+            lines.append(f"{r['path']}: {r['style']} pattern, no frames on disk")
+        else:
+            gap = f", {r['missing']} missing" if r["missing"] else ""
+            lines.append(f"{r['printf']}: {r['first']}-{r['last']} ({r['count']} frames{gap})")
+    _out(args, rows, lines)
+    return 0 if all(r["sequence"] for r in rows) else 1
+
+
+def cmd_job(args):
+    from gloss_utils import paths_nyc as P
+    rows = []
+    for path in args.paths:
+        code, project = P.derive_job_from_path(path)
+        rows.append({
+            "path": path,
+            "job_code": code,
+            "project_folder": project,
+            "progress_nuke": P.progress_nuke_base(project) if project else None,
+            "vfx_ny": P.vfx_ny_dir(project, code) if project else None,
+            "approved_new": P.approved_new_path(project, code) if project else None,
+            "approved_old": P.approved_old_path(code) if code else None,
+        })
+    lines = []
+    for r in rows:
+        lines.append(r["path"])
+        for key in ("job_code", "project_folder", "progress_nuke", "vfx_ny", "approved_new", "approved_old"):
+            lines.append(f"  {key:15} {r[key] or '-'}")
+    _out(args, rows, lines)
+    return 0 if all(r["job_code"] for r in rows) else 1
+
+
+def cmd_approve(args):
+    from read_node.ops_read_tools import send_to_approved
+
+    if args.dry_run:
+        # Same resolver as send_to_approved, minus the folder creation
+        from gloss_utils import paths_nyc as P
+        rows = []
+        for path in args.paths:
+            code, project = P.derive_job_from_path(path)
+            approved = P.find_approved_folder(code, project, prefer=args.prefer, create=False) if code else None
+            rows.append({"src": path, "job_code": code, "approved": approved})
+        _out(args, rows, [f"{r['src']} -> {r['approved'] or 'UNRESOLVED'}" for r in rows])
+        return 0 if all(r["approved"] for r in rows) else 1
+
+    # Paths run in parallel; each sequence copies its frames in parallel as well
+    results, errors = [], []
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(send_to_approved, p, None, args.overwrite, args.prefer): p for p in args.paths}
+        for fut in as_completed(futures):
+            src = futures[fut]
+            try:
+                results.append(fut.result())
+            except FileExistsError as e:
+                errors.append({"src": src, "error": f"exists (use --overwrite): {e}"})
+            except Exception as e:
+                errors.append({"src": src, "error": str(e)})
+
+    lines = [f"{r['src']} -> {r['dst']} ({r['files']} file(s))" for r in results]
+    lines += [f"FAILED {e['src']}: {e['error']}" for e in errors]
+    lines.append(f"{len(results)} copied, {len(errors)} failed")
+    _out(args, {"copied": results, "failed": errors}, lines)
+    return 1 if errors else 0
+
+
+def cmd_retouch(args):
+    from tools.retouch_scan import scan_retouch
+    from gloss_utils.shot_names import parse as parse_shot_name
+
+    result = scan_retouch(args.job, latest_only=args.latest)
+    paths = [p for _d, clips in result["folders"] for p in clips]
+    infos = {}
+    if args.probe:
+        from gloss_utils import quicktime
+        infos = quicktime.probe_many(paths, workers=args.workers)
+
+    clips = []
+    for date_folder, folder_clips in result["folders"]:
+        for p in folder_clips:
+            sn = parse_shot_name(os.path.basename(p))
+            rec = {"path": p, "date_folder": date_folder, "shot": sn.base, "dept": sn.dept,
+                   "version": sn.version, "new": p in result["new"]}
+            if infos.get(p):
+                rec.update(infos[p]._asdict())
+            clips.append(rec)
+
+    lines = []
+    for c in clips:
+        extra = f"  {c.get('frames')}f @ {c.get('fps')}" if c.get("frames") else ""
+        lines.append(f"{'* ' if c['new'] else '  '}{c['date_folder']}  {os.path.basename(c['path'])}{extra}")
+    lines.append(f"{len(clips)} clip(s), {len(result['new'])} new, "
+                 f"{result['rescanned']} folder(s) re-listed in {result['elapsed']:.2f}s")
+    _out(args, {"base": result["base"], "clips": clips, "rescanned": result["rescanned"],
+                "elapsed": result["elapsed"]}, lines)
+    return 0
+
+
+def _parse_res(text):
+    """argparse type for --res: 'WxH' -> (width, height)."""
+    w, _, h = (text or "").lower().partition("x")
+    try:
+        width, height = int(w), int(h)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WxH, e.g. 1920x1080, got {text!r}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"resolution must be positive, got {text!r}")
+    return width, height
+
+
+def _parse_range(text):
+    """argparse type for --range: 'first-last' (or a single frame) -> (first, last)."""
+    a, _, b = (text or "").partition("-")
+    try:
+        first, last = int(a), int(b or a)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected first-last, e.g. 1001-1100, got {text!r}")
+    if last < first:
+        raise argparse.ArgumentTypeError(f"last frame before first, got {text!r}")
+    return first, last
+
+
+def cmd_task(args):
+    from read_node.ops_read_tools import task_script_plan, write_task_script
+
+    width, height = args.res or (None, None)
+    first, last = args.range or (None, None)
+    try:
+        plan = task_script_plan(args.path, args.task, width=width, height=height,
+                                fps=args.fps, first=first, last=last)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    if plan["existing"]:
+        plan["action"] = "existing"
+    elif args.dry_run:
+        plan["action"] = "would create"
+    elif not (plan["width"] and plan["height"]):
+        print("error: resolution unknown for this source; pass --res WxH", file=sys.stderr)
+        return 1
+    else:
+        write_task_script(plan)
+        plan["action"] = "created"
+
+    path = plan["existing"] if plan["action"] == "existing" else plan["script"]
+    _out(args, plan, [
+        f"{plan['action']}: {path}",
+        f"  {plan['clip']}  {plan['width']}x{plan['height']}  {plan['fps']} fps  {plan['first']}-{plan['last']}",
+    ])
+    return 0
+
+
+# ===============================
+# Entry point
+# ===============================
+def build_parser():
+    ap = argparse.ArgumentParser(prog="gloss", description="Headless GLOSS NYC pipeline operations.")
+    ap.add_argument("--json", action="store_true", help="machine-readable output")
+    ap.add_argument("--gloss-root", help="GlossPost root (default $GLOSS_POST_ROOT or the SAN mount)")
+    ap.add_argument("--cloud-root", help="CloudSync root (default $GLOSS_CLOUD_ROOT or the SAN mount)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("seq", help="detect sequences and frame ranges")
+    p.add_argument("paths", nargs="+")
+    p.set_defaults(func=cmd_seq)
+
+    p = sub.add_parser("job", help="resolve job code and pipeline folders for paths")
+    p.add_argument("paths", nargs="+")
+    p.set_defaults(func=cmd_job)
+
+    p = sub.add_parser("approve", help="copy MOVs/sequences to their job's Approved folder")
+    p.add_argument("paths", nargs="+")
+    p.add_argument("--prefer", choices=("new", "old"), default="new",
+                   help="Approved folder to use/create when both or neither exist (default new)")
+    p.add_argument("--overwrite", action="store_true", help="replace existing single files")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    p.add_argument("--dry-run", action="store_true", help="only show where each path would go")
+    p.set_defaults(func=cmd_approve)
+
+    p = sub.add_parser("retouch", help="scan a CloudSync job's RETOUCH deliveries")
+    p.add_argument("job", help="CloudSync job folder, e.g. 101181_CK_FA25")
+    p.add_argument("--latest", action="store_true", help="only the newest date folder")
+    p.add_argument("--probe", action="store_true", help="read QuickTime headers (fps, frames, timecode)")
+    p.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    p.set_defaults(func=cmd_retouch)
+
+    p = sub.add_parser("task", help="create (or find) a task script for a plate/MOV")
+    p.add_argument("path")
+    p.add_argument("--task", default="COMP", help="task folder name, e.g. COMP, ROTO, PAINT (default COMP)")
+    p.add_argument("--res", type=_parse_res, help="WxH, required for sequences")
+    p.add_argument("--fps", type=float)
+    p.add_argument("--range", type=_parse_range, help="first-last frame override")
+    p.add_argument("--dry-run", action="store_true")
+    p.set_defaults(func=cmd_task)
+    return ap
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Before any pipeline import: the roots are read at import time
+    if args.gloss_root:
+        os.environ["GLOSS_POST_ROOT"] = args.gloss_root
+    if args.cloud_root:
+        os.environ["GLOSS_CLOUD_ROOT"] = args.cloud_root
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,18 @@ import os, re, nuke
 try:
     from PySide6 import QtWidgets
 except Exception:
-    from PySide2 import QtWidgets
+    try:
+        from PySide2 import QtWidgets
+    except Exception:
+        QtWidgets = None  # falls back to nuke.ask for the latest/all prompt
+
+from tools.retouch_scan import retouch_root, scan_retouch_async
+from tools.retouch_watch import staged_result
+from read_node.bulk_import import create_reads
+from gloss_utils.shot_names import ShotIndex
+from gloss_utils.nuke_helpers import traced
+
+UNMATCHED_BACKDROP_COLOR = 0x87CEFAFF  # Light blue
 
 # Use pipeline roots
 try:
@@ -14,34 +25,26 @@ except Exception:
         m = re.search(r"(^|[^\d])(\d{6})(?!\d)", text or "")
         return m.group(2) if m else None
 
-def _find_cloudsync_project(job_code: str):
+def _find_cloudsync_project(job_code: str, _listing=None):
     """Find the CloudSync project folder that starts with the job code."""
     if not (job_code and os.path.exists(CLOUD_ROOT)):
         return None
     try:
-        for name in sorted(os.listdir(CLOUD_ROOT)):
+        for name in (_listing if _listing is not None else sorted(os.listdir(CLOUD_ROOT))):
             if name.startswith(job_code):
                 return name
     except Exception:
         pass
     return None
 
-def _get_existing_paths():
-    return {nuke.filename(node) for node in nuke.allNodes("Read")}
-
-def _get_existing_read_nodes():
-    reads = {}
+def _get_existing_reads():
+    """(file paths, shot index) of the existing Reads, from one pass over the script."""
+    paths, index = set(), ShotIndex()
     for node in nuke.allNodes("Read"):
         path = nuke.filename(node)
-        if path:
-            base_name = os.path.basename(path)
-            name_only = os.path.splitext(base_name)[0]
-            reads[name_only] = node
-    return reads
-
-def _strip_retouch_suffix(name):
-    # Remove suffix like _CHNv001, _CHN001, etc.
-    return re.sub(r"_CHN[vV]?\d{3,}", "", name)
+        paths.add(path)
+        index.add(node, path)
+    return paths, index
 
 def _derive_cloudsync_job_from_scene():
     """
@@ -49,122 +52,120 @@ def _derive_cloudsync_job_from_scene():
       - If it's under CloudSync, return that job folder.
       - Else, if it's under GlossPost, extract a job code and map to a CloudSync project folder.
     """
+    tried, listing = set(), None
     for node in nuke.allNodes("Read"):
         fp = nuke.filename(node) or ""
         if "/CloudSync/" in fp:
             m = re.search(r"/CloudSync/([^/]+)/", fp)
             if m:
                 return m.group(1)
-        # Try inferring from job code
+        # Try inferring from job code (each code once; CloudSync is listed at most once)
         code = extract_job_code(fp)
-        if code:
-            cloud = _find_cloudsync_project(code)
+        if code and code not in tried:
+            tried.add(code)
+            if listing is None:
+                try:
+                    listing = sorted(os.listdir(CLOUD_ROOT)) if os.path.exists(CLOUD_ROOT) else []
+                except Exception:
+                    listing = []
+            cloud = _find_cloudsync_project(code, listing)
             if cloud:
                 return cloud
     return None
 
-def _create_backdrop(label, nodes):
-    if not nodes:
-        return
-    bd = nuke.createNode("BackdropNode")
-    bd["label"].setValue(label)
-    bd["note_font_size"].setValue(30)
-    bd["tile_color"].setValue(0x87CEFAFF)  # Light blue
-    bd["z_order"].setValue(-1)
-
-    margin_x, margin_y = 100, 60
-    min_x = min(n.xpos() for n in nodes)
-    max_x = max(n.xpos() + n.screenWidth() for n in nodes)
-    min_y = min(n.ypos() for n in nodes)
-    max_y = max(n.ypos() + n.screenHeight() for n in nodes)
-
-    bd["xpos"].setValue(min_x - margin_x)
-    bd["ypos"].setValue(min_y - margin_y)
-    bd["bdwidth"].setValue((max_x - min_x) + 2 * margin_x)
-    bd["bdheight"].setValue((max_y - min_y) + 2 * margin_y)
-
+@traced()
 def import_retouched_shots():
     job_folder = _derive_cloudsync_job_from_scene()
     if not job_folder:
         nuke.message("❌ Could not determine CloudSync job folder from any Read node (or job code).")
         return
 
-    base_path = os.path.join(CLOUD_ROOT, job_folder, "VFX-CHN", "RETOUCH")
+    base_path = retouch_root(job_folder)
     if not os.path.exists(base_path):
         nuke.message(f"❌ RETOUCH folder not found at:\n{base_path}")
         return
 
     # Prompt: latest or all
-    msg_box = QtWidgets.QMessageBox()
-    msg_box.setWindowTitle("Import RETOUCH Shots")
-    msg_box.setText("Which RETOUCH folder(s) should be scanned?")
-    latest_btn = msg_box.addButton("Latest Only", QtWidgets.QMessageBox.AcceptRole)
-    all_btn    = msg_box.addButton("All",         QtWidgets.QMessageBox.ActionRole)
-    cancel_btn = msg_box.addButton("Cancel",      QtWidgets.QMessageBox.RejectRole)
-    msg_box.exec_()
-
-    selected_btn = msg_box.clickedButton()
-    if selected_btn == cancel_btn:
+    if QtWidgets is not None:
+        msg_box = QtWidgets.QMessageBox()
+        msg_box.setWindowTitle("Import RETOUCH Shots")
+        msg_box.setText("Which RETOUCH folder(s) should be scanned?")
+        latest_btn = msg_box.addButton("Latest Only", QtWidgets.QMessageBox.AcceptRole)
+        all_btn    = msg_box.addButton("All",         QtWidgets.QMessageBox.ActionRole)
+        cancel_btn = msg_box.addButton("Cancel",      QtWidgets.QMessageBox.RejectRole)
+        msg_box.exec_()
+
+        selected_btn = msg_box.clickedButton()
+        if selected_btn == cancel_btn:
+            return
+
+        latest_only = (selected_btn == latest_btn)
+    else:
+        latest_only = bool(nuke.ask("Scan only the latest RETOUCH folder?\n\n(No = scan all date folders)"))
+
+    # The watch-folder service keeps a staged list per job; use it while it's running.
+    staged = staged_result(job_folder, latest_only)
+    if staged is not None:
+        _import_scanned(staged, None)
         return
 
-    all_date_folders = sorted([f for f in os.listdir(base_path) if os.path.isdir(os.path.join(base_path, f))])
-    if not all_date_folders:
+    # Scan off the main thread; only date folders that changed since the last run are listed.
+    def _on_scanned(result, error):
+        nuke.executeInMainThread(_import_scanned, args=(result, error))
+
+    scan_retouch_async(job_folder, _on_scanned, latest_only=latest_only, base_path=base_path)
+
+def _import_scanned(result, error):
+    if error is not None:
+        nuke.message(f"❌ Failed to scan RETOUCH folder:\n{error}")
+        return
+    if not result["folders"]:
         nuke.message("❌ No date folders found inside RETOUCH.")
         return
+    if "meta" in result:
+        nuke.tprint("[GLOSS NYC] RETOUCH: using the watch-folder staged list")
+    else:
+        nuke.tprint(f"[GLOSS NYC] RETOUCH scan: {result['rescanned']} folder(s) re-listed, "
+                    f"{len(result['new'])} new clip(s) in {result['elapsed'] * 1000:.0f} ms")
+    meta = result.get("meta", {})
 
-    date_folders_to_process = [all_date_folders[-1]] if selected_btn == latest_btn else all_date_folders
-
-    existing_paths = _get_existing_paths()
-    existing_reads = _get_existing_read_nodes()
-    total_imported = 0
+    existing_paths, existing_reads = _get_existing_reads()
 
     xpos_fallback = 0
     ypos_default = 1000
 
-    for date_folder in date_folders_to_process:
-        date_path = os.path.join(base_path, date_folder)
-        if not os.path.isdir(date_path):
-            continue
-
-        unmatched_nodes = []
-
-        for file in sorted(os.listdir(date_path)):
-            if file.startswith(".") or not file.lower().endswith(".mov") or "chn" not in file.lower():
-                continue
+    # Single layout pass: positions for every new clip, then one bulk create.
+    specs, backdrops = [], []
+    for date_folder, clip_paths in result["folders"]:
+        unmatched = []
 
-            full_path = os.path.join(date_path, file).replace("\\", "/")
+        for full_path in clip_paths:
             if full_path in existing_paths:
                 continue
 
-            try:
-                base_name = os.path.splitext(file)[0]
-                base_match_name = _strip_retouch_suffix(base_name)
-
-                if base_match_name in existing_reads:
-                    base_node = existing_reads[base_match_name]
-                    xpos = base_node.xpos()
-                    ypos = base_node.ypos() + 150
-                else:
-                    xpos = xpos_fallback
-                    ypos = ypos_default
-                    xpos_fallback += 250
-
-                read_node = nuke.createNode("Read", f"file {{{full_path}}}")
-                read_node.setXpos(xpos)
-                read_node.setYpos(ypos)
-
-                if base_match_name not in existing_reads:
-                    unmatched_nodes.append(read_node)
-
-                total_imported += 1
-
-            except Exception as e:
-                nuke.message(f"❌ Failed to load: {full_path}\n\n{str(e)}")
-
-        if unmatched_nodes:
-            _create_backdrop(f"Unmatched - {date_folder}", unmatched_nodes)
-
-    if total_imported == 0:
+            base_node = existing_reads.first(full_path)
+            if base_node is not None:
+                spec = {"file": full_path, "xpos": base_node.xpos(), "ypos": base_node.ypos() + 150}
+            else:
+                spec = {"file": full_path, "xpos": xpos_fallback, "ypos": ypos_default}
+                xpos_fallback += 250
+                unmatched.append(spec)
+            frames = (meta.get(full_path) or {}).get("frames")
+            if frames:
+                spec["knobs"] = {"first": 1, "last": frames, "origfirst": 1, "origlast": frames}
+            specs.append(spec)
+
+        if unmatched:
+            backdrops.append((f"Unmatched - {date_folder}", unmatched, UNMATCHED_BACKDROP_COLOR))
+
+    if not specs:
         nuke.message("✅ All RETOUCH shots are already imported!")
+        return
+
+    nodes, errors = create_reads(specs, backdrops, undo_label="Import RETOUCH Shots")
+    total_imported = len(nodes) - len(errors)
+    if errors:
+        details = "\n".join(f"{os.path.basename(f)}: {e}" for f, e in errors[:10])
+        nuke.message(f"✅ Imported {total_imported} RETOUCH clip(s)\n\n❌ Failed to load {len(errors)}:\n{details}")
     else:
         nuke.message(f"✅ Imported {total_imported} RETOUCH clip(s)")
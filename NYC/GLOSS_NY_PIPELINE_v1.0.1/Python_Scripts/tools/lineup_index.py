@@ -0,0 +1,269 @@
+# tools/lineup_index.py
+# Offline cross-lineup shot search (no Nuke needed).
+# - Crawls GlossPost/*/PROGRESS-*/NUKE/Line_up_v*.nk
+# - Streams each .nk with a line-based parser and pulls Read `file` + `name`
+# - Keeps a persistent inverted index: shot -> [(lineup, version, node name), ...]
+# - Recrawls only re-read lineups whose mtime changed (and only re-list NUKE
+#   folders whose mtime changed)
+#
+# Usage:
+#   python -m tools.lineup_index crawl
+#   python -m tools.lineup_index find SH010
+
+import os
+import re
+import sys
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from gloss_utils.shot_names import parse as parse_shot_name, shot_key
+from gloss_utils.nuke_helpers import traced, current_span, san_call
+
+try:
+    from gloss_utils.paths_nyc import GLOSS_ROOT
+except Exception:
+    GLOSS_ROOT = "/Volumes/san-01/GlossPost"
+
+INDEX_FILE   = os.path.expanduser("~/.nuke/gloss_cache/lineup_index.json")
+CRAWL_THREADS = 8
+
+LINEUP_RE    = re.compile(r"^Line_up_v(\d+)\.nk$", re.IGNORECASE)
+_READ_OPEN   = re.compile(r"^(\s*)Read \{\s*$")
+_KNOB_LINE   = re.compile(r"^\s*(file|name) (.*?)\s*$")
+
+
+# ===============================
+# .nk parsing
+# ===============================
+def _unquote(value):
+    v = value.strip()
+    if len(v) >= 2 and ((v[0] == '"' and v[-1] == '"') or (v[0] == "{" and v[-1] == "}")):
+        v = v[1:-1]
+    return v.replace('\\"', '"')
+
+def parse_reads(nk_path):
+    """
+    Stream a .nk script and return [(node_name, file_value), ...] for every Read.
+    Only looks at Read blocks; everything else is skipped line by line.
+    """
+    reads = []
+    in_read, close_line = False, None
+    name = file_value = None
+    with open(nk_path, "r", errors="replace") as fh:
+        for line in fh:
+            if not in_read:
+                m = _READ_OPEN.match(line)
+                if m:
+                    in_read, close_line = True, m.group(1) + "}"
+                    name = file_value = None
+                continue
+            if line.rstrip() == close_line:
+                if file_value:
+                    reads.append((name or "Read", file_value))
+                in_read = False
+                continue
+            m = _KNOB_LINE.match(line)
+            if m:
+                if m.group(1) == "file":
+                    file_value = _unquote(m.group(2))
+                else:
+                    name = _unquote(m.group(2))
+    return reads
+
+
+# ===============================
+# Persistent index
+# ===============================
+class LineupIndex(object):
+    """
+    data = {
+      "root": GLOSS_ROOT,
+      "nuke_dirs": {nuke_dir: {"mtime": float, "lineups": [path, ...]}},
+      "lineups":   {path: {"mtime": float, "version": int, "project": str,
+                           "reads": [[node_name, file], ...]}},
+    }
+    """
+
+    def __init__(self, path=INDEX_FILE, root=GLOSS_ROOT):
+        self.path = path
+        self.root = root
+        self.data = {"root": root, "nuke_dirs": {}, "lineups": {}}
+        self._shots = None  # shot key -> [(lineup, version, node, file)]
+
+    # --- persistence ---
+    def load(self):
+        try:
+            with open(self.path) as fh:
+                data = json.load(fh)
+            if data.get("root") == self.root:
+                self.data = data
+        except Exception:
+            pass
+        self._shots = None
+        return self
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as fh:
+            json.dump(self.data, fh)
+        os.replace(tmp, self.path)
+
+    # --- crawling ---
+    def _nuke_dirs(self):
+        """Yield (project, NUKE dir) for every PROGRESS-*/NUKE under the root."""
+        san_call()
+        try:
+            projects = [e for e in os.scandir(self.root) if e.is_dir() and not e.name.startswith(".")]
+        except OSError:
+            return
+        for proj in projects:
+            san_call()
+            try:
+                with os.scandir(proj.path) as it:
+                    for e in it:
+                        if e.name.startswith("PROGRESS-") and e.is_dir():
+                            yield proj.name, os.path.join(e.path, "NUKE")
+            except OSError:
+                continue
+
+    def _lineups_in(self, nuke_dir):
+        """Lineup paths in a NUKE dir, re-listing only if the dir mtime changed."""
+        san_call()
+        try:
+            mtime = os.stat(nuke_dir).st_mtime
+        except OSError:
+            return []
+        cached = self.data["nuke_dirs"].get(nuke_dir)
+        if cached and cached["mtime"] == mtime:
+            return cached["lineups"]
+        san_call()
+        try:
+            with os.scandir(nuke_dir) as it:
+                lineups = sorted(e.path for e in it if LINEUP_RE.match(e.name))
+        except OSError:
+            lineups = []
+        self.data["nuke_dirs"][nuke_dir] = {"mtime": mtime, "lineups": lineups}
+        return lineups
+
+    def _refresh_lineup(self, project, path):
+        """(path, entry or None, reparsed?)"""
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return path, None, False
+        old = self.data["lineups"].get(path)
+        if old and old["mtime"] == mtime:
+            return path, old, False
+        try:
+            reads = [list(r) for r in parse_reads(path)]
+        except OSError:
+            return path, None, False
+        version = int(LINEUP_RE.match(os.path.basename(path)).group(1))
+        return path, {"mtime": mtime, "version": version, "project": project, "reads": reads}, True
+
+    @traced()
+    def crawl(self, threads=CRAWL_THREADS):
+        """Bring the index up to date. Returns {"lineups", "parsed", "removed", "elapsed"}."""
+        t0 = time.time()
+        targets, seen_dirs = [], set()
+        for project, nuke_dir in self._nuke_dirs():
+            seen_dirs.add(nuke_dir)
+            targets.extend((project, p) for p in self._lineups_in(nuke_dir))
+
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as pool:
+            results = list(pool.map(lambda t: self._refresh_lineup(*t), targets))
+
+        fresh, parsed = {}, 0
+        for path, entry, reparsed in results:
+            if entry is not None:
+                fresh[path] = entry
+                parsed += int(reparsed)
+        removed = len(set(self.data["lineups"]) - set(fresh))
+        self.data["lineups"] = fresh
+        self.data["nuke_dirs"] = {d: v for d, v in self.data["nuke_dirs"].items() if d in seen_dirs}
+        self._shots = None
+
+        sp = current_span()  # lineup stats and parses ran on worker threads: count them here
+        sp.san(len(targets) + parsed)
+        sp.add_items(len(fresh))
+        sp.set(parsed=parsed)
+        return {"lineups": len(fresh), "parsed": parsed, "removed": removed, "elapsed": time.time() - t0}
+
+    # --- querying ---
+    def _shot_map(self):
+        if self._shots is None:
+            shots = {}
+            for path, entry in self.data["lineups"].items():
+                for node, fv in entry["reads"]:
+                    shots.setdefault(shot_key(fv), []).append((path, entry["version"], node, fv))
+            self._shots = shots
+        return self._shots
+
+    @traced()
+    def find(self, shot, limit=50):
+        """
+        Lineups containing `shot`: exact key matches first, then keys containing it.
+        Returns [(lineup, version, node_name, file), ...], newest lineup versions first.
+        """
+        if not (shot or "").strip():
+            return []
+        q = parse_shot_name(shot.strip()).key
+        shots = self._shot_map()
+        hits = list(shots.get(q, []))
+        if len(hits) < limit:
+            for key, refs in shots.items():
+                if key != q and q in key:
+                    hits.extend(refs)
+                    if len(hits) >= limit:
+                        break
+        hits.sort(key=lambda h: (-h[1], h[0]))
+        current_span().add_items(min(len(hits), limit))
+        return hits[:limit]
+
+
+_loaded = None
+
+@traced()
+def get_index():
+    """Loaded (not recrawled) index, cached for the session."""
+    global _loaded
+    if _loaded is None:
+        _loaded = LineupIndex().load()
+    return _loaded
+
+
+# ===============================
+# Headless entry point
+# ===============================
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Cross-lineup shot index.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    c = sub.add_parser("crawl", help="update the index from the SAN")
+    c.add_argument("--root", default=GLOSS_ROOT)
+    c.add_argument("--threads", type=int, default=CRAWL_THREADS)
+    f = sub.add_parser("find", help="find lineups containing a shot")
+    f.add_argument("shot")
+    f.add_argument("--root", default=GLOSS_ROOT)
+    f.add_argument("--limit", type=int, default=50)
+    args = ap.parse_args(argv)
+
+    idx = LineupIndex(root=args.root).load()
+    if args.cmd == "crawl":
+        stats = idx.crawl(args.threads)
+        idx.save()
+        print(f"{stats['lineups']} lineups ({stats['parsed']} re-read, {stats['removed']} removed) "
+              f"in {stats['elapsed']:.2f}s")
+        return 0
+    t0 = time.perf_counter()
+    hits = idx.find(args.shot, args.limit)
+    for lineup, version, node, fv in hits:
+        print(f"v{version:02d}  {node:<16} {lineup}\n      {fv}")
+    print(f"{len(hits)} hit(s) in {(time.perf_counter() - t0) * 1000:.1f} ms")
+    return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+# tools/retouch_scan.py
+# Incremental scanner for CloudSync/<job>/VFX-CHN/RETOUCH/<date>/*CHN*.mov
+# - Scan state is persisted per job (folder mtimes + clips seen in each folder)
+# - Only date folders whose mtime changed are re-listed (os.scandir)
+# - The RETOUCH root itself is only re-listed when its mtime changed
+# - latest_only stats and lists the newest date folder alone
+# - No Nuke dependency: safe to run off the main thread or headless
+#
+# State file: ~/.nuke/gloss_cache/retouch_scan/<job_folder>.json
+#   {"root": path, "root_mtime": float, "dates": [date, ...],
+#    "folders": {date: {"mtime": float, "clips": [name, ...]}}}
+
+import os
+import re
+import json
+import time
+import threading
+
+try:
+    from gloss_utils.paths_nyc import CLOUD_ROOT
+except Exception:
+    CLOUD_ROOT = "/Volumes/san-01/CloudSync"
+
+from gloss_utils.nuke_helpers import traced, current_span, san_call
+
+STATE_DIR    = os.path.expanduser("~/.nuke/gloss_cache/retouch_scan")
+RETOUCH_SUB  = ("VFX-CHN", "RETOUCH")
+CLIP_EXTS    = (".mov",)
+
+
+def retouch_root(job_folder):
+    return os.path.join(CLOUD_ROOT, job_folder, *RETOUCH_SUB)
+
+def is_retouch_clip(name):
+    low = name.lower()
+    return not name.startswith(".") and low.endswith(CLIP_EXTS) and "chn" in low
+
+def _state_path(job_folder):
+    safe = re.sub(r"[^\w.-]+", "_", job_folder)
+    return os.path.join(STATE_DIR, f"{safe}.json")
+
+
+# ===============================
+# Scan state
+# ===============================
+def load_state(job_folder, base_path):
+    try:
+        with open(_state_path(job_folder)) as fh:
+            state = json.load(fh)
+        if state.get("root") == base_path:
+            return state
+    except Exception:
+        pass
+    return {"root": base_path, "root_mtime": None, "dates": None, "folders": {}}
+
+def save_state(job_folder, state):
+    try:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        path = _state_path(job_folder)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as fh:
+            json.dump(state, fh)
+        os.replace(tmp, path)
+    except Exception:
+        pass  # losing the cache only costs a full rescan next time
+
+
+# ===============================
+# Scanning
+# ===============================
+def _date_folders(base_path, state):
+    """Date folder names, re-listing the RETOUCH root only if its mtime changed."""
+    san_call()
+    root_mtime = os.stat(base_path).st_mtime
+    # The listing is kept apart from "folders": a latest_only scan only fills in one of them.
+    if state["root_mtime"] == root_mtime and state.get("dates") is not None:
+        return list(state["dates"])
+    san_call()
+    with os.scandir(base_path) as it:
+        names = sorted(e.name for e in it if e.is_dir() and not e.name.startswith("."))
+    state["root_mtime"] = root_mtime
+    state["dates"] = names
+    return names
+
+@traced()
+def scan_retouch(job_folder, latest_only=False, base_path=None):
+    """
+    Scan a job's RETOUCH folder incrementally.
+    Returns {
+      "base":      RETOUCH root,
+      "folders":   [(date_folder, [clip full paths]), ...]   (sorted; only the latest if latest_only),
+      "new":       [clip full paths not seen by the previous scan (latest folder only if latest_only)],
+      "rescanned": number of date folders actually re-listed,
+      "elapsed":   seconds,
+    }
+    Raises OSError if the RETOUCH root does not exist.
+    """
+    t0 = time.time()
+    base_path = base_path or retouch_root(job_folder)
+    state = load_state(job_folder, base_path)
+    old_folders = state["folders"]
+
+    names = _date_folders(base_path, state)
+    folders, new_clips, rescanned = {}, [], 0
+    if latest_only:
+        # Only the newest date folder is stat'ed / re-listed; older ones keep their cached entries.
+        folders = {n: old_folders[n] for n in names[:-1] if n in old_folders}
+        names = names[-1:]
+    for name in names:
+        path = os.path.join(base_path, name)
+        san_call()
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue  # removed since the root was listed
+        cached = old_folders.get(name)
+        if cached and cached["mtime"] == mtime:
+            folders[name] = cached
+            continue
+        san_call()
+        try:
+            with os.scandir(path) as it:
+                clips = sorted(e.name for e in it if is_retouch_clip(e.name) and e.is_file())
+        except OSError:
+            continue
+        seen = set(cached["clips"]) if cached else set()
+        new_clips.extend(os.path.join(path, c).replace("\\", "/") for c in clips if c not in seen)
+        folders[name] = {"mtime": mtime, "clips": clips}
+        rescanned += 1
+
+    state["folders"] = folders
+    if rescanned or set(old_folders) != set(folders):
+        save_state(job_folder, state)
+
+    sp = current_span()
+    sp.add_items(sum(len(f["clips"]) for f in folders.values()))
+
+    wanted = [n for n in names if n in folders] if latest_only else sorted(folders)
+    out = [(d, [os.path.join(base_path, d, c).replace("\\", "/") for c in folders[d]["clips"]]) for d in wanted]
+    return {"base": base_path, "folders": out, "new": new_clips,
+            "rescanned": rescanned, "elapsed": time.time() - t0}
+
+def scan_retouch_async(job_folder, on_done, latest_only=False, base_path=None):
+    """
+    Run scan_retouch in a background thread and call on_done(result, error)
+    from that thread. Callers inside Nuke should hop back with nuke.executeInMainThread.
+    """
+    def _bg():
+        try:
+            result = scan_retouch(job_folder, latest_only, base_path)
+        except Exception as e:
+            on_done(None, e)
+            return
+        on_done(result, None)
+
+    t = threading.Thread(target=_bg, name="GlossRetouchScan", daemon=True)
+    t.start()
+    return t
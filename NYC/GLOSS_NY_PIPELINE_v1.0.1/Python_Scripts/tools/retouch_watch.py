@@ -0,0 +1,363 @@
+# tools/retouch_watch.py
+# Watch-folder service for Chennai RETOUCH deliveries (headless, no Nuke).
+# - Watches CloudSync/<job>/VFX-CHN/RETOUCH/<date>/ for every job (or --jobs)
+# - Uses inotify on Linux (ctypes, no extra packages); otherwise polls folder mtimes
+#   through tools.retouch_scan, which only re-lists folders that changed
+# - Keeps a staged list per job: every delivered clip with parsed shot name and
+#   QuickTime header metadata (fps, frames, timecode, codec, resolution)
+# - import_retouched_shots reads the staged list instead of scanning the tree
+#   while the watcher's heartbeat is fresh
+#
+# Staged lists live in $GLOSS_RETOUCH_WATCH_DIR (default ~/.nuke/gloss_cache/retouch_watch).
+# Point it at a shared folder when the watcher runs on a separate Linux box: clip paths
+# are stored relative to CLOUD_ROOT and rebased onto the reader's own mount, so a
+# list written under /mnt/... opens on a Mac that mounts CloudSync under /Volumes/...
+#
+# inotify does not see changes made by other machines on network mounts, so the
+# polling pass also runs as a heartbeat every --interval seconds.
+#
+# Usage:
+#   python -m tools.retouch_watch                 # all jobs, inotify if available
+#   python -m tools.retouch_watch --jobs 101181_CK_FA25 --poll --interval 60
+#   python -m tools.retouch_watch --once          # refresh every list and exit
+
+import os
+import sys
+import json
+import time
+import socket
+import struct
+
+from gloss_utils import quicktime
+from gloss_utils.nuke_helpers import traced, current_span, san_call
+from gloss_utils.shot_names import parse as parse_shot_name
+from tools.retouch_scan import CLOUD_ROOT, RETOUCH_SUB, retouch_root, scan_retouch
+
+WATCH_DIR      = os.environ.get("GLOSS_RETOUCH_WATCH_DIR") or os.path.expanduser("~/.nuke/gloss_cache/retouch_watch")
+HEARTBEAT_FILE = "_watcher.json"
+POLL_INTERVAL  = 30    # seconds between polling/heartbeat passes
+LIST_MAX_AGE   = 300   # staged lists are trusted while the heartbeat is younger than this
+
+
+def _log(msg):
+    print(f"[GLOSS RETOUCH WATCH] {time.strftime('%H:%M:%S')} {msg}", flush=True)
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as fh:
+        json.dump(data, fh)
+    os.replace(tmp, path)
+
+def list_path(job_folder):
+    return os.path.join(WATCH_DIR, f"{job_folder}.json")
+
+def _to_rel(path):
+    """CLOUD_ROOT-relative, '/'-separated path as stored in the staged lists."""
+    return os.path.relpath(path, CLOUD_ROOT).replace(os.sep, "/")
+
+def _to_abs(rel):
+    """Stored path -> path under this machine's CLOUD_ROOT (absolute paths from old lists pass through)."""
+    if rel.startswith("/") or os.path.isabs(rel):
+        return rel
+    return os.path.join(CLOUD_ROOT, *rel.split("/"))
+
+def _rebased(rec):
+    return dict(rec, path=_to_abs(rec["path"]))
+
+
+# ===============================
+# Reader side (used by import_retouched_shots)
+# ===============================
+def watcher_alive(max_age=LIST_MAX_AGE):
+    try:
+        with open(os.path.join(WATCH_DIR, HEARTBEAT_FILE)) as fh:
+            return time.time() - json.load(fh).get("updated", 0) <= max_age
+    except Exception:
+        return False
+
+def load_staged(job_folder, max_age=LIST_MAX_AGE):
+    """The staged clip list for a job, or None if there is none or the watcher is not running."""
+    if not watcher_alive(max_age):
+        return None
+    try:
+        with open(list_path(job_folder)) as fh:
+            return json.load(fh)
+    except Exception:
+        return None
+
+def staged_result(job_folder, latest_only=False, max_age=LIST_MAX_AGE):
+    """
+    Staged list in the same shape as tools.retouch_scan.scan_retouch(), plus
+    "meta": {path: clip record}. None when the caller should scan instead.
+    """
+    staged = load_staged(job_folder, max_age)
+    if not staged:
+        return None
+    clips = [_rebased(rec) for rec in staged["clips"]]
+    by_folder = {}
+    for rec in clips:
+        by_folder.setdefault(rec["date_folder"], []).append(rec["path"])
+    wanted = sorted(by_folder)[-1:] if latest_only else sorted(by_folder)
+    return {
+        "base": _to_abs(staged["base"]),
+        "folders": [(d, sorted(by_folder[d])) for d in wanted],
+        "new": [],
+        "rescanned": 0,
+        "elapsed": 0.0,
+        "meta": {rec["path"]: rec for rec in clips},
+    }
+
+
+# ===============================
+# inotify (Linux, via ctypes)
+# ===============================
+class _Inotify(object):
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM  = 0x00000040
+    IN_MOVED_TO    = 0x00000080
+    IN_CREATE      = 0x00000100
+    IN_DELETE      = 0x00000200
+    IN_ISDIR       = 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        import ctypes, ctypes.util
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0))
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths = {}  # wd -> path
+
+    def add(self, path):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd >= 0:
+            self.paths[wd] = path
+        return wd
+
+    def read(self, timeout):
+        """[(dir_path, name, mask), ...] after waiting up to `timeout` seconds."""
+        import select
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events, pos = [], 0
+        while pos + self._EVENT.size <= len(data):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(data, pos)
+            pos += self._EVENT.size
+            name = data[pos:pos + length].rstrip(b"\0").decode("utf-8", "replace")
+            pos += length
+            if wd in self.paths:
+                events.append((self.paths[wd], name, mask))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+def inotify_available():
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        _Inotify().close()
+        return True
+    except Exception:
+        return False
+
+
+# ===============================
+# Watcher
+# ===============================
+def _clip_record(path, date_folder, st, info):
+    sn = parse_shot_name(os.path.basename(path))
+    rec = {
+        "path": path, "date_folder": date_folder,
+        "size": st.st_size if st else None, "mtime": st.st_mtime if st else None,
+        "shot": sn.base, "shot_key": sn.key, "dept": sn.dept, "version": sn.version,
+    }
+    if info:
+        rec.update(info._asdict())
+    return rec
+
+
+class RetouchWatcher(object):
+    def __init__(self, jobs=None, interval=POLL_INTERVAL):
+        self.fixed_jobs = list(jobs or [])
+        self.interval = interval
+        self.jobs = {}  # job_folder -> {path: clip record}
+
+    def discover_jobs(self):
+        if self.fixed_jobs:
+            return [j for j in self.fixed_jobs if os.path.isdir(retouch_root(j))]
+        try:
+            with os.scandir(CLOUD_ROOT) as it:
+                names = [e.name for e in it if e.is_dir() and not e.name.startswith(".")]
+        except OSError:
+            return []
+        return sorted(n for n in names if os.path.isdir(os.path.join(CLOUD_ROOT, n, *RETOUCH_SUB)))
+
+    def _load_records(self, job):
+        try:
+            with open(list_path(job)) as fh:
+                return {r["path"]: r for r in map(_rebased, json.load(fh)["clips"])}
+        except Exception:
+            return {}
+
+    @traced()
+    def refresh_job(self, job):
+        """Rescan a job incrementally, probe new/incomplete clips, rewrite its list if anything changed."""
+        records = self.jobs.get(job)
+        if records is None:
+            records = self.jobs[job] = self._load_records(job)
+        result = scan_retouch(job)
+
+        current = {}
+        for date_folder, paths in result["folders"]:
+            for p in paths:
+                current[p] = date_folder
+
+        # New clips, plus ones that were still being copied last time (no header yet)
+        todo = {}
+        for p, date_folder in current.items():
+            rec = records.get(p)
+            if rec is not None and rec.get("frames"):
+                continue
+            san_call()
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+            if rec is None or rec.get("size") != st.st_size or rec.get("mtime") != st.st_mtime:
+                todo[p] = (date_folder, st)
+
+        sp = current_span()
+        sp.san(len(todo))  # header reads, made on probe_many's threads
+        sp.add_items(len(todo))
+        sp.set(job=job)
+        infos = quicktime.probe_many(todo)
+        changed = set(records) != set(current)
+        for p, (date_folder, st) in todo.items():
+            new = _clip_record(p, date_folder, st, infos.get(p))
+            if records.get(p) != new:
+                records[p] = new
+                changed = True
+        for p in set(records) - set(current):
+            del records[p]
+
+        if changed or not os.path.exists(list_path(job)):
+            clips = [dict(r, path=_to_rel(r["path"])) for r in records.values()]
+            _write_json(list_path(job), {
+                "job": job, "base": _to_rel(result["base"]), "updated": time.time(),
+                "clips": sorted(clips, key=lambda r: (r["date_folder"], r["path"])),
+            })
+            if todo:
+                _log(f"{job}: {len(todo)} new/updated clip(s), {len(records)} staged")
+        return changed
+
+    def heartbeat(self):
+        _write_json(os.path.join(WATCH_DIR, HEARTBEAT_FILE), {
+            "updated": time.time(), "host": socket.gethostname(), "pid": os.getpid(),
+            "jobs": sorted(self.jobs),
+        })
+
+    def refresh_all(self):
+        for job in self.discover_jobs():
+            try:
+                self.refresh_job(job)
+            except Exception as e:
+                _log(f"{job}: refresh failed: {e}")
+        self.heartbeat()
+
+    # --- loops ---
+    def run_polling(self):
+        _log(f"polling every {self.interval}s")
+        while True:
+            self.refresh_all()
+            time.sleep(self.interval)
+
+    def _watch_tree(self, ino, watched):
+        """Add watches for each job's RETOUCH root and date folders not watched yet."""
+        for job in self.discover_jobs():
+            root = retouch_root(job)
+            dirs = [root]
+            try:
+                with os.scandir(root) as it:
+                    dirs += [e.path for e in it if e.is_dir() and not e.name.startswith(".")]
+            except OSError:
+                continue
+            for d in dirs:
+                if d not in watched and ino.add(d) >= 0:
+                    watched[d] = job
+
+    def _handle_events(self, ino, watched, events):
+        """Let a burst of copies settle, then refresh every job touched by it."""
+        time.sleep(1.0)
+        while True:
+            more = ino.read(timeout=0)
+            if not more:
+                break
+            events = events + more
+        if any(mask & _Inotify.IN_ISDIR for _d, _n, mask in events):
+            self._watch_tree(ino, watched)  # new date folder
+        dirty = {watched[d] for d, _name, _mask in events if d in watched}
+        for job in sorted(dirty):
+            try:
+                self.refresh_job(job)
+            except Exception as e:
+                _log(f"{job}: refresh failed: {e}")
+
+    def run_inotify(self):
+        ino = _Inotify()
+        watched = {}  # dir -> job
+        _log(f"inotify mode, heartbeat every {self.interval}s")
+        try:
+            self.refresh_all()
+            self._watch_tree(ino, watched)
+            last_pass = time.time()
+            while True:
+                events = ino.read(timeout=max(1.0, self.interval - (time.time() - last_pass)))
+                if events:
+                    self._handle_events(ino, watched, events)
+                if time.time() - last_pass >= self.interval:
+                    self.refresh_all()
+                    self._watch_tree(ino, watched)
+                    last_pass = time.time()
+        finally:
+            ino.close()
+
+    def run(self, poll=False):
+        if not poll and inotify_available():
+            return self.run_inotify()
+        return self.run_polling()
+
+
+# ===============================
+# Headless entry point
+# ===============================
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Watch RETOUCH folders and stage new clips for import.")
+    ap.add_argument("--jobs", nargs="*", help="CloudSync job folders (default: every job with a RETOUCH folder)")
+    ap.add_argument("--interval", type=int, default=POLL_INTERVAL, help="polling/heartbeat interval in seconds")
+    ap.add_argument("--poll", action="store_true", help="force mtime polling instead of inotify")
+    ap.add_argument("--once", action="store_true", help="refresh every staged list and exit")
+    args = ap.parse_args(argv)
+
+    watcher = RetouchWatcher(args.jobs, args.interval)
+    if args.once:
+        watcher.refresh_all()
+        return 0
+    try:
+        watcher.run(poll=args.poll)
+    except KeyboardInterrupt:
+        _log("stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,615 @@
+# tools/shot_catalog.py
+# SQLite catalog of every GlossPost / CloudSync job (no Nuke needed).
+# - jobs:    job code -> GlossPost project folder, CloudSync folder, existing Approved folders
+# - shots:   every shot seen in a job (plates, deliveries, outputs, task scripts)
+# - media:   image sequences (grouped from listings, no per-frame stat) and MOVs (frame range,
+#            fps and resolution from the QuickTime header), tagged with their pipeline role:
+#            plate / retouch / approved / dn / precomp / final / progress / other
+# - scripts: task scripts (NUKE/<shot>/Scripts/<TASK>/*.nk) and lineups, with versions
+# - Filled by a multi-threaded crawler: every directory listing is its own task on a
+#   pool, so SAN round-trips overlap across jobs; results are written in one transaction
+# - Lookups are indexed SELECTs (well under a millisecond), so callers ask the catalog
+#   first and only walk the SAN when it has nothing (paths_nyc verifies hints with a stat)
+# - Incremental refresh: every crawled directory is stored with its mtime; `refresh`
+#   stats them and re-lists only the ones that changed (plus new subfolders found
+#   there), within a time budget, so it can run every few minutes in the background
+#
+# A directory's mtime only changes when entries are added, removed or renamed in it;
+# a file rewritten in place keeps its folder's mtime, so run a full crawl now and then
+# (e.g. nightly) to pick up re-rendered MOV headers.
+#
+# Database: ~/.nuke/gloss_cache/shot_catalog.sqlite ($GLOSS_CATALOG overrides it).
+# Queries and the shared read-only access (get_catalog, lookup_job) live in
+# gloss_utils/catalog.py so gloss_utils never imports from tools.
+#
+# Usage:
+#   python -m tools.shot_catalog crawl [--jobs 101181 ...] [--threads 32]
+#   python -m tools.shot_catalog refresh [--budget 60] [--every 300]
+#   python -m tools.shot_catalog find SH010
+#   python -m tools.shot_catalog job 101181
+#   python -m tools.shot_catalog stats
+
+import os
+import re
+import sys
+import time
+import sqlite3
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from gloss_utils import quicktime
+from gloss_utils.catalog import CATALOG_ENV, CATALOG_FILE, CatalogReader, get_catalog, lookup_job  # noqa: F401
+from gloss_utils.sequences import group_frames
+from gloss_utils.shot_names import parse as parse_shot_name, parse_path
+from gloss_utils.nuke_helpers import traced, current_span, san_call
+
+try:
+    from gloss_utils.paths_nyc import (GLOSS_ROOT, CLOUD_ROOT, APPROVED_NEW_SUB, APPROVED_OLD_CHAIN,
+                                       VFX_NY_DIRNAME, job_code_from_project_folder, extract_job_code)
+except Exception:
+    GLOSS_ROOT = "/Volumes/san-01/GlossPost"
+    CLOUD_ROOT = "/Volumes/san-01/CloudSync"
+    APPROVED_NEW_SUB = "APPROVED_RETOUCH"
+    APPROVED_OLD_CHAIN = ["FOOTAGE_CLOUD", "APPROVED_RETOUCH_CLOUD"]
+    VFX_NY_DIRNAME = "VFX-NY"
+    def job_code_from_project_folder(name):
+        head = (name or "").split("_", 1)[0]
+        return head if head.isdigit() and len(head) == 6 else None
+    def extract_job_code(text):
+        m = re.search(r"(^|[^\d])(\d{6})(?!\d)", text or "")
+        return m.group(2) if m else None
+
+CRAWL_THREADS = 32     # listings are SAN-latency bound, not CPU bound
+MAX_DEPTH     = 8      # below a job folder; deepest pipeline media sits at 5
+REFRESH_BUDGET   = 60  # seconds one incremental refresh may spend on the SAN
+REFRESH_INTERVAL = 300 # seconds between refreshes with --every
+IMAGE_EXTS    = (".exr", ".dpx", ".png", ".tif", ".tiff", ".jpg", ".jpeg")
+
+_SCRIPT_VER_RE = re.compile(r"_v(\d+)\.nk$", re.IGNORECASE)
+_LINEUP_RE     = re.compile(r"^Line_up_v(\d+)\.nk$", re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta    (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS jobs    (code TEXT PRIMARY KEY, project TEXT, cloud TEXT,
+                                    approved_new TEXT, approved_old TEXT, vfx_ny TEXT, progress_nuke TEXT);
+CREATE TABLE IF NOT EXISTS shots   (job TEXT NOT NULL, key TEXT NOT NULL, name TEXT,
+                                    PRIMARY KEY (job, key));
+CREATE TABLE IF NOT EXISTS media   (path TEXT PRIMARY KEY, dir TEXT NOT NULL, job TEXT, shot TEXT,
+                                    role TEXT, kind TEXT, dept TEXT, version INTEGER,
+                                    first INTEGER, last INTEGER, frames INTEGER, fps REAL,
+                                    width INTEGER, height INTEGER, mtime REAL, size INTEGER);
+CREATE TABLE IF NOT EXISTS scripts (path TEXT PRIMARY KEY, dir TEXT NOT NULL, job TEXT, shot TEXT,
+                                    task TEXT, version INTEGER, mtime REAL);
+CREATE TABLE IF NOT EXISTS dirs    (path TEXT PRIMARY KEY, parent TEXT, job TEXT, root TEXT,
+                                    depth INTEGER, mtime REAL, checked REAL);
+CREATE INDEX IF NOT EXISTS shots_key    ON shots (key);
+CREATE INDEX IF NOT EXISTS media_shot   ON media (job, shot);
+CREATE INDEX IF NOT EXISTS media_dir    ON media (dir);
+CREATE INDEX IF NOT EXISTS scripts_shot ON scripts (job, shot);
+CREATE INDEX IF NOT EXISTS scripts_dir  ON scripts (dir);
+CREATE INDEX IF NOT EXISTS dirs_parent  ON dirs (parent);
+CREATE INDEX IF NOT EXISTS dirs_checked ON dirs (checked);
+"""
+
+MEDIA_COLS  = ("path", "dir", "job", "shot", "role", "kind", "dept", "version",
+               "first", "last", "frames", "fps", "width", "height", "mtime", "size")
+
+# One directory listing: what it held, where to go next and how many SAN round trips it took
+# (listings run on pool threads, so the count travels with the result to the span's thread)
+DirScan = namedtuple("DirScan", "path mtime job root depth subdirs media scripts san")
+
+
+# ===============================
+# Crawling (pool threads; no database access)
+# ===============================
+def discover_jobs(gloss_root=GLOSS_ROOT, cloud_root=CLOUD_ROOT):
+    """{code: {"code", "project", "cloud"}} from one listing of each root (first folder per code wins)."""
+    jobs = {}
+    for name in sorted(_listdir_dirs(gloss_root)):
+        code = job_code_from_project_folder(name)
+        if code and code not in jobs:
+            jobs[code] = {"code": code, "project": name, "cloud": None}
+    for name in sorted(_listdir_dirs(cloud_root)):
+        code = extract_job_code(name.split("_", 1)[0])
+        if not code:
+            continue
+        job = jobs.setdefault(code, {"code": code, "project": None, "cloud": None})
+        if job["cloud"] is None:
+            job["cloud"] = name
+    return jobs
+
+def _listdir_dirs(path):
+    san_call()
+    try:
+        with os.scandir(path) as it:
+            return [e.name for e in it if not e.name.startswith(".") and e.is_dir()]
+    except OSError:
+        return []
+
+def dir_role(parts):
+    """Pipeline role of a directory from its path parts below the job folder."""
+    names = set(parts)
+    if APPROVED_NEW_SUB in names or APPROVED_OLD_CHAIN[-1] in names:
+        return "approved"
+    if VFX_NY_DIRNAME in names:
+        return "final"
+    if "RETOUCH" in names:
+        return "retouch"
+    if parts and parts[0].startswith("PROGRESS-"):
+        if "DN" in names:
+            return "dn"
+        if "PreComp" in names:
+            return "precomp"
+        return "progress"
+    if parts and parts[0].startswith("IN-"):
+        return "plate"
+    return "other"
+
+def _media_row(path, folder, job, role, kind, **values):
+    sn = parse_path(path)
+    row = dict.fromkeys(MEDIA_COLS)
+    row.update(path=path, dir=folder, job=job, shot=sn.key, role=role, kind=kind,
+               dept=sn.dept, version=sn.version, **values)
+    return row, (sn.key, sn.base)
+
+def scan_dir(job, root, path, depth=0, probe=True, known=None):
+    """
+    List one directory below a job folder: sequences, MOVs (header-probed) and task scripts.
+    `known` maps MOV path -> media row from a previous crawl; MOVs whose mtime and size
+    are unchanged keep their header values instead of being re-probed. Returns a DirScan (mtime None when the directory is gone).
+    """
+    san = 1
+    try:
+        mtime = os.stat(path).st_mtime
+        san += 1
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return DirScan(path, None, job, root, depth, [], [], [], san)
+
+    parts = os.path.relpath(path, root).replace("\\", "/").split("/") if path != root else []
+    role = dir_role(parts)
+    subdirs, frames, media, scripts = [], [], [], []
+    for e in entries:
+        name = e.name
+        if name.startswith("."):
+            continue
+        try:
+            if e.is_dir():
+                if depth < MAX_DEPTH:
+                    subdirs.append(e.path)
+                continue
+        except OSError:
+            continue
+        low = name.lower()
+        if low.endswith(quicktime.MOV_EXTS):
+            row, probed = _mov_row(job, path, e, role, probe, known)
+            media.append(row)
+            san += 1 + probed  # stat, header read
+        elif low.endswith(".nk"):
+            row = _script_row(job, path, e, parts)
+            if row:
+                scripts.append(row)
+                san += 1  # stat
+        else:
+            frames.append(name)
+
+    seqs, _ = group_frames(frames, IMAGE_EXTS)
+    for pattern, (first, last, count) in seqs.items():
+        media.append(_media_row(os.path.join(path, pattern), path, job, role, "sequence",
+                                first=first, last=last, frames=count))
+    return DirScan(path, mtime, job, root, depth, subdirs, media, scripts, san)
+
+def _mov_row(job, folder, entry, role, probe, known):
+    """(media row, whether the header was read)"""
+    try:
+        st = entry.stat()
+        mtime, size = st.st_mtime, st.st_size
+    except OSError:
+        mtime = size = None
+    values = {"mtime": mtime, "size": size}
+    old = (known or {}).get(entry.path)
+    probed = False
+    if old and old["mtime"] == mtime and old["size"] == size:
+        values.update((k, old[k]) for k in ("fps", "width", "height", "frames", "first", "last"))
+    elif probe:
+        probed = True
+        try:
+            info = quicktime.probe(entry.path)
+        except Exception:
+            info = None
+        if info:
+            values.update(fps=info.fps, width=info.width, height=info.height, frames=info.frames,
+                          first=1 if info.frames else None, last=info.frames)
+    return _media_row(entry.path, folder, job, role, "mov", **values), probed
+
+def _script_row(job, folder, entry, parts):
+    """Task scripts (NUKE/<shot>/Scripts/<TASK>/) and lineups; other .nk files are skipped."""
+    m = _LINEUP_RE.match(entry.name)
+    if m:
+        shot, task, version = None, "LINEUP", int(m.group(1))
+    elif len(parts) >= 3 and parts[-2] == "Scripts":
+        m = _SCRIPT_VER_RE.search(entry.name)
+        shot, task, version = parts[-3], parts[-1], int(m.group(1)) if m else None
+    else:
+        return None
+    try:
+        mtime = entry.stat().st_mtime
+    except OSError:
+        mtime = None
+    sn = parse_shot_name(shot) if shot else None
+    row = {"path": entry.path, "dir": folder, "job": job, "shot": sn.key if sn else None,
+           "task": task, "version": version, "mtime": mtime}
+    return row, ((sn.key, sn.base) if sn else None)
+
+def crawl_dirs(starts, threads=CRAWL_THREADS, probe=True, known=None, deadline=None, skip=()):
+    """
+    Breadth-first crawl from [(job, root, path, depth), ...] on a thread pool; every
+    listing is one task, subdirectories are queued as soon as their parent is listed
+    (except those in `skip`). Yields DirScans in completion order. After `deadline`
+    (time.time()) nothing new is queued and queued listings are dropped, so some
+    subdirectories of the yielded scans may never be listed.
+    """
+    def task(job, root, path, depth):
+        if deadline is not None and time.time() >= deadline:
+            return None
+        return scan_dir(job, root, path, depth, probe, known)
+
+    with ThreadPoolExecutor(max_workers=max(1, threads)) as pool:
+        pending = {pool.submit(task, *start) for start in starts}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                scan = fut.result()
+                if scan is None:
+                    continue
+                if deadline is None or time.time() < deadline:
+                    for sub in scan.subdirs:
+                        if sub not in skip:
+                            pending.add(pool.submit(task, scan.job, scan.root, sub, scan.depth + 1))
+                yield scan
+
+def _dir_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+def _dir_row(scan, mtime, checked):
+    return {"path": scan.path, "parent": os.path.dirname(scan.path) if scan.depth else None,
+            "job": scan.job, "root": scan.root, "depth": scan.depth, "mtime": mtime, "checked": checked}
+
+
+# ===============================
+# Catalog
+# ===============================
+class ShotCatalog(CatalogReader):
+    """
+    The catalog database, writable: creates the schema, crawls and refreshes.
+    Queries come from gloss_utils.catalog.CatalogReader.
+    """
+
+    def __init__(self, path=CATALOG_FILE, gloss_root=GLOSS_ROOT, cloud_root=CLOUD_ROOT):
+        super(ShotCatalog, self).__init__(path, gloss_root, cloud_root)
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")  # readers (Nuke) never block the crawler
+        conn.executescript(SCHEMA)
+        return conn
+
+    # --- crawling ---
+    def _job_starts(self, jobs):
+        starts = []
+        for job in jobs.values():
+            if job["project"]:
+                root = os.path.join(self.gloss_root, job["project"])
+                starts.append((job["code"], root, root, 0))
+            if job["cloud"]:
+                root = os.path.join(self.cloud_root, job["cloud"])
+                starts.append((job["code"], root, root, 0))
+        return starts
+
+    def _job_row(self, job, approved):
+        code, project, cloud = job["code"], job["project"], job["cloud"]
+        in_root = os.path.join(self.gloss_root, project, f"IN-{code}") if project else None
+        return {
+            "code": code, "project": project, "cloud": cloud,
+            "approved_new": approved.get((code, "new")),
+            "approved_old": approved.get((code, "old")),
+            "vfx_ny": os.path.join(in_root, VFX_NY_DIRNAME) if in_root else None,
+            "progress_nuke": os.path.join(self.gloss_root, project, f"PROGRESS-{code}", "NUKE") if project else None,
+        }
+
+    @staticmethod
+    def _approved_dir(scan):
+        """("new"|"old", path) when the listed directory is an Approved folder itself."""
+        base = os.path.basename(scan.path)
+        if base == APPROVED_NEW_SUB:
+            return "new", scan.path
+        if base == APPROVED_OLD_CHAIN[-1]:
+            return "old", scan.path
+        return None
+
+    @traced()
+    def crawl(self, job_codes=None, threads=CRAWL_THREADS, probe=True):
+        """
+        Full crawl of every job (or only `job_codes`); replaces their rows in one transaction.
+        Returns {"jobs", "dirs", "media", "scripts", "shots", "elapsed"}.
+        """
+        t0 = time.time()
+        jobs = discover_jobs(self.gloss_root, self.cloud_root)
+        if job_codes:
+            jobs = {c: j for c, j in jobs.items() if c in set(job_codes)}
+
+        sp = current_span()
+        dirs, media, scripts, shots, approved = [], [], [], {}, {}
+        for scan in crawl_dirs(self._job_starts(jobs), threads, probe):
+            sp.san(scan.san)
+            if scan.mtime is None:
+                continue
+            dirs.append(_dir_row(scan, scan.mtime, t0))
+            hit = self._approved_dir(scan)
+            if hit:
+                approved[(scan.job, hit[0])] = hit[1]
+            for row, shot in scan.media + scan.scripts:
+                (media if "kind" in row else scripts).append(row)
+                if shot:
+                    shots.setdefault((scan.job, shot[0]), shot[1])
+
+        with self.conn:
+            if job_codes:
+                marks = ",".join("?" * len(jobs))
+                for table, col in (("jobs", "code"), ("shots", "job"), ("media", "job"),
+                                   ("scripts", "job"), ("dirs", "job")):
+                    self.conn.execute(f"DELETE FROM {table} WHERE {col} IN ({marks})", list(jobs))
+            else:
+                for table in ("jobs", "shots", "media", "scripts", "dirs"):
+                    self.conn.execute(f"DELETE FROM {table}")
+            self._insert("jobs", [self._job_row(j, approved) for j in jobs.values()])
+            self._insert("media", media)
+            self._insert("scripts", scripts)
+            self._insert("dirs", dirs)
+            self.conn.executemany("INSERT OR REPLACE INTO shots (job, key, name) VALUES (?, ?, ?)",
+                                  [(j, k, n) for (j, k), n in shots.items()])
+            self._set_meta(gloss_root=self.gloss_root, cloud_root=self.cloud_root, crawled=time.time())
+
+        sp.add_items(len(media) + len(scripts))
+        return {"jobs": len(jobs), "dirs": len(dirs), "media": len(media), "scripts": len(scripts),
+                "shots": len(shots), "elapsed": time.time() - t0}
+
+    @traced()
+    def refresh(self, budget_s=REFRESH_BUDGET, threads=CRAWL_THREADS, probe=True):
+        """
+        Incremental update driven by directory mtimes, bounded by `budget_s` seconds:
+          1. list both roots: new job folders are crawled, vanished ones dropped
+          2. stat the known directories, least recently checked first
+          3. re-list only the directories whose mtime changed and crawl new subfolders
+             found there; directories that are gone lose their whole subtree
+        All changes go in one transaction. Whatever the budget did not reach keeps its
+        old rows and comes first next time. Falls back to crawl() when the catalog was
+        never crawled for these roots.
+        Returns {"full", "jobs", "checked", "changed", "listed", "removed", "media",
+        "scripts", "pending", "elapsed"}.
+        """
+        if not (self.matches_roots() and self.conn.execute("SELECT 1 FROM dirs LIMIT 1").fetchone()):
+            return dict(self.crawl(threads=threads, probe=probe), full=True)
+
+        t0 = time.time()
+        deadline = t0 + budget_s
+        jobs = discover_jobs(self.gloss_root, self.cloud_root)
+        roots = {start[1]: start for start in self._job_starts(jobs)}
+        rows = self.conn.execute("SELECT path, job, root, depth, mtime FROM dirs ORDER BY checked").fetchall()
+        known_dirs = {r["path"] for r in rows}
+        gone_roots = [r["path"] for r in rows if r["depth"] == 0 and r["path"] not in roots]
+        rows = [r for r in rows if r["root"] in roots]
+
+        # 2. stat known directories in pool-sized batches; half the budget at most, so
+        #    re-listing what changed always gets its share
+        changed, gone, unchanged = [], [], []
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as pool:
+            step = max(1, threads) * 8
+            for i in range(0, len(rows), step):
+                if time.time() >= t0 + budget_s / 2:
+                    break
+                batch = rows[i:i + step]
+                san_call(len(batch))  # one stat each, on the pool threads
+                for row, mtime in zip(batch, pool.map(_dir_mtime, [r["path"] for r in batch])):
+                    if mtime is None:
+                        gone.append(row["path"])
+                    elif mtime != row["mtime"]:
+                        changed.append(row)
+                    else:
+                        unchanged.append(row["path"])
+        checked = len(changed) + len(gone) + len(unchanged)
+
+        # 3. re-list changed directories, crawl new job folders and new subfolders
+        starts = [(r["job"], r["root"], r["path"], r["depth"]) for r in changed]
+        starts += [start for root, start in roots.items() if root not in known_dirs]
+        movs = self._mov_rows([r["path"] for r in changed])
+        scans = list(crawl_dirs(starts, threads, probe, movs, deadline, skip=known_dirs))
+        listed = {s.path for s in scans}
+
+        now = time.time()
+        sp = current_span()
+        media, scripts, shots, dir_rows, removed = [], [], {}, [], []
+        for scan in scans:
+            sp.san(scan.san)
+            if scan.mtime is None:
+                removed.append(scan.path)
+                continue
+            # A folder whose new subfolders were not all listed keeps no mtime: next
+            # refresh sees it as changed and picks them up
+            whole = all(sub in known_dirs or sub in listed for sub in scan.subdirs)
+            dir_rows.append(_dir_row(scan, scan.mtime if whole else None, now))
+            for row, shot in scan.media + scan.scripts:
+                (media if "kind" in row else scripts).append(row)
+                if shot:
+                    shots.setdefault((scan.job, shot[0]), shot[1])
+            subdirs = set(scan.subdirs)
+            removed += [r[0] for r in self.conn.execute("SELECT path FROM dirs WHERE parent = ?", (scan.path,))
+                        if r[0] not in subdirs]
+        # a deleted folder shows up both as gone and as missing from its re-listed parent
+        removed = list(dict.fromkeys(removed + gone + gone_roots))
+
+        old_codes = {r[0] for r in self.conn.execute("SELECT code FROM jobs")}
+        affected = {s.job for s in scans} | (set(jobs) ^ old_codes)
+        with self.conn:
+            for path in listed:
+                self.conn.execute("DELETE FROM media WHERE dir = ?", (path,))
+                self.conn.execute("DELETE FROM scripts WHERE dir = ?", (path,))
+            for path in removed:
+                affected.update(self._delete_tree(path))
+            for code in old_codes - set(jobs):
+                for table, col in (("jobs", "code"), ("shots", "job"), ("media", "job"),
+                                   ("scripts", "job"), ("dirs", "job")):
+                    self.conn.execute(f"DELETE FROM {table} WHERE {col} = ?", (code,))
+            self._insert("media", media)
+            self._insert("scripts", scripts)
+            self._insert("dirs", dir_rows)
+            self.conn.executemany("UPDATE dirs SET checked = ? WHERE path = ?", [(now, p) for p in unchanged])
+            self.conn.executemany("INSERT OR REPLACE INTO shots (job, key, name) VALUES (?, ?, ?)",
+                                  [(j, k, n) for (j, k), n in shots.items()])
+            affected &= set(jobs)
+            for code in affected:
+                self.conn.execute(
+                    "DELETE FROM shots WHERE job = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM media m WHERE m.job = shots.job AND m.shot = shots.key) "
+                    "AND NOT EXISTS (SELECT 1 FROM scripts s WHERE s.job = shots.job AND s.shot = shots.key)",
+                    (code,))
+            approved = self._approved_from_dirs(affected)
+            self._insert("jobs", [self._job_row(jobs[c], approved) for c in affected])
+            self._set_meta(refreshed=now)
+
+        pending = (len(rows) - checked) + sum(1 for s in starts if s[2] not in listed) \
+            + sum(1 for r in dir_rows if r["mtime"] is None)
+        sp.add_items(len(media) + len(scripts))
+        return {"full": False, "jobs": len(affected), "checked": checked, "changed": len(changed),
+                "listed": len(scans), "removed": len(removed), "media": len(media),
+                "scripts": len(scripts), "pending": pending, "elapsed": time.time() - t0}
+
+    def _mov_rows(self, folders):
+        """{path: media row} of the MOVs in `folders`, so unchanged clips skip the header probe."""
+        out = {}
+        for folder in folders:
+            for r in self.conn.execute("SELECT * FROM media WHERE dir = ? AND kind = 'mov'", (folder,)):
+                out[r["path"]] = dict(r)
+        return out
+
+    def _delete_tree(self, path):
+        """Drop a directory and everything below it; returns the job codes it touched."""
+        lo, hi = path + "/", path + "0"  # "0" sorts right after "/": a range over the subtree
+        jobs = {r[0] for r in self.conn.execute(
+            "SELECT DISTINCT job FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", (path, lo, hi))}
+        for table, col in (("dirs", "path"), ("media", "dir"), ("scripts", "dir")):
+            self.conn.execute(f"DELETE FROM {table} WHERE {col} = ? OR ({col} >= ? AND {col} < ?)",
+                              (path, lo, hi))
+        return jobs
+
+    def _approved_from_dirs(self, codes):
+        """{(code, "new"|"old"): path} from the stored directories of the given jobs."""
+        approved = {}
+        for code in codes:
+            for (path,) in self.conn.execute(
+                    "SELECT path FROM dirs WHERE job = ? AND (path GLOB ? OR path GLOB ?) ORDER BY path",
+                    (code, f"*/{APPROVED_NEW_SUB}", f"*/{APPROVED_OLD_CHAIN[-1]}")):
+                kind = "new" if os.path.basename(path) == APPROVED_NEW_SUB else "old"
+                approved.setdefault((code, kind), path)
+        return approved
+
+    def _insert(self, table, rows):
+        if not rows:
+            return
+        cols = list(rows[0])
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})",
+            [tuple(r[c] for c in cols) for r in rows])
+
+    def _set_meta(self, **values):
+        self.conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                              [(k, str(v)) for k, v in values.items()])
+
+
+# ===============================
+# Headless entry point
+# ===============================
+def _when(t):
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(t)) if t else "never"
+
+def _refresh_once(cat, budget, threads, probe):
+    s = cat.refresh(budget, threads, probe)
+    stamp = time.strftime("%H:%M:%S")
+    if s["full"]:
+        print(f"{stamp} full crawl: {s['dirs']} folder(s), {s['shots']} shots, {s['media']} media, "
+              f"{s['scripts']} scripts in {s['elapsed']:.2f}s", flush=True)
+        return
+    left = f", {s['pending']} folder(s) left for next time" if s["pending"] else ""
+    print(f"{stamp} {s['checked']} folder(s) checked, {s['changed']} changed, {s['listed']} listed, "
+          f"{s['removed']} removed: {s['media']} media, {s['scripts']} scripts in {s['elapsed']:.2f}s{left}",
+          flush=True)
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="SQLite catalog of GlossPost/CloudSync jobs, shots and media.")
+    ap.add_argument("--db", default=CATALOG_FILE)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    c = sub.add_parser("crawl", help="(re)build the catalog from the SAN")
+    c.add_argument("--jobs", nargs="+", help="only these job codes")
+    c.add_argument("--threads", type=int, default=CRAWL_THREADS)
+    c.add_argument("--no-probe", action="store_true", help="skip QuickTime headers (no MOV frame ranges)")
+    r = sub.add_parser("refresh", help="update from changed folders only (full crawl the first time)")
+    r.add_argument("--budget", type=float, default=REFRESH_BUDGET, help="seconds per refresh")
+    r.add_argument("--every", type=float, help="keep running, one refresh every N seconds")
+    r.add_argument("--threads", type=int, default=CRAWL_THREADS)
+    r.add_argument("--no-probe", action="store_true", help="skip QuickTime headers (no MOV frame ranges)")
+    f = sub.add_parser("find", help="find shots by name")
+    f.add_argument("shot")
+    f.add_argument("--limit", type=int, default=50)
+    j = sub.add_parser("job", help="show a job's folders and shot count")
+    j.add_argument("code")
+    sub.add_parser("stats", help="row counts and last crawl time")
+    args = ap.parse_args(argv)
+
+    cat = ShotCatalog(args.db)
+    if args.cmd == "crawl":
+        s = cat.crawl(args.jobs, args.threads, probe=not args.no_probe)
+        print(f"{s['jobs']} job(s), {s['dirs']} folder(s) listed: {s['shots']} shots, "
+              f"{s['media']} media, {s['scripts']} scripts in {s['elapsed']:.2f}s")
+        return 0
+    if args.cmd == "refresh":
+        try:
+            while True:
+                _refresh_once(cat, args.budget, args.threads, not args.no_probe)
+                if not args.every:
+                    return 0
+                time.sleep(args.every)
+        except KeyboardInterrupt:
+            return 0
+    if args.cmd == "stats":
+        s = cat.stats()
+        print(f"{s['jobs']} jobs, {s['shots']} shots, {s['media']} media, {s['scripts']} scripts, "
+              f"{s['dirs']} folders (crawled {_when(s['crawled'])}, refreshed {_when(s['refreshed'])})")
+        return 0
+    if args.cmd == "job":
+        row = cat.job(args.code)
+        if not row:
+            print(f"{args.code}: not in the catalog")
+            return 1
+        for key, value in row.items():
+            print(f"  {key:14} {value or '-'}")
+        return 0
+
+    t0 = time.perf_counter()
+    hits = cat.find_shots(args.shot, args.limit)
+    for h in hits:
+        versions = {r["role"]: r["version"] for r in reversed(cat.media(h["job"], h["key"]))}
+        flag = "  APPROVED" if cat.is_approved(h["job"], h["key"]) else ""
+        roles = " ".join(f"{k}:v{v}" if v else k for k, v in sorted(versions.items()))
+        print(f"{h['job']}  {h['name']:<28} {roles}{flag}")
+    print(f"{len(hits)} shot(s) in {(time.perf_counter() - t0) * 1000:.1f} ms")
+    return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# tools/span_report.py
+# Latency summary of GLOSS span logs (see gloss_utils.nuke_helpers.span).
+# - Reads one or more JSON-lines files written via GLOSS_SPAN_LOG
+#   (files, directories of *.jsonl, or glob patterns)
+# - Prints count / errors / p50 / p95 / max per op, optionally filtered by op name
+#
+# Usage:
+#   python -m tools.span_report /Volumes/san-04/GlossUsers/gloss_logs/spans
+#   python -m tools.span_report spans/*.jsonl --op copy_to_approved --days 7
+#   python -m tools.span_report spans --json > spans_summary.json
+
+import os
+import sys
+import glob
+import json
+import time
+
+from gloss_utils.nuke_helpers import SPAN_LOG_ENV, load_span_log, span_stats
+
+
+def _expand(sources):
+    paths = []
+    for src in sources:
+        src = os.path.expanduser(src)
+        if os.path.isdir(src):
+            paths.extend(sorted(glob.glob(os.path.join(src, "*.jsonl"))))
+        else:
+            paths.extend(sorted(glob.glob(src)) or [src])
+    return paths
+
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Summarize GLOSS span logs (p50/p95 per op).")
+    ap.add_argument("sources", nargs="*", help=f"span log files/dirs/globs (default: ${SPAN_LOG_ENV})")
+    ap.add_argument("--op", help="only ops whose name contains this")
+    ap.add_argument("--days", type=float, help="only records from the last N days")
+    ap.add_argument("--json", action="store_true", help="print machine-readable stats")
+    args = ap.parse_args(argv)
+
+    sources = args.sources
+    if not sources and os.environ.get(SPAN_LOG_ENV):
+        sources = [os.environ[SPAN_LOG_ENV].replace("{host}", "*")]
+    if not sources:
+        ap.error(f"no span logs given and ${SPAN_LOG_ENV} is not set")
+
+    records = []
+    for path in _expand(sources):
+        records.extend(load_span_log(path))
+    if args.op:
+        records = [r for r in records if args.op in str(r.get("op"))]
+    if args.days:
+        cutoff = time.time() - args.days * 86400
+        records = [r for r in records if r.get("ts", 0) >= cutoff]
+
+    stats = span_stats(records)
+    if args.json:
+        print(json.dumps(stats, indent=2, sort_keys=True))
+        return 0
+
+    hosts = len({r.get("host") for r in records})
+    print(f"{len(records)} span(s) from {hosts} host(s)\n")
+    print(f"{'op':42} {'count':>7} {'errors':>7} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10} {'SAN/op':>7}")
+    for op, st in sorted(stats.items(), key=lambda kv: -kv[1]["count"]):
+        print(f"{str(op):42} {st['count']:>7} {st['errors']:>7} {st['p50_ms']:>10.1f} "
+              f"{st['p95_ms']:>10.1f} {st['max_ms']:>10.1f} {st['avg_san_calls']:>7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
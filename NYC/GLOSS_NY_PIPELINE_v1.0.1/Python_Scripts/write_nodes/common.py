@@ -2,6 +2,8 @@
 # Shared helpers for write nodes: detect/choose output type and apply defaults.
 import os, re, nuke
 
+from gloss_utils.nuke_helpers import traced, log_warning
+
 MOV_EXTS  = (".mov", ".mp4")
 SEQ_EXTS  = (".exr", ".dpx", ".png", ".tif", ".tiff", ".jpg", ".jpeg")
 
@@ -28,6 +30,7 @@ def _counts_from_scene():
             counts["other_seq"] += 1
     return counts
 
+@traced()
 def choose_output_type():
     """
     Returns one of: 'mov', 'exr', 'dpx', 'png' or None if canceled.
@@ -89,6 +92,7 @@ def _ask_4way(default, mov, exr, dpx, png, other):
     except Exception:
         return "mov"
 
+@traced()
 def apply_defaults(write_node, out_type):
     """
     Set file_type and reasonable defaults for each format.
@@ -136,8 +140,136 @@ def _set_if(node, knob, value):
         pass
 
 
+# --- Output folders (created at render time, not at path-set time) ----------
+
+RENDER_HOOK_CMD = ("import write_nodes.common as _wc, write_nodes.render_check as _rc; "
+                   "_rc.begin_render(); _wc.ensure_output_dirs()")
+RENDER_FRAME_CMD = "import write_nodes.render_check as _rc; _rc.note_rendered_frame()"
+RENDER_CHECK_CMD = "import write_nodes.render_check as _rc; _rc.after_render_check()"
+
+def output_dir_for(write_node):
+    """Folder the Write renders into (string work only, no filesystem access)."""
+    try:
+        p = write_node["file"].evaluate()
+    except Exception:
+        try:
+            p = write_node["file"].value()
+        except Exception:
+            p = ""
+    d = os.path.dirname((p or "").replace("\\", "/"))
+    # 'untitled/...' placeholders are relative; never create those.
+    return d if d and os.path.isabs(d) else None
+
+_VFX_NY_PATH = re.compile(r"^(.*/IN-[^/]+)/(?:FOOTAGE/)?VFX-NY(/.*)$")
+
+def use_vfx_layout_on_disk(write_node):
+    """
+    Render time: point a Write under IN-{code}/VFX-NY or IN-{code}/FOOTAGE/VFX-NY at
+    whichever of the two exists now (NEW layout if both or neither do).
+    Paths are set without touching the SAN, so the choice is made here, once per render.
+    """
+    try:
+        path = write_node["file"].value()
+    except Exception:
+        return
+    m = _VFX_NY_PATH.match((path or "").replace("\\", "/"))
+    if not m:
+        return
+    in_root, rest = m.groups()
+    new_dir = f"{in_root}/VFX-NY"
+    old_dir = f"{in_root}/FOOTAGE/VFX-NY"
+    base = old_dir if not os.path.isdir(new_dir) and os.path.isdir(old_dir) else new_dir
+    if base + rest != path:
+        write_node["file"].setValue(base + rest)
+
+@traced()
+def ensure_output_dirs(nodes=None):
+    """
+    beforeRender hook: create the output folders for the Writes being rendered.
+    Defaults to nuke.thisNode(); Writes under VFX-NY are first pointed at the layout
+    on disk (use_vfx_layout_on_disk), then all folders are collected, de-duplicated,
+    then created in one pass. Not cached across renders: a folder deleted or moved
+    since the last render is recreated. Raises on failure so the render stops early.
+    """
+    if nodes is None:
+        try:
+            nodes = [nuke.thisNode()]
+        except Exception:
+            nodes = []
+    nodes = [n for n in nodes if n is not None]
+    for n in nodes:
+        use_vfx_layout_on_disk(n)
+    wanted = {d for d in (output_dir_for(n) for n in nodes) if d}
+    for d in sorted(wanted):
+        try:
+            os.makedirs(d, exist_ok=True)
+        except Exception as e:
+            raise RuntimeError(f"Could not create output folder:\n{d}\n\n{e}")
+    return sorted(wanted)
+
+def _add_hook(node, knob, cmd):
+    """Append cmd to a callback knob, keeping whatever is already there; no-op if present."""
+    try:
+        if knob not in node.knobs():
+            return
+        current = node[knob].value() or ""
+        if cmd in current:
+            return
+        node[knob].setValue(f"{current.rstrip()}\n{cmd}" if current.strip() else cmd)
+    except Exception:
+        pass
+
+def install_render_hook(write_node):
+    """
+    Add ensure_output_dirs and the post-render completeness check (which checks the
+    frames actually rendered) to the Write's own beforeRender/afterFrameRender/afterRender
+    knobs (saved with the script), alongside any callbacks already set there.
+    """
+    _add_hook(write_node, "beforeRender", RENDER_HOOK_CMD)
+    _add_hook(write_node, "afterFrameRender", RENDER_FRAME_CMD)
+    _add_hook(write_node, "afterRender", RENDER_CHECK_CMD)
+
+
+# --- Path refresh on save ---------------------------------------------------
+
+# One onScriptSave callback for every Gloss Write. Registering a lambda per Write
+# piled up one callback per Write ever created (deleted ones included), all run on
+# every save.
+_PATH_REFRESH = []  # [(write_node, fn(write_node)), ...]
+_save_hook_installed = False
+
+def register_path_refresh(write_node, fn):
+    """Re-run fn(write_node) on every script save while the node exists."""
+    global _save_hook_installed
+    _PATH_REFRESH.append((write_node, fn))
+    if not _save_hook_installed:
+        nuke.addOnScriptSave(_refresh_paths_on_save)
+        _save_hook_installed = True
+
+def _node_alive(node):
+    """False once the node was deleted (or its script closed): Nuke then raises ValueError."""
+    try:
+        node.name()
+        return True
+    except ValueError:
+        return False
+
+def _refresh_paths_on_save():
+    alive = []
+    for w, fn in _PATH_REFRESH:
+        if not _node_alive(w):
+            continue  # drop it
+        try:
+            fn(w)
+        except Exception as e:  # ValueError included: a live node's refresh failing is a real error
+            log_warning(f"Write path refresh failed for {w.name()}: {e}")
+        alive.append((w, fn))
+    _PATH_REFRESH[:] = alive
+
+
 # --- Write node UI (Gloss tab) ----------------------------------------------
 
+@traced()
 def install_write_gloss_ui(write_node):
     """
     Add/rename the 'User' tab to 'Gloss' on the given Write node and install:
@@ -1,7 +1,10 @@
 import os, re, nuke
-from write_nodes.common import choose_output_type, apply_defaults, seq_ext, install_write_gloss_ui
+from gloss_utils.nuke_helpers import traced
+from write_nodes.common import choose_output_type, apply_defaults, seq_ext, install_write_gloss_ui, install_render_hook, \
+    register_path_refresh
 
 
+@traced()
 def run():
     try:
         w = nuke.createNode("Write")
@@ -16,8 +19,9 @@ def run():
 
         # ⬇️ add this
         install_write_gloss_ui(w)
+        install_render_hook(w)  # folders are created at render time
 
-        nuke.addOnScriptSave(lambda: _set_path_dn(w, _current_type(w)))
+        register_path_refresh(w, lambda node: _set_path_dn(node, _current_type(node)))
         try: w["label"].setValue(f"DN ({'MOV' if out_type=='mov' else out_type.upper()})")
         except Exception: pass
     except Exception as e:
@@ -41,11 +45,9 @@ def _set_path_dn(w, out_type):
     ver  = _version_from(os.path.basename(sp))
 
     if out_type == "mov":
-        os.makedirs(os.path.join(shot_dir, "DN"), exist_ok=True)
         fn = f"{shot}_DN_v{ver}.mov"
         w["file"].setValue(os.path.join(shot_dir, "DN", fn))
     else:
         version_dir = os.path.join(shot_dir, "DN", f"{shot}_DN_v{ver}")
-        os.makedirs(version_dir, exist_ok=True)
         fn = f"{shot}_DN_v{ver}{seq_ext(out_type)}"
         w["file"].setValue(os.path.join(version_dir, fn))
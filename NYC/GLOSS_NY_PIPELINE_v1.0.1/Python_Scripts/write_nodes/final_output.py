@@ -1,6 +1,8 @@
 import os, re, nuke
 from datetime import datetime
-from write_nodes.common import choose_output_type, apply_defaults, seq_ext, install_write_gloss_ui
+from gloss_utils.nuke_helpers import traced
+from write_nodes.common import choose_output_type, apply_defaults, seq_ext, install_write_gloss_ui, install_render_hook, \
+    register_path_refresh
 
 
 try:
@@ -15,6 +17,7 @@ except Exception:
         code = (job_code or (project_folder.split("_", 1)[0] if project_folder else None))
         return f"/Volumes/san-01/GlossPost/{project_folder}/IN-{code}" if project_folder and code else None
 
+@traced()
 def run():
     try:
         w = nuke.createNode("Write")
@@ -31,8 +34,9 @@ def run():
 
         # ⬇️ add this
         install_write_gloss_ui(w)
+        install_render_hook(w)  # day/version folders are created at render time
 
-        nuke.addOnScriptSave(lambda: _set_path_final(w, _current_type(w)))
+        register_path_refresh(w, lambda node: _set_path_final(node, _current_type(node)))
     except Exception as e:
         nuke.message(f"Failed to create Final for Approved Write node: {e}")
 
@@ -44,16 +48,14 @@ def _version_from(name):
     m = re.search(r"_v(\d+)$", name);  return m.group(1) if m else "001"
 
 def _base_vfx_dir():
+    # String work only: the NEW layout is assumed here and ensure_output_dirs switches
+    # the Write to FOOTAGE/VFX-NY at render time when only the old layout exists.
     sp = nuke.root().name()
     job_code, project_folder = derive_job_from_path(sp)
     in_root = glosspost_in_root(project_folder, job_code)
     if not in_root:
         return None
-    new_dir = os.path.join(in_root, "VFX-NY")
-    old_dir = os.path.join(in_root, "FOOTAGE", "VFX-NY")
-    if os.path.exists(new_dir): return new_dir
-    if os.path.exists(old_dir): return old_dir
-    return new_dir  # default to NEW layout if neither exists yet
+    return os.path.join(in_root, "VFX-NY")
 
 def _set_path_final(w, out_type):
     sp = nuke.root().name()
@@ -62,7 +64,6 @@ def _set_path_final(w, out_type):
 
     base_vfx = _base_vfx_dir()
     day_dir  = os.path.join(base_vfx or os.path.dirname(sp), datetime.now().strftime("%Y-%m-%d"))
-    os.makedirs(day_dir, exist_ok=True)
 
     script_name = os.path.splitext(os.path.basename(sp))[0]
     ver  = _version_from(script_name)
@@ -72,5 +73,4 @@ def _set_path_final(w, out_type):
         w["file"].setValue(os.path.join(day_dir, f"{clip}_v{ver}.mov"))
     else:
         version_dir = os.path.join(day_dir, f"{clip}_v{ver}")
-        os.makedirs(version_dir, exist_ok=True)
         w["file"].setValue(os.path.join(version_dir, f"{clip}_v{ver}{seq_ext(out_type)}"))
@@ -1,6 +1,9 @@
 import os, re, nuke
-from write_nodes.common import choose_output_type, apply_defaults, seq_ext, install_write_gloss_ui
+from gloss_utils.nuke_helpers import traced
+from write_nodes.common import choose_output_type, apply_defaults, seq_ext, install_write_gloss_ui, install_render_hook, \
+    register_path_refresh
 
+@traced()
 def run():
     try:
         w = nuke.createNode("Write")
@@ -15,8 +18,9 @@ def run():
 
         # ⬇️ add this
         install_write_gloss_ui(w)
+        install_render_hook(w)  # folders are created at render time
 
-        nuke.addOnScriptSave(lambda: _set_path_precomp(w, _current_type(w)))
+        register_path_refresh(w, lambda node: _set_path_precomp(node, _current_type(node)))
         try: w["label"].setValue(f"PreComp ({'MOV' if out_type=='mov' else out_type.upper()})")
         except Exception: pass
     except Exception as e:
@@ -40,11 +44,9 @@ def _set_path_precomp(w, out_type):
     ver  = _version_from(os.path.basename(sp))
 
     if out_type == "mov":
-        os.makedirs(os.path.join(shot_dir, "PreComp"), exist_ok=True)
         fn = f"{shot}_PreComp_v{ver}.mov"
         w["file"].setValue(os.path.join(shot_dir, "PreComp", fn))
     else:
         version_dir = os.path.join(shot_dir, "PreComp", f"{shot}_PreComp_v{ver}")
-        os.makedirs(version_dir, exist_ok=True)
         fn = f"{shot}_PreComp_v{ver}{seq_ext(out_type)}"
         w["file"].setValue(os.path.join(version_dir, fn))
@@ -0,0 +1,180 @@
+# write_nodes/render_check.py
+# Post-render completeness check for Gloss Writes (afterRender hook).
+# - Compares the frames on disk with the range actually rendered (frames seen by the
+#   afterFrameRender hook, else the range the caller executed, else Write limit / Root)
+# - Flags missing, zero-byte and size-outlier frames
+# - One directory scan per output folder
+# - Puts a one-line summary on the node label and logs the details
+
+import os
+import re
+import time
+import statistics
+
+import nuke
+
+from gloss_utils.sequences import detect_pattern, scan_sequence
+from gloss_utils.nuke_helpers import log_info, log_warning, traced
+
+# Frames smaller than this fraction of the median (or larger than its inverse) are flagged.
+SIZE_OUTLIER_RATIO = 0.5
+CHECK_LOG_FILE     = os.path.expanduser("~/.nuke/gloss_logs/render_checks.log")
+LABEL_PREFIX       = "Frames:"
+
+# Set by the local render queue for its child processes: chunks only cover part
+# of the range, so the queue runs the check itself once all chunks are done.
+SKIP_ENV_VAR = "GLOSS_SKIP_RENDER_CHECK"
+
+# [first, last] frame seen by afterFrameRender during the current render, per Write full name.
+_RENDERED = {}
+
+
+def begin_render():
+    """beforeRender hook: forget frames seen by an earlier render of this Write."""
+    try:
+        _RENDERED.pop(nuke.thisNode().fullName(), None)
+    except Exception:
+        pass
+
+def note_rendered_frame():
+    """afterFrameRender hook: widen the Write's rendered range to include nuke.frame()."""
+    try:
+        key, f = nuke.thisNode().fullName(), int(nuke.frame())
+    except Exception:
+        return
+    seen = _RENDERED.get(key)
+    _RENDERED[key] = [f, f] if seen is None else [min(seen[0], f), max(seen[1], f)]
+
+def expected_range(write_node):
+    """(first, last) from the Write limit, else the Root; used when no rendered range is known."""
+    try:
+        if write_node["use_limit"].value():
+            return int(write_node["first"].value()), int(write_node["last"].value())
+    except Exception:
+        pass
+    root = nuke.root()
+    return int(root["first_frame"].value()), int(root["last_frame"].value())
+
+def _frame_ranges(frames):
+    """[1,2,3,7,9,10] -> '1-3, 7, 9-10'"""
+    out = []
+    frames = sorted(frames)
+    i = 0
+    while i < len(frames):
+        j = i
+        while j + 1 < len(frames) and frames[j + 1] == frames[j] + 1:
+            j += 1
+        out.append(str(frames[i]) if i == j else f"{frames[i]}-{frames[j]}")
+        i = j + 1
+    return ", ".join(out)
+
+def check_output(path, first, last):
+    """
+    Check a rendered output against first..last.
+    Returns {"path", "expected", "found", "missing", "empty", "outliers"} (frame lists).
+    MOV/single-file outputs only check existence and size.
+    """
+    path = (path or "").replace("\\", "/")
+    expected = list(range(int(first), int(last) + 1))
+    result = {"path": path, "expected": len(expected), "found": 0,
+              "missing": [], "empty": [], "outliers": []}
+
+    if not detect_pattern(path) or path.lower().endswith((".mov", ".mp4")):
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            result["missing"] = expected
+            return result
+        result["found"] = len(expected)
+        if size == 0:
+            result["empty"] = expected
+        return result
+
+    on_disk = scan_sequence(path)
+    sizes = {}
+    for f in expected:
+        st = on_disk.get(f)
+        if st is None:
+            result["missing"].append(f)
+        elif st.st_size == 0:
+            result["empty"].append(f)
+        else:
+            sizes[f] = st.st_size
+    result["found"] = len(expected) - len(result["missing"])
+
+    if len(sizes) >= 3:
+        median = statistics.median(sizes.values())
+        lo, hi = median * SIZE_OUTLIER_RATIO, median / SIZE_OUTLIER_RATIO
+        result["outliers"] = [f for f, s in sorted(sizes.items()) if s < lo or s > hi]
+    return result
+
+def summary_line(result):
+    bits = []
+    if result["missing"]:
+        bits.append(f"{len(result['missing'])} missing")
+    if result["empty"]:
+        bits.append(f"{len(result['empty'])} empty")
+    if result["outliers"]:
+        bits.append(f"{len(result['outliers'])} odd size")
+    status = "OK" if not bits else ", ".join(bits)
+    return f"{LABEL_PREFIX} {result['found']}/{result['expected']} {status}"
+
+def _set_label(write_node, line):
+    try:
+        lines = [l for l in write_node["label"].value().splitlines() if not l.startswith(LABEL_PREFIX)]
+        lines.append(line)
+        write_node["label"].setValue("\n".join(lines))
+    except Exception:
+        pass
+
+def _append_log(write_node, result):
+    try:
+        os.makedirs(os.path.dirname(CHECK_LOG_FILE), exist_ok=True)
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        with open(CHECK_LOG_FILE, "a") as fh:
+            fh.write(f"{stamp}\t{nuke.root().name()}\t{write_node.name()}\t{summary_line(result)}\t{result['path']}\n")
+    except Exception:
+        pass
+
+@traced()
+def check_write(write_node, first=None, last=None, update_label=True):
+    """
+    Run the completeness check for one Write over first..last (the rendered range;
+    expected_range() when not given). Updates its label and the log.
+    """
+    if first is None or last is None:
+        first, last = expected_range(write_node)
+    try:
+        path = nuke.filename(write_node) or write_node["file"].value()
+    except Exception:
+        path = write_node["file"].value()
+    result = check_output(path, first, last)
+    line = summary_line(result)
+
+    if update_label:
+        _set_label(write_node, line)
+    _append_log(write_node, result)
+
+    if result["missing"] or result["empty"] or result["outliers"]:
+        log_warning(f"{write_node.name()} {line}")
+        if result["missing"]:
+            log_warning(f"  missing: {_frame_ranges(result['missing'])}")
+        if result["empty"]:
+            log_warning(f"  zero-byte: {_frame_ranges(result['empty'])}")
+        if result["outliers"]:
+            log_warning(f"  odd size: {_frame_ranges(result['outliers'])}")
+    else:
+        log_info(f"{write_node.name()} {line}")
+    return result
+
+@traced()
+def after_render_check():
+    """afterRender hook for Gloss Writes (uses nuke.thisNode() and the frames it rendered)."""
+    if os.environ.get(SKIP_ENV_VAR):
+        return
+    try:
+        node = nuke.thisNode()
+        first, last = _RENDERED.pop(node.fullName(), None) or (None, None)
+        check_write(node, first, last)
+    except Exception as e:
+        log_warning(f"Render check failed: {e}")
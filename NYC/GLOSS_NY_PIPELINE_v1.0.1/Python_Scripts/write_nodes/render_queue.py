@@ -0,0 +1,372 @@
+# write_nodes/render_queue.py
+# Local multi-process render queue for Gloss Writes.
+# - Collects the Gloss_*_Write nodes from the current script
+# - Splits each Write's frame range into chunks (single-file formats such as mov stay whole)
+# - Runs the chunks on a pool of headless render processes (sized to the cores)
+# - Retries failed chunks and reports aggregate progress; cancelling stops running renders
+#
+# The render command is a template so a stand-in executable can be used in tests:
+#   GLOSS_RENDER_CMD="python fake_render.py {write} {first} {last} {script}"
+
+import os
+import sys
+import shlex
+import time
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import nuke  # optional; the queue itself runs without Nuke
+except Exception:
+    nuke = None
+
+from gloss_utils.nuke_helpers import traced, current_span
+
+GLOSS_WRITE_PREFIX = "Gloss_"
+DEFAULT_CHUNK_SIZE = 10
+DEFAULT_RETRIES    = 2
+SINGLE_FILE_TYPES  = ("mov", "mp4", "mxf", "avi", "gif")  # one file for the whole range
+CMD_ENV_VAR        = "GLOSS_RENDER_CMD"
+
+
+def _log(msg):
+    if nuke:
+        try:
+            nuke.tprint(f"[GLOSS NYC] {msg}")
+            return
+        except Exception:
+            pass
+    print(f"[GLOSS NYC] {msg}")
+
+
+# ===============================
+# Collecting work
+# ===============================
+def gloss_write_nodes():
+    """Enabled Gloss_* Write nodes in the current script."""
+    if nuke is None:
+        return []
+    writes = []
+    for w in nuke.allNodes("Write"):
+        if not w.name().startswith(GLOSS_WRITE_PREFIX):
+            continue
+        try:
+            if w["disable"].value():
+                continue
+        except Exception:
+            pass
+        writes.append(w)
+    return writes
+
+def split_frames(first, last, chunk_size=DEFAULT_CHUNK_SIZE):
+    """[(first, last), ...] covering first..last inclusive in chunk_size steps."""
+    first, last = int(first), int(last)
+    if last < first:
+        return []
+    size = max(1, int(chunk_size))
+    return [(a, min(a + size - 1, last)) for a in range(first, last + 1, size)]
+
+def build_chunks(write_ranges, chunk_size=DEFAULT_CHUNK_SIZE, whole=()):
+    """
+    write_ranges: iterable of (write_name, first, last).
+    Returns a flat list of chunk dicts: {"write", "first", "last", "attempts", "error"}.
+    Writes named in `whole` (single-file formats) get one chunk over their full range,
+    since parallel processes cannot write parts of the same movie file.
+    Chunks are interleaved across Writes so every Write makes progress early.
+    """
+    per_write = [
+        [{"write": name, "first": a, "last": b, "attempts": 0, "error": None}
+         for a, b in (split_frames(first, last, max(1, int(last) - int(first) + 1))
+                      if name in whole else split_frames(first, last, chunk_size))]
+        for name, first, last in write_ranges
+    ]
+    chunks = []
+    for i in range(max((len(c) for c in per_write), default=0)):
+        for c in per_write:
+            if i < len(c):
+                chunks.append(c[i])
+    return chunks
+
+def _root_range():
+    root = nuke.root()
+    return int(root["first_frame"].value()), int(root["last_frame"].value())
+
+def is_single_file(write):
+    """True if the Write renders one file for its whole range (mov, mp4, ...)."""
+    try:
+        if write["file_type"].value() in SINGLE_FILE_TYPES:
+            return True
+    except Exception:
+        pass
+    try:
+        return os.path.splitext(write["file"].value())[1].lower().lstrip(".") in SINGLE_FILE_TYPES
+    except Exception:
+        return False
+
+@traced()
+def chunks_from_script(chunk_size=DEFAULT_CHUNK_SIZE):
+    """Chunks for every Gloss Write, using each Write's own range if limited, else the Root range."""
+    first, last = _root_range()
+    ranges, whole = [], set()
+    for w in gloss_write_nodes():
+        if is_single_file(w):
+            whole.add(w.name())
+        a, b = first, last
+        try:
+            if w["use_limit"].value():
+                a, b = int(w["first"].value()), int(w["last"].value())
+        except Exception:
+            pass
+        ranges.append((w.name(), a, b))
+    return build_chunks(ranges, chunk_size, whole)
+
+
+# ===============================
+# Command template
+# ===============================
+def default_command():
+    """Command template (list of args) with {script}, {write}, {first}, {last} placeholders."""
+    env = os.environ.get(CMD_ENV_VAR)
+    if env:
+        return shlex.split(env)
+    exe = getattr(nuke, "EXE_PATH", None) if nuke else None
+    return [exe or "Nuke", "-F", "{first}-{last}", "-X", "{write}", "{script}"]
+
+def _format_cmd(template, script_path, chunk):
+    if isinstance(template, str):
+        template = shlex.split(template)
+    values = {"script": script_path, "write": chunk["write"],
+              "first": chunk["first"], "last": chunk["last"]}
+    return [str(arg).format(**values) for arg in template]
+
+
+# ===============================
+# Running
+# ===============================
+def default_workers():
+    return max(1, os.cpu_count() or 1)
+
+def _child_env():
+    # Chunks cover part of the range; the afterRender check runs once at the end instead.
+    env = dict(os.environ)
+    env["GLOSS_SKIP_RENDER_CHECK"] = "1"
+    return env
+
+def _stop(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+def _run_chunk(cmd, timeout, cancel_event=None):
+    """Run one render process; terminate it on timeout or when `cancel_event` is set."""
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, env=_child_env())
+    except Exception as e:
+        return False, str(e)
+    deadline = time.time() + timeout if timeout else None
+    while True:
+        try:
+            out, _ = proc.communicate(timeout=0.25)
+            break
+        except subprocess.TimeoutExpired:
+            if cancel_event is not None and cancel_event.is_set():
+                _stop(proc)
+                proc.communicate()
+                return False, "canceled"
+            if deadline is not None and time.time() >= deadline:
+                _stop(proc)
+                proc.communicate()
+                return False, f"timed out after {timeout}s"
+    if proc.returncode != 0:
+        tail = (out or "").strip().splitlines()[-5:]
+        return False, f"exit {proc.returncode}: " + " | ".join(tail)
+    return True, None
+
+@traced()
+def run_queue(script_path, chunks, command=None, workers=None, retries=DEFAULT_RETRIES,
+              timeout=None, on_progress=None, cancel_event=None):
+    """
+    Render `chunks` (see build_chunks) of `script_path` on `workers` parallel processes.
+    Each chunk is retried up to `retries` extra times. `on_progress(done, total, chunk)`
+    is called after every finished chunk (from a worker thread).
+    Returns {"done": [...], "failed": [...], "elapsed": seconds}.
+    """
+    template = command or default_command()
+    workers = max(1, int(workers or default_workers()))
+    total = len(chunks)
+    done, failed = [], []
+    lock = threading.Lock()
+    t0 = time.time()
+
+    def _work(chunk):
+        cmd = _format_cmd(template, script_path, chunk)
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                chunk["error"] = "canceled"
+                return chunk, False
+            chunk["attempts"] += 1
+            ok, err = _run_chunk(cmd, timeout, cancel_event)
+            if ok:
+                chunk["error"] = None
+                return chunk, True
+            chunk["error"] = err
+            if chunk["attempts"] > retries or err == "canceled":
+                return chunk, False
+            _log(f"Retrying {chunk['write']} {chunk['first']}-{chunk['last']} ({err})")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_work, c) for c in chunks]
+        for fut in as_completed(futures):
+            chunk, ok = fut.result()
+            with lock:
+                (done if ok else failed).append(chunk)
+                count = len(done) + len(failed)
+            if on_progress:
+                try:
+                    on_progress(count, total, chunk)
+                except Exception:
+                    pass
+
+    sp = current_span()
+    sp.add_items(total)
+    sp.set(workers=workers, failed=len(failed))
+    if failed:
+        sp.fail(f"{len(failed)} chunk(s) failed")
+    return {"done": done, "failed": failed, "elapsed": time.time() - t0}
+
+def summarize(result):
+    frames = sum(c["last"] - c["first"] + 1 for c in result["done"])
+    lines = [f"Rendered {len(result['done'])} chunk(s), {frames} frame(s) in {result['elapsed']:.1f}s."]
+    if result["failed"]:
+        lines.append(f"{len(result['failed'])} chunk(s) failed:")
+        for c in result["failed"][:10]:
+            lines.append(f"  {c['write']} {c['first']}-{c['last']}: {c['error']}")
+    return "\n".join(lines)
+
+
+# ===============================
+# Nuke entry point
+# ===============================
+_active_queue = None  # (thread, cancel_event) while a queue is running
+
+def executed_ranges(chunks):
+    """{write: (first, last)} spanned by the chunks that were run."""
+    out = {}
+    for c in chunks:
+        a, b = out.get(c["write"], (c["first"], c["last"]))
+        out[c["write"]] = (min(a, c["first"]), max(b, c["last"]))
+    return out
+
+def _finish(ranges, msg):
+    """Main thread: completeness check of every Write over the range it rendered, then report."""
+    try:
+        import write_nodes.render_check as rc
+        for name, (first, last) in ranges.items():
+            w = nuke.toNode(name)
+            if w is not None:
+                rc.check_write(w, first, last)
+    except Exception as e:
+        _log(f"Render check skipped: {e}")
+    nuke.message(msg)
+
+@traced()
+def render_gloss_writes():
+    """Menu entry: save, then render every Gloss Write on a local process pool in the background."""
+    global _active_queue
+    if _active_queue and _active_queue[0].is_alive():
+        if nuke.ask("A local render queue is already running.\n\nCancel it?"):
+            _active_queue[1].set()
+        return
+
+    script_path = nuke.root().name()
+    if not script_path or script_path == "Root":
+        nuke.message("Save the script before rendering.")
+        return
+
+    writes = gloss_write_nodes()
+    if not writes:
+        nuke.message("No Gloss Write nodes found.")
+        return
+
+    p = nuke.Panel("Local Render Queue")
+    p.addSingleLineInput("Chunk size", str(DEFAULT_CHUNK_SIZE))
+    p.addSingleLineInput("Processes", str(default_workers()))
+    p.addSingleLineInput("Retries", str(DEFAULT_RETRIES))
+    if not p.show():
+        return
+    try:
+        chunk_size = int(p.value("Chunk size"))
+        workers = int(p.value("Processes"))
+        retries = int(p.value("Retries"))
+    except Exception:
+        nuke.message("Chunk size, processes and retries must be whole numbers.")
+        return
+
+    nuke.scriptSave()
+    chunks = chunks_from_script(chunk_size)
+    names = ", ".join(w.name() for w in writes)
+    _log(f"Local render queue: {len(chunks)} chunk(s) for {names} on {workers} process(es).")
+
+    cancel = threading.Event()
+
+    def _bg():
+        task = nuke.ProgressTask("Gloss Local Render")
+
+        def _progress(count, total, chunk):
+            task.setProgress(int(100 * count / max(total, 1)))
+            task.setMessage(f"{count}/{total}  {chunk['write']} {chunk['first']}-{chunk['last']}")
+            if task.isCancelled():
+                cancel.set()
+
+        result = run_queue(script_path, chunks, workers=workers, retries=retries,
+                           on_progress=_progress, cancel_event=cancel)
+        del task
+        msg = summarize(result)
+        _log(msg)
+        nuke.executeInMainThread(_finish, args=(executed_ranges(chunks), msg))
+
+    t = threading.Thread(target=_bg, name="GlossRenderQueue", daemon=True)
+    _active_queue = (t, cancel)
+    t.start()
+
+
+# ===============================
+# Headless entry point
+# ===============================
+def main(argv=None):
+    """
+    python render_queue.py SCRIPT.nk WRITE:FIRST-LAST [WRITE:FIRST-LAST ...]
+        [--chunk N] [--workers N] [--retries N] [--whole WRITE ...]
+    """
+    import argparse
+    ap = argparse.ArgumentParser(description="Render Gloss Writes on a local process pool.")
+    ap.add_argument("script")
+    ap.add_argument("writes", nargs="+", help="WRITE:FIRST-LAST")
+    ap.add_argument("--chunk", type=int, default=DEFAULT_CHUNK_SIZE)
+    ap.add_argument("--workers", type=int, default=default_workers())
+    ap.add_argument("--retries", type=int, default=DEFAULT_RETRIES)
+    ap.add_argument("--whole", nargs="*", default=[], metavar="WRITE",
+                    help="single-file Writes (mov, mp4) to render as one chunk")
+    args = ap.parse_args(argv)
+
+    ranges = []
+    for spec in args.writes:
+        name, _, rng = spec.partition(":")
+        a, _, b = rng.partition("-")
+        ranges.append((name, int(a), int(b or a)))
+
+    chunks = build_chunks(ranges, args.chunk, set(args.whole))
+    result = run_queue(args.script, chunks, workers=args.workers, retries=args.retries,
+                       on_progress=lambda n, t, c: print(f"[{n}/{t}] {c['write']} {c['first']}-{c['last']}"
+                                                         + ("" if c["error"] is None else f" FAILED: {c['error']}")))
+    print(summarize(result))
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 # write_nodes/util_actions.py
 import os, subprocess, platform, nuke
 
+from gloss_utils.nuke_helpers import bulk_operation, traced
+
 def _selected_write_nodes():
     nodes = [n for n in (nuke.selectedNodes() or []) if n.Class() == "Write"]
     if not nodes:
@@ -12,22 +14,26 @@ def _selected_write_nodes():
             pass
     return nodes
 
+@traced()
 def create_read_from_selected_write():
     nodes = _selected_write_nodes()
     if not nodes:
         nuke.message("Select a Write node.")
         return
     count = 0
-    for w in nodes:
-        try:
-            path = w["file"].evaluate()
-            nuke.createNode("Read", f"file {{{path}}}", inpanel=False)
-            count += 1
-        except Exception as e:
-            nuke.message(f"Failed on {w.name()}: {e}")
+    # One undo step; each Read goes straight below its Write instead of autoplacing
+    with bulk_operation("Read from Write") as bulk:
+        for w in nodes:
+            try:
+                path = w["file"].evaluate()
+                bulk.select(bulk.create("Read", file=path, xpos=w.xpos(), ypos=w.ypos() + 120))
+                count += 1
+            except Exception as e:
+                nuke.message(f"Failed on {w.name()}: {e}")
     if count == 0:
         nuke.message("No Read created.")
 
+@traced()
 def copy_selected_write_path():
     nodes = _selected_write_nodes()
     if not nodes:
@@ -55,6 +61,7 @@ def copy_selected_write_path():
     except Exception as e:
         nuke.message(f"Failed to copy path:\n{e}")
 
+@traced()
 def open_selected_write_directory():
     nodes = _selected_write_nodes()
     if not nodes:
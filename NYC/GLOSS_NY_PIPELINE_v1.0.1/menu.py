@@ -3,8 +3,11 @@
 
 import os
 import sys
+import time
 import nuke
 
+_MENU_T0 = time.perf_counter()
+
 # --- Paths ---
 BASE_DIR    = os.path.dirname(__file__)
 SCRIPTS_DIR = os.path.join(BASE_DIR, "Python_Scripts")
@@ -40,25 +43,58 @@ def safe_import(dotted_name: str, label: str = None):
         nuke.tprint(f"[GLOSS NYC] ❌ Failed to import {label}: {e}")
         return None
 
+# --- Lazy module proxy ---
+class LazyModule(object):
+    """
+    Stands in for a module until something reads an attribute from it; then it
+    imports through safe_import (same ✅/❌ messages) once and delegates.
+    A failed import behaves like the old `None` module: every getattr(..., None) is None.
+    """
+
+    def __init__(self, dotted_name: str, label: str = None):
+        self._dotted = dotted_name
+        self._label = label or dotted_name
+        self._module = None
+        self._tried = False
+
+    def _load(self):
+        if not self._tried:
+            self._tried = True
+            t0 = time.perf_counter()
+            self._module = safe_import(self._dotted, self._label)
+            if self._module is not None:
+                nuke.tprint(f"[GLOSS NYC] ⏱ {self._label} loaded on first use in {(time.perf_counter() - t0) * 1000:.0f} ms")
+        return self._module
+
+    def __getattr__(self, name):
+        module = self._load()
+        if module is None:
+            raise AttributeError(name)
+        return getattr(module, name)
+
 # --- Import modules (OK if some are not ready yet) ---
+# Only what has to run at startup is imported eagerly; everything else loads on first use.
 ui_read_panel  = safe_import("read_node.ui_read_panel", "Read UI Panel")
-ops            = safe_import("read_node.ops_read_tools", "Read Ops")
-seq_utils      = safe_import("gloss_utils.sequences", "Sequence Utils")
-paths_utils    = safe_import("gloss_utils.paths_nyc", "NYC Paths Utils")
+cons           = safe_import("gloss_utils.constants", "Constants")
 
-w_dn           = safe_import("write_nodes.dn_output", "Write: DeNoise")
-w_precomp      = safe_import("write_nodes.precomp_output", "Write: PreComp")
-w_final        = safe_import("write_nodes.final_output", "Write: Final for Approval")
+ops            = LazyModule("read_node.ops_read_tools", "Read Ops")
+seq_utils      = LazyModule("gloss_utils.sequences", "Sequence Utils")
+paths_utils    = LazyModule("gloss_utils.paths_nyc", "NYC Paths Utils")
 
-rv_integration = safe_import("integrations.rv", "RV Integration")
+w_dn           = LazyModule("write_nodes.dn_output", "Write: DeNoise")
+w_precomp      = LazyModule("write_nodes.precomp_output", "Write: PreComp")
+w_final        = LazyModule("write_nodes.final_output", "Write: Final for Approval")
+render_queue   = LazyModule("write_nodes.render_queue", "Write: Local Render Queue")
+proxy_tool     = LazyModule("proxies.make_proxies", "Proxy Generator")
 
-lineup_app     = safe_import("apps.lineup_browser", "Lineup Browser")
-finder_panel   = safe_import("panels.find_shot_panel", "Shot Finder Panel")
-retouch_tool   = safe_import("tools.import_retouched_shots", "Import RETOUCH Shots")
+rv_integration = LazyModule("integrations.rv", "RV Integration")
 
-write_utils    = safe_import("write_nodes.util_actions", "Write Utilities")
+lineup_app     = LazyModule("apps.lineup_browser", "Lineup Browser")
+finder_panel   = LazyModule("panels.find_shot_panel", "Shot Finder Panel")
+retouch_tool   = LazyModule("tools.import_retouched_shots", "Import RETOUCH Shots")
 
-cons           = safe_import("gloss_utils.constants", "Constants")
+write_utils    = LazyModule("write_nodes.util_actions", "Write Utilities")
+monday_queue   = LazyModule("integrations.monday_queue", "Monday Update Queue")
 
 # --- Color helpers and fallbacks ---
 def _color_cmd(hex_value):
@@ -101,63 +137,65 @@ def _add(menu, label, func):
             nuke.message(f"'{label}' is not available yet.")
         menu.addCommand(label, _warn)
 
+# Lazy variant: resolves module.func_name when the command is first invoked
+def _lazy(menu, label, module, func_name, *args):
+    def _runner():
+        fn = getattr(module, func_name, None)
+        if callable(fn):
+            fn(*args)
+        else:
+            nuke.message(f"'{label}' is not available yet.")
+    menu.addCommand(label, _runner)
+
 # Lineup
 lineup_menu = NY_MENU.addMenu("Lineup")
-_add(lineup_menu, "Lineup Browser", getattr(lineup_app, "launch_lineup_browser", None))
+_lazy(lineup_menu, "Lineup Browser", lineup_app, "launch_lineup_browser")
 # Find Shot in Lineup
-if finder_panel:
-    panel_class = getattr(finder_panel, "ShotFinderPanel", None)
-    if callable(panel_class):
-        lineup_menu.addCommand("Find Shot in Lineup", lambda: panel_class().showModal())
+_lazy(lineup_menu, "Find Shot in Lineup", finder_panel, "launch")
 
 NY_MENU.addSeparator()
 
 # Ingest
 ingest_menu = NY_MENU.addMenu("Ingest")
-_add(ingest_menu, "Import RETOUCH Shots", getattr(retouch_tool, "import_retouched_shots", None))
+_lazy(ingest_menu, "Import RETOUCH Shots", retouch_tool, "import_retouched_shots")
 
 # === QC Check ===
 qc_menu = NY_MENU.addMenu("QC Check")
-_add(qc_menu, "QC Compare", getattr(ops, "qc_compare_with_original", None))
-_add(qc_menu, "Toggle Wipe", getattr(ops, "toggle_wipe_viewer", None))
+_lazy(qc_menu, "QC Compare", ops, "qc_compare_with_original")
+_lazy(qc_menu, "Toggle Wipe", ops, "toggle_wipe_viewer")
 
 NY_MENU.addSeparator()
 
 # === Label Colors ===
 colors_menu = NY_MENU.addMenu("Label Colors")   # make the submenu
 
-# For Chennai
-colors_menu.addCommand(
-    "For Chennai",
-    _mon(
-        "import importlib, ny_monday_actions_min as mon, __main__ as _M; "
-        "fn=getattr(getattr(_M,'ops',None),'set_node_color',None); "
-        f"(fn({COLOR_CHENNAI}) if callable(fn) else None); "
-        "importlib.reload(mon); mon.to_chennai(create_if_missing=True)"
-    )
-)
+# Colors apply instantly; the Monday status change goes through the batched update queue.
+# Reads without a stored Monday link still use the synchronous action (it can create the item).
+def _legacy_monday(fn_name, **kwargs):
+    if MONDAY_DIR not in sys.path:
+        sys.path.append(MONDAY_DIR)
+    try:
+        import ny_monday_actions_min as mon
+        getattr(mon, fn_name)(**kwargs)
+    except Exception as e:
+        nuke.tprint(f"[GLOSS NYC] ⚠️ Monday {fn_name} failed: {e}")
 
-# For NYC
-colors_menu.addCommand(
-    "For NYC",
-    _mon(
-        "import importlib, ny_monday_actions_min as mon, __main__ as _M; "
-        "fn=getattr(getattr(_M,'ops',None),'set_node_color',None); "
-        f"(fn({COLOR_NYC}) if callable(fn) else None); "
-        "importlib.reload(mon); mon.to_nyc(create_if_missing=True)"
-    )
-)
+def _status_tag_cmd(status_key, color, legacy_fn):
+    def _runner():
+        fallback = lambda: _legacy_monday(legacy_fn, create_if_missing=True)
+        tag = getattr(monday_queue, "tag_selected", None)
+        if callable(tag):
+            tag(status_key, color, fallback)
+            return
+        fn = getattr(ops, "set_node_color", None)
+        if callable(fn):
+            fn(color)
+        fallback()
+    return _runner
 
-# Reset
-colors_menu.addCommand(
-    "Reset Node Color",
-    _mon(
-        "import importlib, ny_monday_actions_min as mon, __main__ as _M; "
-        "fn=getattr(getattr(_M,'ops',None),'reset_node_color',None); "
-        "(fn() if callable(fn) else None); "
-        "importlib.reload(mon); mon.reset_main_status(create_if_missing=True)"
-    )
-)
+colors_menu.addCommand("For Chennai",      _status_tag_cmd("chennai", COLOR_CHENNAI, "to_chennai"))
+colors_menu.addCommand("For NYC",          _status_tag_cmd("nyc",     COLOR_NYC,     "to_nyc"))
+colors_menu.addCommand("Reset Node Color", _status_tag_cmd("reset",   0,             "reset_main_status"))
 
 # -------- Monday submenu (must CREATE it before adding commands) --------
 mon_menu = NY_MENU.addMenu("Monday")
@@ -188,17 +226,17 @@ NY_MENU.addSeparator()
 
 # === File Controls ===
 fc_menu = NY_MENU.addMenu("File Controls")
-_add(fc_menu, "Copy File Path",     getattr(ops, "copy_file_path", None))
-_add(fc_menu, "Go to Directory",    getattr(ops, "go_to_directory", None))
-_add(fc_menu, "Copy Shot Filename", getattr(ops, "copy_shot_filename", None))
+_lazy(fc_menu, "Copy File Path",     ops, "copy_file_path")
+_lazy(fc_menu, "Go to Directory",    ops, "go_to_directory")
+_lazy(fc_menu, "Copy Shot Filename", ops, "copy_shot_filename")
 
 NY_MENU.addSeparator()
 
 # === Approval Process ===
 appr_menu = NY_MENU.addMenu("Approval")
-_add(appr_menu, "Send to Approved",         getattr(ops, "copy_to_approved", None))
-_add(appr_menu, "Open Approved Directory",  getattr(ops, "go_to_approved_directory", None))
-_add(appr_menu, "Import Approved Version",  getattr(ops, "import_approved_version", None))
+_lazy(appr_menu, "Send to Approved",         ops, "copy_to_approved")
+_lazy(appr_menu, "Open Approved Directory",  ops, "go_to_approved_directory")
+_lazy(appr_menu, "Import Approved Version",  ops, "import_approved_version")
 
 NY_MENU.addSeparator()
 
@@ -220,21 +258,27 @@ NY_MENU.addSeparator()
 
 # === Write Nodes ===
 wn_menu = NY_MENU.addMenu("Write Nodes")
-_add(wn_menu, "DeNoise",              getattr(w_dn, "run", None))
-_add(wn_menu, "PreComp",              getattr(w_precomp, "run", None))
-_add(wn_menu, "Final for Approved",   getattr(w_final, "run", None))
+_lazy(wn_menu, "DeNoise",              w_dn, "run")
+_lazy(wn_menu, "PreComp",              w_precomp, "run")
+_lazy(wn_menu, "Final for Approved",   w_final, "run")
+
+wn_menu.addSeparator()
+_lazy(wn_menu, "Render Gloss Writes (Local Queue)", render_queue, "render_gloss_writes")
+
+_lazy(wn_menu, "Make Proxies for Selected (Half)",    proxy_tool, "make_proxies_for_selected", "half")
+_lazy(wn_menu, "Make Proxies for Selected (Quarter)", proxy_tool, "make_proxies_for_selected", "quarter")
 
 # handy actions that work on the selected Write
 wn_menu.addSeparator()
-_add(wn_menu, "Create Read from Selected Write", getattr(write_utils, "create_read_from_selected_write", None))
-_add(wn_menu, "Copy Selected Write Path",        getattr(write_utils, "copy_selected_write_path", None))
-_add(wn_menu, "Open Selected Write Directory",   getattr(write_utils, "open_selected_write_directory", None))
+_lazy(wn_menu, "Create Read from Selected Write", write_utils, "create_read_from_selected_write")
+_lazy(wn_menu, "Copy Selected Write Path",        write_utils, "copy_selected_write_path")
+_lazy(wn_menu, "Open Selected Write Directory",   write_utils, "open_selected_write_directory")
 
 NY_MENU.addSeparator()
 
 # === Integrations ===
 int_menu = NY_MENU.addMenu("Integrations")
-_add(int_menu, "Open in RV", getattr(rv_integration, "open_in_rv", None))
+_lazy(int_menu, "Open in RV", rv_integration, "open_in_rv")
 
 NY_MENU.addSeparator()
 
@@ -250,7 +294,7 @@ if ui_read_panel and hasattr(ui_read_panel, "install"):
 # Also provide a manual installer for the selected node
 _add(NY_MENU, "Read UI/Install on Selected Read", getattr(ui_read_panel, "add_buttons_to_read_node", None))
 
-nuke.tprint("[GLOSS NYC] Menu loaded.")
+nuke.tprint(f"[GLOSS NYC] Menu loaded in {(time.perf_counter() - _MENU_T0) * 1000:.0f} ms.")
 
 
 
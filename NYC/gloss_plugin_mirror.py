@@ -0,0 +1,193 @@
+# gloss_plugin_mirror.py
+# Local mirror of SAN-hosted Nuke plugin folders.
+#
+# init.py calls mirrored_plugin_path(SAN_PATH):
+#   - returns the local mirror when it exists, is complete and was synced recently,
+#     otherwise the SAN path (so a fresh or long-offline workstation still works)
+#   - starts a background refresh that compares the SAN against the mirror's manifest
+#     (relative path -> size, mtime) and only copies what changed
+#
+# Startup itself only reads the local manifest; it never touches the SAN.
+# Files are copied to a temp name and os.replace()d, so a session reading the mirror
+# never sees a half-written gizmo. A lock file keeps two sessions from syncing at once.
+#
+# GLOSS_PLUGIN_MIRROR=0 disables mirroring (e.g. on render nodes): the SAN path is used.
+#
+# Headless:
+#   python gloss_plugin_mirror.py /Volumes/san-04/GlossUsers/NukeShared
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import threading
+
+MIRROR_ROOT    = os.path.expanduser("~/.nuke/gloss_cache/plugin_mirror")
+MANIFEST_NAME  = ".gloss_mirror.json"
+LOCK_NAME      = ".gloss_mirror.lock"
+MAX_MIRROR_AGE = 3 * 24 * 3600   # older mirrors are considered stale -> use the SAN
+LOCK_TIMEOUT   = 3600            # a lock older than this is from a crashed session
+SKIP_NAMES     = {".DS_Store", "__pycache__", ".git", MANIFEST_NAME, LOCK_NAME}
+
+_refreshing = set()
+
+
+def _log(msg):
+    try:
+        import nuke
+        nuke.tprint(f"[GLOSS MIRROR] {msg}")
+    except Exception:
+        print(f"[GLOSS MIRROR] {msg}")
+
+def enabled():
+    return (os.environ.get("GLOSS_PLUGIN_MIRROR") or "1").strip().lower() not in ("0", "false", "no", "off")
+
+def mirror_dir(source):
+    safe = re.sub(r"[^\w.-]+", "_", os.path.normpath(source).strip("/\\"))
+    return os.path.join(MIRROR_ROOT, safe)
+
+
+# ===============================
+# Manifest
+# ===============================
+def load_manifest(mirror):
+    try:
+        with open(os.path.join(mirror, MANIFEST_NAME)) as fh:
+            return json.load(fh)
+    except Exception:
+        return None
+
+def _save_manifest(mirror, manifest):
+    path = os.path.join(mirror, MANIFEST_NAME)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as fh:
+        json.dump(manifest, fh)
+    os.replace(tmp, path)
+
+def mirror_is_usable(source, max_age=MAX_MIRROR_AGE):
+    manifest = load_manifest(mirror_dir(source))
+    return bool(manifest and manifest.get("complete") and manifest.get("source") == source
+                and time.time() - manifest.get("synced", 0) <= max_age)
+
+
+# ===============================
+# Sync
+# ===============================
+def _walk(root):
+    """{relpath: (size, mtime)} for every file under root (os.scandir, no stat per dir entry)."""
+    out, stack = {}, [""]
+    while stack:
+        rel = stack.pop()
+        with os.scandir(os.path.join(root, rel)) as it:
+            for e in it:
+                if e.name in SKIP_NAMES:
+                    continue
+                r = f"{rel}/{e.name}" if rel else e.name
+                if e.is_dir(follow_symlinks=True):
+                    stack.append(r)
+                elif e.is_file(follow_symlinks=True):
+                    st = e.stat()
+                    out[r] = (st.st_size, st.st_mtime)
+    return out
+
+def _acquire_lock(mirror):
+    path = os.path.join(mirror, LOCK_NAME)
+    try:
+        if time.time() - os.stat(path).st_mtime > LOCK_TIMEOUT:
+            os.remove(path)
+    except OSError:
+        pass
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        return path
+    except OSError:
+        return None
+
+def sync(source):
+    """
+    Bring the mirror in line with `source`. Returns {"copied", "removed", "unchanged", "elapsed"}
+    or None if the SAN is unreachable or another session holds the lock.
+    """
+    if not os.path.isdir(source):
+        return None
+    t0 = time.time()
+    mirror = mirror_dir(source)
+    os.makedirs(mirror, exist_ok=True)
+    lock = _acquire_lock(mirror)
+    if not lock:
+        return None
+    try:
+        old = (load_manifest(mirror) or {}).get("files", {})
+        current = _walk(source)
+
+        copied = 0
+        for rel, (size, mtime) in current.items():
+            prev = old.get(rel)
+            dst = os.path.join(mirror, rel)
+            if prev and prev[0] == size and prev[1] == mtime and os.path.exists(dst):
+                continue
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            tmp = f"{dst}.gloss_tmp"
+            shutil.copy2(os.path.join(source, rel), tmp)
+            os.replace(tmp, dst)
+            copied += 1
+
+        removed = 0
+        for rel in set(old) - set(current):
+            try:
+                os.remove(os.path.join(mirror, rel))
+                removed += 1
+            except OSError:
+                pass
+
+        _save_manifest(mirror, {
+            "source": source, "synced": time.time(), "complete": True,
+            "files": {rel: list(v) for rel, v in current.items()},
+        })
+        return {"copied": copied, "removed": removed, "unchanged": len(current) - copied,
+                "elapsed": time.time() - t0}
+    finally:
+        try:
+            os.remove(lock)
+        except OSError:
+            pass
+
+def refresh_in_background(source):
+    """Sync once per session on a daemon thread."""
+    if source in _refreshing:
+        return
+    _refreshing.add(source)
+
+    def _bg():
+        try:
+            stats = sync(source)
+            if stats and (stats["copied"] or stats["removed"]):
+                _log(f"{source}: {stats['copied']} updated, {stats['removed']} removed "
+                     f"in {stats['elapsed']:.1f}s (used from next launch)")
+        except Exception as e:
+            _log(f"{source}: refresh failed: {e}")
+
+    threading.Thread(target=_bg, name="GlossPluginMirror", daemon=True).start()
+
+
+# ===============================
+# init.py entry point
+# ===============================
+def mirrored_plugin_path(source, max_age=MAX_MIRROR_AGE, refresh=True):
+    """Path to hand to nuke.pluginAddPath for a SAN plugin folder."""
+    if not enabled():
+        return source
+    usable = mirror_is_usable(source, max_age)
+    if refresh:
+        refresh_in_background(source)
+    return mirror_dir(source) if usable else source
+
+
+if __name__ == "__main__":
+    for src in sys.argv[1:]:
+        stats = sync(src)
+        print(f"{src}: {stats if stats else 'skipped (unreachable or locked)'}")
@@ -0,0 +1,191 @@
+# gloss_startup_profile.py
+# Opt-in Nuke startup profiler (init.py / menu.py).
+#
+# Enable per workstation with an environment variable before launching Nuke:
+#   GLOSS_STARTUP_PROFILE=1         timers only
+#   GLOSS_STARTUP_PROFILE=cprofile  timers + cProfile (.prof file + top functions in the report)
+#
+# What gets timed:
+#   - every nuke.pluginAddPath() call (wrapped while profiling is on)
+#   - every first-time import (inclusive time; nested imports are indented)
+#   - sections marked in init.py / menu.py with mark("label")
+#
+# finish() (end of menu.py) writes a ranked report to ~/.nuke/gloss_logs/startup/
+# and appends one JSON line per launch to startup_history.jsonl, so regressions can
+# be tracked per workstation. With the variable unset every call is a no-op.
+#
+# Terminal and render sessions (nuke -t, nuke -x, the local render queue's child
+# processes) never run menu.py, so begin() does nothing there: the import hook and
+# cProfile would otherwise stay active for the whole render.
+
+import os
+import sys
+import json
+import time
+import socket
+import builtins
+
+ENV_VAR    = "GLOSS_STARTUP_PROFILE"
+REPORT_DIR = os.path.expanduser("~/.nuke/gloss_logs/startup")
+TOP_N      = 25
+
+_mode = (os.environ.get(ENV_VAR) or "").strip().lower()
+enabled = _mode not in ("", "0", "false", "no", "off")
+
+_t0 = None
+_last_mark = None
+_records = []       # (kind, label, seconds, depth)
+_profiler = None
+_orig_import = None
+_import_depth = 0
+_finished = False
+
+
+def _now():
+    return time.perf_counter()
+
+
+# ===============================
+# Hooks
+# ===============================
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    global _import_depth
+    if level or name in sys.modules:
+        return _orig_import(name, globals, locals, fromlist, level)
+    start = _now()
+    _import_depth += 1
+    try:
+        return _orig_import(name, globals, locals, fromlist, level)
+    finally:
+        _import_depth -= 1
+        _records.append(("import", name, _now() - start, _import_depth))
+
+def _patch_nuke():
+    try:
+        import nuke
+    except Exception:
+        return
+    orig = nuke.pluginAddPath
+
+    def pluginAddPath(path, *args, **kwargs):
+        start = _now()
+        try:
+            return orig(path, *args, **kwargs)
+        finally:
+            _records.append(("pluginAddPath", str(path), _now() - start, 0))
+
+    pluginAddPath._gloss_orig = orig
+    nuke.pluginAddPath = pluginAddPath
+
+def _unpatch_nuke():
+    try:
+        import nuke
+        orig = getattr(nuke.pluginAddPath, "_gloss_orig", None)
+        if orig:
+            nuke.pluginAddPath = orig
+    except Exception:
+        pass
+
+
+# ===============================
+# Public API
+# ===============================
+def _gui_session():
+    try:
+        import nuke
+        return bool(nuke.env["gui"])
+    except Exception:
+        return False
+
+def begin():
+    """Start profiling (call at the very top of init.py). No-op unless enabled in a GUI session."""
+    global _t0, _last_mark, _orig_import, _profiler
+    if not enabled or _t0 is not None or not _gui_session():
+        return
+    _t0 = _last_mark = _now()
+    _orig_import = builtins.__import__
+    builtins.__import__ = _timed_import
+    _patch_nuke()
+    if _mode == "cprofile":
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+def mark(label):
+    """Attribute the time since the previous mark to `label`."""
+    global _last_mark
+    if _t0 is None or _finished:
+        return
+    now = _now()
+    _records.append(("section", label, now - _last_mark, 0))
+    _last_mark = now
+
+def _log(msg):
+    try:
+        import nuke
+        nuke.tprint(msg)
+    except Exception:
+        print(msg)
+
+def finish():
+    """Stop profiling and write the report (call at the very end of menu.py)."""
+    global _finished
+    if _t0 is None or _finished:
+        return None
+    total = _now() - _t0
+    _finished = True
+    if _orig_import is not None:
+        builtins.__import__ = _orig_import
+    _unpatch_nuke()
+
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    host = socket.gethostname().split(".")[0]
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    base = os.path.join(REPORT_DIR, f"startup_{host}_{stamp}")
+
+    prof_lines = []
+    if _profiler is not None:
+        import io, pstats
+        _profiler.disable()
+        _profiler.dump_stats(base + ".prof")
+        buf = io.StringIO()
+        pstats.Stats(_profiler, stream=buf).sort_stats("cumulative").print_stats(TOP_N)
+        prof_lines = ["", f"cProfile (top {TOP_N} by cumulative time, full data in {base}.prof)", buf.getvalue()]
+
+    sections = [r for r in _records if r[0] == "section"]
+    paths    = [r for r in _records if r[0] == "pluginAddPath"]
+    imports  = [r for r in _records if r[0] == "import"]
+    top_imports = [r for r in imports if r[3] == 0]
+
+    def _ranked(title, rows, limit=TOP_N):
+        out = ["", title]
+        for kind, label, secs, depth in sorted(rows, key=lambda r: -r[2])[:limit]:
+            out.append(f"  {secs * 1000:9.1f} ms  {'  ' * depth}{label}")
+        return out
+
+    lines = [
+        f"Nuke startup profile — {host} — {time.strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Python {sys.version.split()[0]}",
+        f"Total (init.py start -> menu.py end): {total * 1000:.1f} ms",
+    ]
+    lines += _ranked("Sections", sections)
+    lines += _ranked("pluginAddPath", paths)
+    lines += _ranked("Top-level imports (inclusive)", top_imports)
+    lines += _ranked("All imports (inclusive, nested indented)", imports, limit=TOP_N * 2)
+    lines += prof_lines
+
+    with open(base + ".txt", "w") as fh:
+        fh.write("\n".join(lines) + "\n")
+    with open(os.path.join(REPORT_DIR, "startup_history.jsonl"), "a") as fh:
+        fh.write(json.dumps({
+            "host": host, "time": time.time(), "total_ms": round(total * 1000, 1),
+            "sections": {label: round(secs * 1000, 1) for _, label, secs, _ in sections},
+            "plugin_paths_ms": round(sum(r[2] for r in paths) * 1000, 1),
+            "slowest_imports": [[label, round(secs * 1000, 1)]
+                                for _, label, secs, _ in sorted(top_imports, key=lambda r: -r[2])[:10]],
+        }) + "\n")
+
+    _log(f"[GLOSS STARTUP] {total * 1000:.0f} ms total — report: {base}.txt")
+    for line in lines[3:3 + 8]:
+        _log(f"[GLOSS STARTUP] {line}")
+    return base + ".txt"
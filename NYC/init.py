@@ -8,6 +8,17 @@ import nuke
 import platform
 import nukescripts
 
+# Opt-in startup profiler (GLOSS_STARTUP_PROFILE=1 or =cprofile); a no-op otherwise
+try:
+    import gloss_startup_profile as startup_profile
+    startup_profile.begin()
+except Exception:
+    startup_profile = None
+
+def _mark(label):
+    if startup_profile:
+        startup_profile.mark(label)
+
 
 
 
@@ -21,6 +32,7 @@ elif nuke.NUKE_VERSION_MAJOR < 16:
 else:
     # PySide6 for Nuke 16+
     from PySide6.QtWidgets import QPushButton
+_mark("init: PySide")
 
 
 
@@ -81,7 +93,15 @@ nuke.pluginAddPath('./For_Input_Process_Only')
 
 
 
-nuke.pluginAddPath("/Volumes/san-04/GlossUsers/NukeShared")
+# SAN-shared plugins: use the local mirror when it's fresh (refreshed in the background),
+# so startup doesn't wait on the SAN. Falls back to the SAN path otherwise.
+SAN_SHARED_PLUGINS = "/Volumes/san-04/GlossUsers/NukeShared"
+try:
+    from gloss_plugin_mirror import mirrored_plugin_path
+    nuke.pluginAddPath(mirrored_plugin_path(SAN_SHARED_PLUGINS))
+except Exception:
+    nuke.pluginAddPath(SAN_SHARED_PLUGINS)
+_mark("init: plugin paths")
 
 
 # ----- SETTING KNOB DEFAULTS ---------------
@@ -166,6 +186,7 @@ nuke.knobDefault("operation.label", "operation: [value size]")
 nuke.knobDefault("Exposure.label", "[value mode]: [value red]")
 #Tracker node
 nuke.knobDefault("Tracker.label", "[value transform] <br> Ref Frame:[value reference_frame]")
+_mark("init: knob defaults")
 
 
 
@@ -2,12 +2,25 @@
 import os, sys, traceback
 import nuke
 
+# Startup profiler (started in init.py when GLOSS_STARTUP_PROFILE is set)
+try:
+    import gloss_startup_profile as startup_profile
+except Exception:
+    startup_profile = None
+
+def _mark(label):
+    if startup_profile:
+        startup_profile.mark(label)
+
+_mark("init.py -> menu.py")
+
 # ---------- Bootstrap external tools that might not be installed ----------
 try:
     import shortcuteditor
     shortcuteditor.nuke_setup()
 except Exception:
     traceback.print_exc()
+_mark("menu: shortcuteditor")
 
 # ---------- Custom Tools menu ----------
 my_menu = nuke.menu('Nuke').addMenu('Custom Tools')
@@ -35,6 +48,7 @@ try:
     nuke.menu('Nuke').addCommand('Extra/Wrap It Up', "WrapItUp.WrapItUp()")
 except Exception:
     nuke.tprint("[menu.py] WrapItUp not available; skipping.")
+_mark("menu: DJV + WrapItUp")
 
 # ---------- V!ctor Tools (safe imports) ----------
 def _safe_import(name):
@@ -59,6 +73,7 @@ if V_PostageStampGenerator:
 #     VictorMenu.addCommand('Generate Read node from Write node', 'V_GenerateReadFromWrite.generateReadFromWrite()', 'ctrl+r')
 if V_ConvertGizmosToGroups:
     VictorMenu.addCommand('Convert Gizmo to Group', 'V_ConvertGizmosToGroups.convertGizmosToGroups()', 'ctrl+shift+h')
+_mark("menu: V!ctor tools")
 
 # ---------- Gloss Post toolbar ----------
 try:
@@ -87,6 +102,7 @@ try:
     nm.addCommand("3DE4/LD_3DE_Classic_LD_Model",                 "nuke.createNode('LD_3DE_Classic_LD_Model')")
 except Exception:
     nuke.tprint("[menu.py] 3DE4 entries skipped.")
+_mark("menu: toolbars (Gloss Post, VideoCopilot, 3DE4)")
 
 # =====================================================================
 #      Gloss NYC pipeline loader (kept exactly, but guarded)
@@ -127,6 +143,7 @@ if os.path.isfile(INTERNAL_MENU_FILE):
         traceback.print_exc()
 else:
     nuke.tprint(f"[GLOSS NYC] ⚠️ Missing pipeline menu file: {INTERNAL_MENU_FILE}")
+_mark("menu: GLOSS NYC pipeline")
 
 
 
@@ -146,4 +163,11 @@ try:
     import monday_menu_basic  # builds the menu on import
 except Exception as e:
     nuke.tprint(f"[Monday] Basic menu not loaded: {e}")
+_mark("menu: Monday")
+
+if startup_profile:
+    try:
+        startup_profile.finish()
+    except Exception as e:
+        nuke.tprint(f"[GLOSS STARTUP] Profiler report failed: {e}")
 